@@ -0,0 +1,495 @@
+"""
+Offline parsing benchmarks for every league.
+
+Each scenario serves the pages saved under ``tests/integration`` through a
+local stand-in for ``requests.Session``, so runs are reproducible and never
+touch the network. For every scenario the wall-clock time to build the
+requested objects, the growth of the process' resident set size (RSS) while
+doing so, and the number of objects still alive while the result is held are
+reported. RSS includes the memory lxml allocates for parsed documents, which
+Python's own allocation tracing can't see. Every process-wide cache is
+cleared before each run so each run starts from the same state.
+
+Run from the root of the repository:
+
+    python -m benchmarks.parsing
+    python -m benchmarks.parsing --league nba --repeat 10
+    python -m benchmarks.parsing --filter Boxscore --json results.json
+
+Saving the JSON output before and after a change and comparing the two is the
+quickest way to show whether a parsing optimization helps.
+"""
+import argparse
+import ctypes
+import ctypes.util
+import gc
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict, namedtuple
+from datetime import datetime
+from unittest import mock
+
+from sportsreference import utils
+from sportsreference.ncaab import conferences as ncaab_conferences
+from sportsreference.ncaaf import conferences as ncaaf_conferences
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'tests', 'integration')
+
+Scenario = namedtuple('Scenario', ['league', 'name', 'routes', 'default',
+                                   'run'])
+
+
+class FixtureResponse:
+    """
+    A minimal stand-in for ``requests.Response`` holding a saved page.
+    """
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.content = text.encode('utf8')
+        self.status_code = status_code
+        self.reason = 'OK' if status_code == 200 else 'Not Found'
+        self.headers = {}
+
+
+class FixtureTransport:
+    """
+    Serve saved pages in place of network requests.
+
+    Parameters
+    ----------
+    routes : list
+        A list of ``(substring, fixture)`` tuples. The first substring found
+        in a requested URL selects the fixture to return. Fixture paths are
+        relative to ``tests/integration``.
+    default : string
+        The fixture returned when no route matches the URL.
+    """
+    _pages = {}
+
+    def __init__(self, routes, default):
+        self._routes = routes
+        self._default = default
+        self.requests = 0
+
+    def _read(self, fixture):
+        # Files are only read from disk once so the benchmarks measure
+        # parsing instead of disk I/O.
+        if fixture not in self._pages:
+            path = os.path.join(FIXTURES, fixture)
+            with open(path, 'r', encoding='utf8') as page:
+                self._pages[fixture] = page.read()
+        return self._pages[fixture]
+
+    def get(self, url, *args, **kwargs):
+        self.requests += 1
+        for substring, fixture in self._routes:
+            if substring in url:
+                return FixtureResponse(url, self._read(fixture))
+        return FixtureResponse(url, self._read(self._default))
+
+
+def _without_conferences(teams_module, build):
+    """
+    Build the college Teams without looking up each team's conference.
+
+    Only a couple of conference pages are saved, so the conference of every
+    team can't be determined offline. Conferences are benchmarked separately
+    and every team is given an unknown conference here instead.
+    """
+    def run():
+        conferences = mock.Mock()
+        conferences.return_value.team_conference = defaultdict(lambda: None)
+        with mock.patch.object(teams_module, 'Conferences', conferences):
+            return build()
+    return run
+
+
+def _scenarios():
+    from sportsreference.mlb import boxscore as mlb_boxscore
+    from sportsreference.mlb import roster as mlb_roster
+    from sportsreference.mlb import schedule as mlb_schedule
+    from sportsreference.mlb import teams as mlb_teams
+    from sportsreference.nba import boxscore as nba_boxscore
+    from sportsreference.nba import roster as nba_roster
+    from sportsreference.nba import schedule as nba_schedule
+    from sportsreference.nba import teams as nba_teams
+    from sportsreference.ncaab import boxscore as ncaab_boxscore
+    from sportsreference.ncaab import roster as ncaab_roster
+    from sportsreference.ncaab import schedule as ncaab_schedule
+    from sportsreference.ncaab import teams as ncaab_teams
+    from sportsreference.ncaaf import boxscore as ncaaf_boxscore
+    from sportsreference.ncaaf import roster as ncaaf_roster
+    from sportsreference.ncaaf import schedule as ncaaf_schedule
+    from sportsreference.ncaaf import teams as ncaaf_teams
+    from sportsreference.nfl import boxscore as nfl_boxscore
+    from sportsreference.nfl import roster as nfl_roster
+    from sportsreference.nfl import schedule as nfl_schedule
+    from sportsreference.nfl import teams as nfl_teams
+    from sportsreference.nhl import boxscore as nhl_boxscore
+    from sportsreference.nhl import roster as nhl_roster
+    from sportsreference.nhl import schedule as nhl_schedule
+    from sportsreference.nhl import teams as nhl_teams
+
+    return [
+        # MLB
+        Scenario('mlb', 'Teams', [('standings', 'teams/mlb_stats/'
+                                                '2017-standings.html')],
+                 'teams/mlb_stats/2017.html',
+                 lambda: mlb_teams.Teams('2017')),
+        Scenario('mlb', 'Schedule', [],
+                 'schedule/mlb/2017-schedule-scores.html',
+                 lambda: mlb_schedule.Schedule('HOU', '2017')),
+        Scenario('mlb', 'Boxscore', [], 'boxscore/mlb/BOS201806070.shtml',
+                 lambda: mlb_boxscore.Boxscore('BOS/BOS201806070')),
+        Scenario('mlb', 'Boxscores',
+                 [('day=17', 'boxscore/mlb/boxscore-7-17-2017.html'),
+                  ('day=18', 'boxscore/mlb/boxscore-7-18-2017.html')],
+                 'boxscore/mlb/boxscore-7-17-2017.html',
+                 lambda: mlb_boxscore.Boxscores(datetime(2017, 7, 17),
+                                                datetime(2017, 7, 18))),
+        Scenario('mlb', 'Roster',
+                 [('HOU', 'roster/mlb/2017.shtml'),
+                  ('verlaju01', 'roster/mlb/verlaju01.shtml')],
+                 'roster/mlb/altuvjo01.shtml',
+                 lambda: mlb_roster.Roster('HOU', '2017')),
+        Scenario('mlb', 'Player', [], 'roster/mlb/altuvjo01.shtml',
+                 lambda: mlb_roster.Player('altuvjo01')),
+        # NBA
+        Scenario('nba', 'Teams', [], 'teams/nba_stats/NBA_2017.html',
+                 lambda: nba_teams.Teams('2017')),
+        Scenario('nba', 'Schedule', [], 'schedule/nba/2017_games.html',
+                 lambda: nba_schedule.Schedule('PHO', '2017')),
+        Scenario('nba', 'Boxscore', [], 'boxscore/nba/201710310LAL.html',
+                 lambda: nba_boxscore.Boxscore('201710310LAL')),
+        Scenario('nba', 'Boxscores',
+                 [('day=4', 'boxscore/nba/boxscores-2-4-2017.html'),
+                  ('day=5', 'boxscore/nba/boxscores-2-5-2017.html')],
+                 'boxscore/nba/boxscores-2-4-2017.html',
+                 lambda: nba_boxscore.Boxscores(datetime(2017, 2, 4),
+                                                datetime(2017, 2, 5))),
+        Scenario('nba', 'Roster',
+                 [('HOU', 'roster/nba/2018.html'),
+                  ('anderry01', 'roster/nba/anderry01.html'),
+                  ('arizatr01', 'roster/nba/arizatr01.html'),
+                  ('blackta01', 'roster/nba/blackta01.html'),
+                  ('youngtr01', 'roster/nba/youngtr01.html')],
+                 'roster/nba/hardeja01.html',
+                 lambda: nba_roster.Roster('HOU', '2018')),
+        Scenario('nba', 'Player', [], 'roster/nba/hardeja01.html',
+                 lambda: nba_roster.Player('hardeja01')),
+        # NCAAB
+        Scenario('ncaab', 'Teams',
+                 [('advanced-opponent-stats', 'teams/ncaab_stats/'
+                   '2018-advanced-opponent-stats.html'),
+                  ('advanced-school-stats', 'teams/ncaab_stats/'
+                   '2018-advanced-school-stats.html'),
+                  ('opponent-stats', 'teams/ncaab_stats/'
+                   '2018-opponent-stats.html')],
+                 'teams/ncaab_stats/2018-school-stats.html',
+                 _without_conferences(ncaab_teams,
+                                      lambda: ncaab_teams.Teams('2018'))),
+        Scenario('ncaab', 'Conferences',
+                 [('conferences/', 'conferences/ncaab/2018-big-12.html')],
+                 'conferences/ncaab/2018.html',
+                 lambda: ncaab_conferences.Conferences('2018')),
+        Scenario('ncaab', 'Schedule', [],
+                 'schedule/ncaab/2018-schedule.html',
+                 lambda: ncaab_schedule.Schedule('PURDUE', '2018')),
+        Scenario('ncaab', 'Boxscore', [],
+                 'boxscore/ncaab/2017-11-24-21-purdue.html',
+                 lambda: ncaab_boxscore.Boxscore('2017-11-24-21-purdue')),
+        Scenario('ncaab', 'Boxscores',
+                 [('day=11', 'boxscore/ncaab/boxscores-11-11-2017.html'),
+                  ('day=12', 'boxscore/ncaab/boxscores-11-12-2017.html')],
+                 'boxscore/ncaab/boxscores-11-11-2017.html',
+                 lambda: ncaab_boxscore.Boxscores(datetime(2017, 11, 11),
+                                                  datetime(2017, 11, 12))),
+        Scenario('ncaab', 'Roster',
+                 [('schools/purdue', 'roster/ncaab/2018.html'),
+                  ('isaac-haas-1', 'roster/ncaab/isaac-haas-1.html'),
+                  ('vince-edwards-2', 'roster/ncaab/vince-edwards-2.html')],
+                 'roster/ncaab/carsen-edwards-1.html',
+                 lambda: ncaab_roster.Roster('PURDUE', '2018')),
+        Scenario('ncaab', 'Player', [], 'roster/ncaab/carsen-edwards-1.html',
+                 lambda: ncaab_roster.Player('carsen-edwards-1')),
+        # NCAAF
+        Scenario('ncaaf', 'Teams',
+                 [('team-offense', 'teams/ncaaf_stats/'
+                                   '2017-team-offense.html')],
+                 'teams/ncaaf_stats/2017-standings.html',
+                 _without_conferences(ncaaf_teams,
+                                      lambda: ncaaf_teams.Teams('2017'))),
+        Scenario('ncaaf', 'Conferences',
+                 [('conferences/', 'conferences/ncaaf/2018-acc.html')],
+                 'conferences/ncaaf/2018.html',
+                 lambda: ncaaf_conferences.Conferences('2018')),
+        Scenario('ncaaf', 'Schedule', [],
+                 'schedule/ncaaf/2017-schedule.html',
+                 lambda: ncaaf_schedule.Schedule('PURDUE', '2017')),
+        Scenario('ncaaf', 'Boxscore', [],
+                 'boxscore/ncaaf/2018-01-08-georgia.html',
+                 lambda: ncaaf_boxscore.Boxscore('2018-01-08-georgia')),
+        Scenario('ncaaf', 'Boxscores',
+                 [('day=30', 'boxscore/ncaaf/boxscores-8-30-2017.html'),
+                  ('day=31', 'boxscore/ncaaf/boxscores-8-31-2017.html')],
+                 'boxscore/ncaaf/boxscores-8-30-2017.html',
+                 lambda: ncaaf_boxscore.Boxscores(datetime(2017, 8, 30),
+                                                  datetime(2017, 8, 31))),
+        Scenario('ncaaf', 'Roster',
+                 [('2018-roster', 'roster/ncaaf/2018-roster.html'),
+                  ('brycen-hopkins', 'roster/ncaaf/brycen-hopkins-1.html')],
+                 'roster/ncaaf/david-blough-1.html',
+                 lambda: ncaaf_roster.Roster('PURDUE', '2018')),
+        Scenario('ncaaf', 'Player', [], 'roster/ncaaf/david-blough-1.html',
+                 lambda: ncaaf_roster.Player('david-blough-1')),
+        # NFL
+        Scenario('nfl', 'Teams', [], 'teams/nfl_stats/2017.html',
+                 lambda: nfl_teams.Teams('2017')),
+        Scenario('nfl', 'Schedule', [], 'schedule/nfl/gamelog',
+                 lambda: nfl_schedule.Schedule('KAN', '2017')),
+        Scenario('nfl', 'Boxscore', [], 'boxscore/nfl/201802040nwe.html',
+                 lambda: nfl_boxscore.Boxscore('201802040nwe')),
+        Scenario('nfl', 'Boxscores',
+                 [('week_7', 'boxscore/nfl/boxscores-7-2017.html'),
+                  ('week_8', 'boxscore/nfl/boxscores-8-2017.html')],
+                 'boxscore/nfl/boxscores-7-2017.html',
+                 lambda: nfl_boxscore.Boxscores(7, 2017, 8)),
+        Scenario('nfl', 'Roster',
+                 [('2018_roster', 'roster/nfl/2018_roster.htm'),
+                  ('Davi', 'roster/nfl/DaviDe00.htm'),
+                  ('Lewi', 'roster/nfl/LewiTo00.htm'),
+                  ('Lutz', 'roster/nfl/LutzWi00.htm'),
+                  ('Mors', 'roster/nfl/MorsTh00.htm'),
+                  ('Hatf', 'roster/nfl/HatfDo00.htm')],
+                 'roster/nfl/BreeDr00.htm',
+                 lambda: nfl_roster.Roster('NOR', '2018')),
+        Scenario('nfl', 'Player', [], 'roster/nfl/BreeDr00.htm',
+                 lambda: nfl_roster.Player('BreeDr00')),
+        # NHL
+        Scenario('nhl', 'Teams', [], 'teams/nhl_stats/NHL_2017.html',
+                 lambda: nhl_teams.Teams('2017')),
+        Scenario('nhl', 'Schedule', [], 'schedule/nhl/2017_gamelog.html',
+                 lambda: nhl_schedule.Schedule('NYR', '2017')),
+        Scenario('nhl', 'Boxscore', [], 'boxscore/nhl/201806070VEG.html',
+                 lambda: nhl_boxscore.Boxscore('201806070VEG')),
+        Scenario('nhl', 'Boxscores',
+                 [('day=4', 'boxscore/nhl/boxscores-2-4-2017.html'),
+                  ('day=5', 'boxscore/nhl/boxscores-2-5-2017.html')],
+                 'boxscore/nhl/boxscores-2-4-2017.html',
+                 lambda: nhl_boxscore.Boxscores(datetime(2017, 2, 4),
+                                                datetime(2017, 2, 5))),
+        Scenario('nhl', 'Roster',
+                 [('DET/2018', 'roster/nhl/2018.html'),
+                  ('zettehe01', 'roster/nhl/zettehe01.html')],
+                 'roster/nhl/howarja02.html',
+                 lambda: nhl_roster.Roster('DET', '2018')),
+        Scenario('nhl', 'Player', [], 'roster/nhl/howarja02.html',
+                 lambda: nhl_roster.Player('howarja02')),
+    ]
+
+
+def _serve(transport):
+    return mock.patch('requests.Session.get', side_effect=transport.get)
+
+
+def _reset_state():
+    """
+    Clear every process-wide cache, mirroring ``tests/conftest.py``.
+
+    Without this, later runs would be served pages, default seasons,
+    conferences, and boxscores left behind by earlier runs and scenarios.
+    """
+    utils._default_seasons.clear()
+    utils._revalidation_cache.clear()
+    utils._rate_limiters.clear()
+    utils._boxscore_registry.clear()
+    utils._boxscore_cache.clear()
+    ncaab_conferences._season_conferences.clear()
+    ncaaf_conferences._season_conferences.clear()
+
+
+def _release_memory():
+    """
+    Return freed memory to the operating system where possible.
+
+    glibc keeps freed memory around for reuse, which would hide the growth of
+    later runs, so it is asked to release it before every measurement.
+    """
+    gc.collect()
+    libc_name = ctypes.util.find_library('c')
+    if not libc_name:
+        return
+    libc = ctypes.CDLL(libc_name)
+    if hasattr(libc, 'malloc_trim'):
+        libc.malloc_trim(0)
+
+
+def _current_rss():
+    """
+    Return the resident set size of the process in bytes.
+    """
+    if psutil:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource:
+        # Only the peak is available, which is reported in kilobytes on
+        # Linux and in bytes on macOS.
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == 'darwin' else usage * 1024
+    return 0
+
+
+class RSSSampler:
+    """
+    Track the highest resident set size of the process in the background.
+
+    Parameters
+    ----------
+    interval : float
+        The number of seconds between each sample.
+    """
+    def __init__(self, interval=0.001):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self.peak = 0
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _current_rss())
+            self._stop.wait(self._interval)
+
+    def __enter__(self):
+        self.peak = _current_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss())
+
+
+def run_scenario(scenario, repeat):
+    """
+    Benchmark a single scenario.
+
+    The scenario is run once to warm up imports and the fixture cache, then
+    timed ``repeat`` times. A final run is sampled in the background to find
+    the peak growth of the resident set size, as sampling slows the
+    interpreter too much to be included in the timings. Every process-wide
+    cache is cleared before each run.
+
+    Parameters
+    ----------
+    scenario : Scenario
+        The scenario to run.
+    repeat : int
+        The number of timed runs.
+
+    Returns
+    -------
+    dict
+        A dictionary of the measurements for the scenario.
+    """
+    transport = FixtureTransport(scenario.routes, scenario.default)
+    with _serve(transport):
+        _reset_state()
+        scenario.run()
+        requests = transport.requests
+        timings = []
+        for _ in range(repeat):
+            _reset_state()
+            gc.collect()
+            start = time.perf_counter()
+            scenario.run()
+            timings.append(time.perf_counter() - start)
+        _reset_state()
+        _release_memory()
+        baseline = len(gc.get_objects())
+        baseline_rss = _current_rss()
+        with RSSSampler() as sampler:
+            result = scenario.run()
+        gc.collect()
+        retained_rss = _current_rss() - baseline_rss
+        objects = len(gc.get_objects()) - baseline
+        del result
+        _reset_state()
+    return {
+        'league': scenario.league,
+        'name': scenario.name,
+        'requests': requests,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'peak_rss': max(0, sampler.peak - baseline_rss),
+        'retained_rss': max(0, retained_rss),
+        'objects': objects
+    }
+
+
+def _print_results(results):
+    header = '%-6s %-11s %8s %10s %10s %14s %14s %10s' % (
+        'league', 'scenario', 'requests', 'min (ms)', 'med (ms)',
+        'peak RSS (KiB)', 'held RSS (KiB)', 'objects')
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        print('%-6s %-11s %8d %10.1f %10.1f %14.0f %14.0f %10d' % (
+            result['league'], result['name'], result['requests'],
+            result['min'] * 1000, result['median'] * 1000,
+            result['peak_rss'] / 1024, result['retained_rss'] / 1024,
+            result['objects']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark parsing of the '
+                                     'saved integration test pages.')
+    parser.add_argument('--league', action='append',
+                        help='Only run scenarios for the given league. Can '
+                        'be passed multiple times.')
+    parser.add_argument('--filter', help='Only run scenarios whose name '
+                        'contains the given string, such as "Boxscore".')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timed runs per scenario.')
+    parser.add_argument('--json', help='Also write the results to the given '
+                        'file as JSON.')
+    args = parser.parse_args(argv)
+
+    utils.disable_cache()
+    results = []
+    for scenario in _scenarios():
+        if args.league and scenario.league not in args.league:
+            continue
+        if args.filter and args.filter not in scenario.name:
+            continue
+        results.append(run_scenario(scenario, args.repeat))
+    _print_results(results)
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump(results, output, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
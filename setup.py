@@ -19,6 +19,7 @@ setup(
     python_requires='>=3.5',
     keywords='stats sports api sportsreference machine learning',
     install_requires=[
+        "numpy >= 1.16.4",
         "pandas >= 0.24.1",
         "pyquery >= 1.4.0",
         "requests >= 2.18.4"
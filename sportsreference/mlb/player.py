@@ -1,8 +1,6 @@
 import pandas as pd
 import re
-from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from .constants import (BOXSCORE_SCHEME,
@@ -26,11 +24,7 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         element_ind = 0
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
@@ -40,15 +34,11 @@ def _int_property_decorator(func):
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, int, decode)
 
 
 def _float_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         element_ind = 0
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
@@ -58,7 +48,7 @@ def _float_property_decorator(func):
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, float, decode)
 
 
 class AbstractPlayer:
@@ -86,6 +76,8 @@ class AbstractPlayer:
         'NN' is a number starting at '01' for the first time that player ID has
         been used and increments by 1 for every successive player.
     """
+    __slots__ = ()
+
     def __init__(self, player_id, player_name, player_data):
         self._player_id = player_id
         self._name = player_name
@@ -122,9 +114,9 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _StatIndex
+            An index of all stats in HTML format for a particular player in a
+            single season or game.
         field : string
             A string of the field to parse from the HTML.
 
@@ -134,8 +126,7 @@ class AbstractPlayer:
             A list of all values that match the requested field. If no value
             could be found, returns None.
         """
-        scheme = PLAYER_SCHEME[field]
-        items = [i.text() for i in stats(scheme).items()]
+        items = stats.texts(PLAYER_SCHEME[field])
         # Stats can be added and removed on a yearly basis. If no stats are
         # found, return None and have that be the value.
         if len(items) == 0:
@@ -151,15 +142,20 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or PyQuery object
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains the HTML rows as a PyQuery object.
+            If this class is inherited from the ``BoxscorePlayer`` class,
+            player_data will be a PyQuery object of the player's game
+            statistics.
+        """
+        if isinstance(player_data, dict):
+            seasons = [utils._StatIndex(data['data'])
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._StatIndex(player_data)]
+        for field in utils._field_names(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -173,13 +169,7 @@ class AbstractPlayer:
                short_field == 'contract':
                 continue
             field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
+            for stats in seasons:
                 value = self._parse_value(stats, short_field)
                 field_stats.append(value)
             setattr(self, field, field_stats)
@@ -6,7 +6,6 @@ from .constants import (DAY,
                         SCHEDULE_SCHEME,
                         SCHEDULE_URL)
 from datetime import datetime
-from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import (WIN,
                                        LOSS,
@@ -32,6 +31,12 @@ class Game:
     year : string
         The year of the current season.
     """
+    __slots__ = ('_game', '_date', '_datetime', '_boxscore', '_location',
+                 '_opponent_abbr', '_result', '_runs_scored', '_runs_allowed',
+                 '_innings', '_record', '_rank', '_games_behind', '_winner',
+                 '_loser', '_save', '_game_duration', '_day_or_night',
+                 '_attendance', '_streak', '_year')
+
     def __init__(self, game_data, year):
         self._game = None
         self._date = None
@@ -92,7 +97,8 @@ class Game:
         game_data : string
             A string containing all of the rows of stats for a given game.
         """
-        for field in self.__dict__:
+        stats = utils._StatIndex(game_data)
+        for field in self.__slots__:
             # Remove the leading '_' from the name
             short_name = str(field)[1:]
             if short_name == 'datetime' or \
@@ -101,14 +107,14 @@ class Game:
             elif short_name == 'boxscore':
                 self._parse_boxscore(game_data)
                 continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
+            value = utils._parse_field(SCHEDULE_SCHEME, stats, short_name)
             setattr(self, field, value)
 
     @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Returns a ``dictionary`` of the values included in the DataFrame, keyed
+        by the column name. Returns None if the game hasn't been played yet.
         """
         # If both the runs scored and allowed are None, the game hasn't been
         # played yet, and the DataFrame should be None.
@@ -137,6 +143,17 @@ class Game:
             'streak': self.streak,
             'winner': self.winner
         }
+        return fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        fields_to_include = self._dataframe_fields
+        if fields_to_include is None:
+            return None
         return pd.DataFrame([fields_to_include], index=[self._boxscore])
 
     @property
@@ -197,9 +214,11 @@ class Game:
     def boxscore(self):
         """
         Returns an instance of the Boxscore class containing more detailed
-        stats on the game.
+        stats on the game. Once a game is complete, the instance is shared
+        with every other schedule the game appears in, so the game isn't
+        downloaded and parsed again.
         """
-        return Boxscore(self._boxscore)
+        return utils._get_boxscore(Boxscore, self._boxscore)
 
     @property
     def boxscore_index(self):
@@ -459,18 +478,17 @@ class Schedule:
         year : string
             The requested year to pull stats from.
         """
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('mlb')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(SCHEDULE_URL % (abbreviation,
-                                                     year)) and \
-               utils._url_exists(SCHEDULE_URL % (abbreviation,
-                                                 str(int(year) - 1))):
-                year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation, year))
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'mlb', lambda year: SCHEDULE_URL % (abbreviation, year))
+        historical = utils._is_past_season('mlb', year)
+        with utils._preloaded_pages(pages):
+            doc = utils._pull_page(SCHEDULE_URL % (abbreviation, year),
+                                   historical)
         schedule = utils._get_stats_table(doc, 'table#team_schedule')
 
         for item in schedule:
@@ -485,17 +503,19 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
+        fields = []
+        index = []
         for game in self.__iter__():
             # If both the runs scored and allowed are None, the game hasn't
             # been played yet, and the data should not be included in the
             # DataFrame.
             if game._runs_scored is None and game._runs_allowed is None:
                 continue
-            frames.append(game.dataframe)
-        if frames == []:
+            fields.append(game._dataframe_fields)
+            index.append(game._boxscore)
+        if fields == []:
             return None
-        return pd.concat(frames)
+        return pd.DataFrame(fields, index=index)
 
     @property
     def dataframe_extended(self):
@@ -504,13 +524,53 @@ class Schedule:
         Boxscore class for every game in the schedule. Rows are indexed by the
         boxscore string. This property provides much richer context for the
         selected game, but takes longer to process compared to the lighter
-        'dataframe' property.
-        """
+        'dataframe' property. Every boxscore is downloaded concurrently, and
+        games which were already parsed, such as through the opposing team's
+        schedule, are reused.
+        """
+        # Games which haven't been played yet don't have a boxscore.
+        uris = [game._boxscore for game in self.__iter__()
+                if game._runs_scored is not None or
+                game._runs_allowed is not None]
         frames = []
-        for game in self.__iter__():
-            df = game.dataframe_extended
+        for boxscore in Boxscore.fetch_many(uris):
+            df = boxscore.dataframe
             if df is not None:
                 frames.append(df)
         if frames == []:
             return None
         return pd.concat(frames)
+
+    def new_boxscores(self, ingested,
+                      concurrency=utils.MAX_CONCURRENT_REQUESTS,
+                      processes=None):
+        """
+        Create Boxscore instances for games which haven't been ingested yet.
+
+        Compares the schedule against the 'boxscore_index' values which were
+        already stored and only downloads and parses the games which were
+        completed since, rather than every game in the schedule like
+        'dataframe_extended'. Games which haven't been played yet are skipped
+        until they are completed.
+
+        Parameters
+        ----------
+        ingested : set
+            A container of the 'boxscore_index' values of every game which
+            was already stored, such as a ``set`` or a ``dict``.
+        concurrency : int (optional)
+            The maximum number of boxscore pages to download at once.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            downloaded boxscores with.
+
+        Returns
+        -------
+        dict
+            Returns a ``dictionary`` of Boxscore instances for every new game,
+            keyed by the 'boxscore_index' and ordered by the schedule.
+        """
+        uris = utils._new_boxscore_uris([self], ingested)
+        boxscores = Boxscore.fetch_many(uris, concurrency,
+                                        processes=processes)
+        return dict(zip(uris, boxscores))
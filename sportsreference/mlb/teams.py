@@ -2,13 +2,14 @@ import pandas as pd
 import re
 from .constants import (ELEMENT_INDEX,
                         PARSING_SCHEME,
+                        SCHEDULE_URL,
                         STANDINGS_URL,
                         TEAM_ELEMENT,
                         TEAM_STATS_URL)
 from functools import wraps
-from pyquery import PyQuery as pq
 from .. import utils
 from ..decorators import float_property_decorator, int_property_decorator
+from .boxscore import Boxscore
 from .roster import Roster
 from .schedule import Schedule
 
@@ -50,8 +51,11 @@ class Team:
         obtained during the season.
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each stat the first time it is requested
+        instead of parsing every stat up front.
     """
-    def __init__(self, team_data, rank, year=None):
+    def __init__(self, team_data, rank, year=None, lazy=False):
         self._year = year
         self._rank = rank
         self._abbreviation = None
@@ -135,7 +139,24 @@ class Team:
         self._strikeouts_per_base_on_balls = None
         self._opposing_runners_left_on_base = None
 
-        self._parse_team_data(team_data)
+        self._parse_team_data(team_data, lazy)
+
+    def __getattr__(self, name):
+        # Only called for attributes which haven't been set. In lazy mode,
+        # every field starts out unset and is parsed from the stored stats the
+        # first time it is requested.
+        return utils._parse_deferred_field(self, name, self._parse_deferred)
+
+    def _parse_deferred(self, name):
+        """
+        Parse a single field which was left unset in lazy mode.
+
+        Parameters
+        ----------
+        name : string
+            The name of the attribute to parse, such as '_wins'.
+        """
+        self._parse_fields(self._deferred_data, [name])
 
     def _parse_name(self, team_data):
         """
@@ -160,7 +181,7 @@ class Team:
         name = re.sub(r'".*', '', name)
         setattr(self, '_name', name)
 
-    def _parse_team_data(self, team_data):
+    def _parse_team_data(self, team_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -178,8 +199,33 @@ class Team:
             A string containing all of the rows of stats for a given team. If
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
+        lazy : boolean (optional)
+            Set to True to store the stats and parse each field the first time
+            it is requested instead of parsing every field immediately.
+        """
+        stats = utils._StatIndex(team_data)
+        if lazy:
+            fields = [field for field, value in self.__dict__.items()
+                      if value is None]
+            for field in fields:
+                delattr(self, field)
+            self._deferred_fields = set(fields)
+            self._deferred_data = stats
+            return
+        self._parse_fields(stats, list(self.__dict__))
+
+    def _parse_fields(self, stats, fields):
         """
-        for field in self.__dict__:
+        Parse the requested fields from the team's stats.
+
+        Parameters
+        ----------
+        stats : _StatIndex
+            An index of all of the rows of stats for the team.
+        fields : list
+            A list of the attribute names to parse, such as '_points'.
+        """
+        for field in fields:
             # The short field truncates the leading '_' in the attribute name.
             short_field = str(field)[1:]
             # The rank attribute is passed directly to the class during
@@ -188,7 +234,7 @@ class Team:
                field == '_year':
                 continue
             elif field == '_name':
-                self._parse_name(team_data)
+                self._parse_name(stats)
                 continue
             # Default to returning the first element returned unless a
             # subsequent element is desired. For example, total runs and
@@ -198,17 +244,16 @@ class Team:
             if short_field in ELEMENT_INDEX.keys():
                 index = ELEMENT_INDEX[short_field]
             value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
+                                       stats,
                                        short_field,
                                        index)
             setattr(self, field, value)
 
     @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'HOU'.
+        Returns a ``dictionary`` of the values included in the DataFrame, keyed
+        by the column name.
         """
         fields_to_include = {
             'abbreviation': self.abbreviation,
@@ -325,7 +370,17 @@ class Team:
             'wins_vs_teams_over_500': self.wins_vs_teams_over_500,
             'wins_vs_teams_under_500': self.wins_vs_teams_under_500
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'HOU'.
+        """
+        return pd.DataFrame([self._dataframe_fields],
+                            index=[self._abbreviation])
 
     @int_property_decorator
     def rank(self):
@@ -1154,11 +1209,14 @@ class Teams:
     ----------
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each team's stats the first time they are
+        requested.
     """
-    def __init__(self, year=None):
+    def __init__(self, year=None, lazy=False):
         self._teams = []
 
-        self._retrieve_all_teams(year)
+        self._retrieve_all_teams(year, lazy)
 
     def __getitem__(self, abbreviation):
         """
@@ -1247,7 +1305,7 @@ class Teams:
         rank = 1
         for team_data in teams_list:
             # Skip the league average row
-            if 'class="league_average_table"' in str(team_data):
+            if team_data.attr('class') == 'league_average_table':
                 continue
             abbr = utils._parse_field(PARSING_SCHEME,
                                       team_data,
@@ -1259,7 +1317,7 @@ class Teams:
             rank += 1
         return team_data_dict
 
-    def _retrieve_all_teams(self, year):
+    def _retrieve_all_teams(self, year, lazy=False):
         """
         Find and create Team instances for all teams in the given season.
 
@@ -1276,22 +1334,25 @@ class Teams:
         ----------
         year : string
             The requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each team's stats the first time they
+            are requested.
         """
         team_data_dict = {}
 
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('mlb')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(STANDINGS_URL % year) and \
-               utils._url_exists(STANDINGS_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
-        doc = pq(STANDINGS_URL % year)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'mlb', lambda year: STANDINGS_URL % year)
+        historical = utils._is_past_season('mlb', year)
+        with utils._preloaded_pages(pages):
+            standings_doc, doc = utils._pull_pages(
+                [STANDINGS_URL % year, TEAM_STATS_URL % year], historical)
         div_prefix = 'div#all_expanded_standings_overall'
-        standings = utils._get_stats_table(doc, div_prefix)
-        doc = pq(TEAM_STATS_URL % year)
+        standings = utils._get_stats_table(standings_doc, div_prefix)
         div_prefix = 'div#all_teams_standard_%s'
         batting_stats = utils._get_stats_table(doc, div_prefix % 'batting')
         pitching_stats = utils._get_stats_table(doc, div_prefix % 'pitching')
@@ -1299,7 +1360,7 @@ class Teams:
             team_data_dict = self._add_stats_data(stats_list, team_data_dict)
 
         for team_data in team_data_dict.values():
-            team = Team(team_data['data'], team_data['rank'], year)
+            team = Team(team_data['data'], team_data['rank'], year, lazy)
             self._teams.append(team)
 
     @property
@@ -1308,7 +1369,54 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
+        fields = []
+        index = []
         for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+            fields.append(team._dataframe_fields)
+            index.append(team._abbreviation)
+        return pd.DataFrame(fields, index=index)
+
+    def new_boxscores(self, ingested,
+                      concurrency=utils.MAX_CONCURRENT_REQUESTS,
+                      processes=None):
+        """
+        Create Boxscore instances for games which haven't been ingested yet.
+
+        Keeping a table of every game in the season current by pulling every
+        team's 'dataframe_extended' downloads every completed game again.
+        Instead, only each team's schedule is downloaded and compared against
+        the 'boxscore_index' values which were already stored, so only games
+        which were added or completed since are downloaded and parsed. Each
+        game is only downloaded once, even though it appears in the
+        schedules of both teams.
+
+        Parameters
+        ----------
+        ingested : set
+            A container of the 'boxscore_index' values of every game which
+            was already stored, such as a ``set`` or a ``dict``.
+        concurrency : int (optional)
+            The maximum number of pages to download at once.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            downloaded boxscores with.
+
+        Returns
+        -------
+        dict
+            Returns a ``dictionary`` of Boxscore instances for every new game,
+            keyed by the 'boxscore_index'.
+        """
+        if not self._teams:
+            return {}
+        year = self._teams[0]._year
+        urls = [SCHEDULE_URL % (team._abbreviation, year)
+                for team in self._teams]
+        pages = utils._fetch_pages(urls, concurrency,
+                                   utils._is_past_season('mlb', year))
+        with utils._preloaded_pages(pages):
+            schedules = [team.schedule for team in self._teams]
+        uris = utils._new_boxscore_uris(schedules, ingested)
+        boxscores = Boxscore.fetch_many(uris, concurrency,
+                                        processes=processes)
+        return dict(zip(uris, boxscores))
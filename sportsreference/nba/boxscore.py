@@ -1,7 +1,6 @@
 import pandas as pd
 import re
 from datetime import timedelta
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from ..constants import AWAY, HOME
@@ -44,11 +43,30 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'James
         Harden'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : PyQuery object
+        A PyQuery object of the player's HTML rows from the Boxscore page. If
+        the player appears in multiple tables, all of their rows will be
+        combined in one single object.
     """
+    __slots__ = ('_index', '_player_id', '_defensive_rating',
+                 '_offensive_rating', '_name', '_minutes_played',
+                 '_field_goals', '_field_goal_attempts',
+                 '_field_goal_percentage', '_three_pointers',
+                 '_three_point_attempts', '_three_point_percentage',
+                 '_two_pointers', '_two_point_attempts',
+                 '_two_point_percentage', '_effective_field_goal_percentage',
+                 '_free_throws', '_free_throw_attempts',
+                 '_free_throw_percentage', '_offensive_rebounds',
+                 '_defensive_rebounds', '_total_rebounds', '_assists',
+                 '_steals', '_blocks', '_turnovers', '_personal_fouls',
+                 '_points', '_true_shooting_percentage',
+                 '_three_point_attempt_rate', '_free_throw_attempt_rate',
+                 '_offensive_rebound_percentage',
+                 '_defensive_rebound_percentage', '_total_rebound_percentage',
+                 '_assist_percentage', '_steal_percentage',
+                 '_block_percentage', '_turnover_percentage',
+                 '_usage_percentage', '_box_plus_minus')
+
     def __init__(self, player_id, player_name, player_data):
         self._index = 0
         self._player_id = player_id
@@ -194,8 +212,14 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         '201710310LAL'.
+    lazy : boolean (optional)
+        Set to True to defer parsing until a field is first requested. Each
+        field is then parsed from the downloaded page on its first access and
+        stored, and the players are only parsed once ``home_players`` or
+        ``away_players`` is read. Useful when only a few fields are needed
+        from a large number of games.
     """
-    def __init__(self, uri):
+    def __init__(self, uri, lazy=False):
         self._uri = uri
         self._date = None
         self._location = None
@@ -274,7 +298,94 @@ class Boxscore:
         self._home_offensive_rating = None
         self._home_defensive_rating = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, lazy)
+
+    @classmethod
+    def fetch_many(cls, uris, concurrency=utils.MAX_CONCURRENT_REQUESTS,
+                   lazy=False, processes=None):
+        """
+        Create Boxscore instances for several games at once.
+
+        Rather than downloading each boxscore page one after another, all of
+        the requested pages are downloaded concurrently before each page is
+        parsed into a Boxscore instance. Completed games which were already
+        parsed in this process, such as through the opposing team's
+        schedule, are reused instead of being downloaded again, both while
+        they are still held elsewhere and for up to
+        ``utils.BOXSCORE_CACHE_SIZE`` of the most recently used games.
+
+        Parameters
+        ----------
+        uris : list
+            A list of the relative links to the boxscore HTML pages, such as
+            ['201710310LAL'].
+        concurrency : int (optional)
+            The maximum number of pages to download at once.
+        lazy : boolean (optional)
+            Set to True to only parse each field of a Boxscore once it is
+            first requested. Can't be combined with 'processes'.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            downloaded pages with. Parsing is CPU-bound, so spreading it
+            across processes speeds up building a large number of boxscores,
+            such as every game in a season which is already cached. If left
+            empty, every page is parsed in the current process.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of Boxscore instances in the same order as the
+            requested URIs.
+
+        Raises
+        ------
+        ValueError
+            If both 'lazy' and 'processes' are set. A lazy Boxscore still
+            holds the whole page, which would have to be sent back from the
+            worker process and parsed again.
+        """
+        if lazy and processes:
+            raise ValueError('Lazy boxscores cannot be parsed in processes.')
+        boxscores = utils._registered_boxscores(cls, uris)
+        missing = [uri for uri in dict.fromkeys(uris)
+                   if uri not in boxscores]
+        urls = [BOXSCORE_URL % uri for uri in missing]
+        # Only the pages of completed games can be cached indefinitely.
+        historical = [utils._is_completed_game(uri) for uri in missing]
+        pages = utils._fetch_pages(urls, concurrency, historical)
+        if processes:
+            items = [((uri, lazy), {url: pages[url]})
+                     for uri, url in zip(missing, urls)]
+            built = utils._build_in_processes(cls, items, processes)
+        else:
+            with utils._preloaded_pages(pages):
+                built = [cls(uri, lazy) for uri in missing]
+        built = dict(zip(missing, built))
+        utils._register_boxscores(cls, built)
+        boxscores.update(built)
+        return [boxscores[uri] for uri in uris]
+
+    def __getattr__(self, name):
+        # Only called for attributes which haven't been set. In lazy mode,
+        # every field starts out unset and is parsed from the stored page the
+        # first time it is requested.
+        return utils._parse_deferred_field(self, name, self._parse_deferred)
+
+    def _parse_deferred(self, name):
+        """
+        Parse a single field which was left unset in lazy mode.
+
+        Parameters
+        ----------
+        name : string
+            The name of the attribute to parse, such as '_home_points'.
+        """
+        boxscore, stats = self._deferred_data
+        if name == '_away_players' or name == '_home_players':
+            self._away_players, self._home_players = \
+                self._find_players(boxscore)
+        else:
+            self._parse_fields(boxscore, stats, [name])
 
     def _retrieve_html_page(self, uri):
         """
@@ -298,10 +409,12 @@ class Boxscore:
         """
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url,
+                                        utils._is_completed_game(uri),
+                                        uncomment=True)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return url_data
 
     def _parse_game_date_and_location(self, field, boxscore):
         """
@@ -326,7 +439,7 @@ class Boxscore:
             either the date or location of the game.
         """
         scheme = BOXSCORE_SCHEME[field]
-        items = [i.text() for i in boxscore(scheme).items()]
+        items = [i.text() for i in utils._select(boxscore, scheme).items()]
         game_info = items[0].split('\n')
         if len(game_info) < 3 and field == 'location':
             return None
@@ -353,7 +466,7 @@ class Boxscore:
             The complete text for the requested tag.
         """
         scheme = BOXSCORE_SCHEME[field]
-        return boxscore(scheme)
+        return utils._select(boxscore, scheme)
 
     def _find_boxscore_tables(self, boxscore):
         """
@@ -432,7 +545,7 @@ class Boxscore:
 
         Since each player generally has a couple of rows worth of stats (one
         for basic stats and another for advanced stats) on the boxscore page,
-        both rows should be combined into a single string object to easily
+        both rows should be combined into a single PyQuery object to easily
         query all fields from a single object instead of determining which row
         to pull metrics from.
 
@@ -465,11 +578,11 @@ class Boxscore:
                 continue
             name = self._find_player_name(row)
             try:
-                player_dict[player_id]['data'] += str(row).strip()
+                player_dict[player_id]['data'] += row
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
-                    'data': str(row).strip(),
+                    'data': row,
                     'team': home_or_away
                 }
         return player_dict
@@ -548,7 +661,7 @@ class Boxscore:
         away_players, home_players = self._instantiate_players(player_dict)
         return away_players, home_players
 
-    def _parse_game_data(self, uri):
+    def _parse_game_data(self, uri, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -565,6 +678,9 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '201710310LAL'.
+        lazy : boolean (optional)
+            Set to True to store the page and parse each field the first time
+            it is requested instead of parsing every field immediately.
         """
         boxscore = self._retrieve_html_page(uri)
         # If the boxscore is None, the game likely hasn't been played yet and
@@ -573,7 +689,35 @@ class Boxscore:
         if not boxscore:
             return
 
-        for field in self.__dict__:
+        stats = utils._StatIndex(boxscore)
+        if lazy:
+            # Leave every unparsed field unset so it is parsed by __getattr__
+            # the first time it is requested.
+            fields = [field for field, value in self.__dict__.items()
+                      if value is None]
+            for field in fields:
+                delattr(self, field)
+            fields += ['_away_players', '_home_players']
+            self._deferred_fields = set(fields)
+            self._deferred_data = (boxscore, stats)
+            return
+        self._parse_fields(boxscore, stats, list(self.__dict__))
+        self._away_players, self._home_players = self._find_players(boxscore)
+
+    def _parse_fields(self, boxscore, stats, fields):
+        """
+        Parse the requested fields from the boxscore page.
+
+        Parameters
+        ----------
+        boxscore : PyQuery object
+            A PyQuery object containing all of the HTML data from the boxscore.
+        stats : _StatIndex
+            An index of the boxscore page's stats tables.
+        fields : list
+            A list of the attribute names to parse, such as '_home_points'.
+        """
+        for field in fields:
             # Remove the '_' from the name
             short_field = str(field)[1:]
             if short_field == 'winner' or \
@@ -594,11 +738,10 @@ class Boxscore:
             if short_field in BOXSCORE_ELEMENT_INDEX.keys():
                 index = BOXSCORE_ELEMENT_INDEX[short_field]
             value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
+                                       stats,
                                        short_field,
                                        index)
             setattr(self, field, value)
-        self._away_players, self._home_players = self._find_players(boxscore)
 
     @property
     def dataframe(self):
@@ -1435,11 +1578,51 @@ class Boxscores:
         boxscores specified in the 'end_date' parameter will be pulled. If left
         empty, or if 'end_date' is prior to 'date', only the games from the day
         specified in the 'date' parameter will be saved.
+    workers : int (optional)
+        Optionally specify the number of days to download at once when
+        searching a range of dates. If left empty, each day is downloaded in
+        turn. Results are always saved in date order.
     """
-    def __init__(self, date, end_date=None):
+    def __init__(self, date, end_date=None, workers=None):
         self._boxscores = {}
 
-        self._find_games(date, end_date)
+        self._find_games(date, end_date, workers)
+
+    @classmethod
+    def iter_games(cls, date, end_date=None, workers=None):
+        """
+        Iterate over the games played on every day in a range.
+
+        Rather than saving the games for the entire range before returning,
+        as creating a Boxscores instance does, each day's games are yielded
+        as soon as that day's page is parsed. This keeps memory constant
+        while covering several seasons at once. To resume an interrupted
+        run, pass the day after the last one which was processed as 'date'.
+
+        Parameters
+        ----------
+        date : datetime object
+            The first day to search for any matches. The month, day, and year
+            are required for the search, but time is not factored into the
+            search.
+        end_date : datetime object (optional)
+            Optionally specify the last day to search. If left empty, or if
+            'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be yielded.
+        workers : int (optional)
+            Optionally specify the number of days to download at once. If
+            left empty, each day is downloaded in turn.
+
+        Yields
+        ------
+        tuple
+            A tuple of the day as a string in the 'MM-DD-YYYY' format and a
+            ``list`` of every game played on that day, each in the same format
+            as the 'games' property.
+        """
+        # None of the parsing helpers depend on the games which were already
+        # found, so an empty instance is used to parse each day.
+        return cls.__new__(cls)._iter_games(date, end_date, workers)
 
     @property
     def games(self):
@@ -1518,7 +1701,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1739,7 +1922,7 @@ class Boxscores:
             all_boxscores.append(game_info)
         return all_boxscores
 
-    def _find_games(self, date, end_date):
+    def _find_games(self, date, end_date, workers=None):
         """
         Retrieve all major games played on a given day.
 
@@ -1761,18 +1944,62 @@ class Boxscores:
             be pulled. If left empty, or if 'end_date' is prior to 'date', only
             the games from the day specified in the 'date' parameter will be
             saved.
+        workers : int (optional)
+            Optionally specify the number of days to download at once. If
+            left empty, each day is downloaded in turn.
+        """
+        for timestamp, boxscores in self._iter_games(date, end_date, workers):
+            self._boxscores[timestamp] = boxscores
+
+    def _iter_games(self, date, end_date, workers=None):
+        """
+        Retrieve all major games played on each day in a range.
+
+        Builds a URL for every requested day and downloads the HTML contents
+        before parsing any and all games played during that day. Each day's
+        games are yielded as soon as its page is parsed, so only the pages
+        which are downloaded ahead of the current day are held in memory.
+
+        Parameters
+        ----------
+        date : datetime object
+            The first day to search for any matches.
+        end_date : datetime object (optional)
+            Optionally specify the last day to search. If left empty, or if
+            'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be found.
+        workers : int (optional)
+            Optionally specify the number of days to download at once. If
+            left empty, each day is downloaded in turn.
+
+        Yields
+        ------
+        tuple
+            A tuple of the day as a string in the 'MM-DD-YYYY' format and a
+            ``list`` of dictionaries for every game played on that day, in
+            date order.
         """
         # Set the end date to the start date if the end date is before the
         # start date.
         if not end_date or date > end_date:
             end_date = date
+        dates = []
         date_step = date
         while date_step <= end_date:
-            url = self._create_url(date_step)
-            page = self._get_requested_page(url)
+            dates.append(date_step)
+            date_step += timedelta(days=1)
+        urls = [self._create_url(date_step) for date_step in dates]
+        if workers and workers > 1 and len(urls) > 1:
+            pages = utils._iter_pages(urls, workers)
+        else:
+            pages = ((url, None) for url in urls)
+        # Parse the downloaded pages in date order so the days are yielded in
+        # the same order regardless of which download finished first.
+        for date_step, (url, body) in zip(dates, pages):
+            preloaded = {url: body} if body is not None else {}
+            with utils._preloaded_pages(preloaded):
+                page = self._get_requested_page(url)
             games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
             timestamp = '%s-%s-%s' % (date_step.month, date_step.day,
                                       date_step.year)
-            self._boxscores[timestamp] = boxscores
-            date_step += timedelta(days=1)
+            yield timestamp, self._extract_game_info(games)
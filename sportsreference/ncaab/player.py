@@ -1,7 +1,5 @@
 import pandas as pd
 import re
-from functools import wraps
-from pyquery import PyQuery as pq
 from .. import utils
 from .constants import PLAYER_SCHEME
 
@@ -18,33 +16,25 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         value = _cleanup(prop[index])
         try:
             return int(value)
         except ValueError:
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, int, decode)
 
 
 def _float_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         value = _cleanup(prop[index])
         try:
             return float(value)
         except ValueError:
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, float, decode)
 
 
 class AbstractPlayer:
@@ -70,11 +60,13 @@ class AbstractPlayer:
     player_name : string
         A string representing the player's first and last name, such as 'Carsen
         Edwards'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated togather.
+    player_data : PyQuery object
+        A PyQuery object of the player's HTML rows from the Boxscore page. If
+        the player appears in multiple tables, all of their rows will be
+        combined in one single object.
     """
+    __slots__ = ()
+
     def __init__(self, player_id, player_name, player_data):
         self._player_data = player_data
         self._player_id = player_id
@@ -127,9 +119,9 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _StatIndex
+            An index of all stats in HTML format for a particular player in a
+            single season or game.
         field : string
             A string of the field to parse from the HTML.
 
@@ -155,15 +147,20 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or PyQuery object
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains the HTML rows as a PyQuery object.
+            If this class is inherited from the ``BoxscorePlayer`` class,
+            player_data will be a PyQuery object of the player's game
+            statistics.
+        """
+        if isinstance(player_data, dict):
+            seasons = [utils._StatIndex(data['data'])
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._StatIndex(player_data)]
+        for field in utils._field_names(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -175,13 +172,7 @@ class AbstractPlayer:
                short_field == 'position':
                 continue
             field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
+            for stats in seasons:
                 value = self._parse_value(stats, short_field)
                 field_stats.append(value)
             setattr(self, field, field_stats)
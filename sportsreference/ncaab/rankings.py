@@ -1,5 +1,4 @@
 import re
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from .constants import RANKINGS_SCHEME, RANKINGS_URL
@@ -42,7 +41,8 @@ class Rankings:
             Returns a PyQuery object of the rankings HTML page.
         """
         try:
-            return pq(RANKINGS_URL % year)
+            historical = utils._is_past_season('ncaab', year)
+            return utils._pull_page(RANKINGS_URL % year, historical)
         except HTTPError:
             return None
 
@@ -88,16 +88,15 @@ class Rankings:
         year : string
             A string of the requested year to pull rankings from.
         """
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('ncaab')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(RANKINGS_URL % year) and \
-               utils._url_exists(RANKINGS_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
-        page = self._pull_rankings_page(year)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'ncaab', lambda year: RANKINGS_URL % year)
+        with utils._preloaded_pages(pages):
+            page = self._pull_rankings_page(year)
         if not page:
             output = ("Can't pull rankings page. Ensure the following URL "
                       "exists: %s" % RANKINGS_URL)
@@ -116,9 +115,10 @@ class Rankings:
             date = utils._parse_field(RANKINGS_SCHEME, team, 'date')
             previous = utils._parse_field(RANKINGS_SCHEME, team, 'previous')
             change = utils._parse_field(RANKINGS_SCHEME, team, 'change')
-            if 'decrease' in str(team(RANKINGS_SCHEME['change'])):
+            change_tag = str(utils._select(team, RANKINGS_SCHEME['change']))
+            if 'decrease' in change_tag:
                 change = int(change) * -1
-            elif 'increase' in str(team(RANKINGS_SCHEME['change'])):
+            elif 'increase' in change_tag:
                 change = int(change)
             else:
                 change = 0
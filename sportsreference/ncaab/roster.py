@@ -1,7 +1,5 @@
-import pandas as pd
 import re
 from functools import wraps
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
@@ -20,33 +18,25 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         value = _cleanup(prop[index])
         try:
             return int(value)
         except ValueError:
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, int, decode)
 
 
 def _float_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         value = _cleanup(prop[index])
         try:
             return float(value)
         except ValueError:
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, float, decode)
 
 
 def _most_recent_decorator(func):
@@ -54,8 +44,7 @@ def _most_recent_decorator(func):
     @wraps(func)
     def wrapper(*args):
         season = args[0]._most_recent_season
-        seasons = args[0]._season
-        index = seasons.index(season)
+        index = args[0]._season_index[season]
         prop = func(*args)
         return prop[index]
     return wrapper
@@ -114,8 +103,9 @@ class Player(AbstractPlayer):
         self._box_plus_minus = None
 
         player_data = self._pull_player_data()
-        self._find_initial_index()
         AbstractPlayer.__init__(self, player_id, self._name, player_data)
+        self._find_initial_index()
+        utils._convert_stat_columns(self)
 
     def _retrieve_html_page(self):
         """
@@ -132,10 +122,10 @@ class Player(AbstractPlayer):
         """
         url = PLAYER_URL % self._player_id
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url, uncomment=True)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return url_data
 
     def _parse_season(self, row):
         """
@@ -176,8 +166,8 @@ class Player(AbstractPlayer):
         all_stats_dict : dictionary
             A dictionary of all stats separated by season where each key is the
             season ``string``, such as '2017-18', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+            ``dictionary`` with a ``string`` of 'data' and a PyQuery object
+            containing all of the rows.
 
         Returns
         -------
@@ -191,17 +181,17 @@ class Player(AbstractPlayer):
         for row in table_rows:
             season = self._parse_season(row)
             try:
-                all_stats_dict[season]['data'] += str(row)
+                all_stats_dict[season]['data'] += row
             except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+                all_stats_dict[season] = {'data': row}
             most_recent_season = season
         self._most_recent_season = most_recent_season
         if not career_stats:
             return all_stats_dict
         try:
-            all_stats_dict['Career']['data'] += str(next(career_stats))
+            all_stats_dict['Career']['data'] += next(career_stats)
         except KeyError:
-            all_stats_dict['Career'] = {'data': str(next(career_stats))}
+            all_stats_dict['Career'] = {'data': next(career_stats)}
         return all_stats_dict
 
     def _combine_all_stats(self, player_info):
@@ -351,14 +341,15 @@ class Player(AbstractPlayer):
 
         When the Player class is instantiated, the default stats to pull are
         the player's career stats. Upon being called, the index of the 'Career'
-        element should be the index value.
+        element should be the index value. The position of every season is
+        recorded at the same time so later season lookups don't need to scan
+        the list of seasons.
         """
-        index = 0
-        for season in self._season:
-            if season == 'Career':
-                self._index = index
-                break
-            index += 1
+        self._season_index = {}
+        for index, season in enumerate(self._season or []):
+            self._season_index.setdefault(season, index)
+        if 'Career' in self._season_index:
+            self._index = self._season_index['Career']
 
     def __call__(self, requested_season=''):
         """
@@ -382,12 +373,8 @@ class Player(AbstractPlayer):
         if requested_season.lower() == 'career' or \
            requested_season == '':
             requested_season = 'Career'
-        index = 0
-        for season in self._season:
-            if season == requested_season:
-                self._index = index
-                break
-            index += 1
+        if requested_season in self._season_index:
+            self._index = self._season_index[requested_season]
         return self
 
     def _dataframe_fields(self):
@@ -468,15 +455,37 @@ class Player(AbstractPlayer):
         properties and values where each index is a different season plus the
         career stats.
         """
-        temp_index = self._index
-        rows = []
-        indices = []
-        for season in self._season:
-            self._index = self._season.index(season)
-            rows.append(self._dataframe_fields())
-            indices.append(season)
-        self._index = temp_index
-        return pd.DataFrame(rows, index=[indices])
+        return utils._player_dataframe(self, self._season)
+
+    def seasons(self, requested_seasons):
+        """
+        Returns a ``pandas DataFrame`` of the stats for several seasons.
+
+        Each requested season is looked up directly in the player's season
+        index, making this cheaper than filtering the full ``dataframe`` when
+        only a handful of seasons are needed.
+
+        Parameters
+        ----------
+        requested_seasons : list
+            A list of season strings to pull stats for, such as
+            ['2016-17', '2017-18']. 'Career' can be included to add the
+            career stats.
+
+        Returns
+        -------
+        Pandas DataFrame
+            Returns a DataFrame where each index is one of the requested
+            seasons, in the order they were requested. Seasons the player
+            didn't take part in are skipped.
+        """
+        seasons = []
+        for season in requested_seasons:
+            if season.lower() == 'career':
+                season = 'Career'
+            if season in self._season_index:
+                seasons.append(season)
+        return utils._player_dataframe(self, seasons)
 
     @property
     def season(self):
@@ -637,18 +646,41 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    workers : int (optional)
+        Optionally specify the number of player pages to download at once
+        when ``slim`` is False. If left empty, each player is downloaded in
+        turn, unless ``processes`` is set, in which case several pages are
+        downloaded at once.
+    processes : int (optional)
+        Optionally specify a number of worker processes to parse the player
+        pages with when ``slim`` is False. If left empty, every page is parsed
+        in the current process.
+    lazy : boolean (optional)
+        Set to True to only download and parse the players the first time the
+        ``players`` property is requested, or to stream them with
+        ``iter_players`` without keeping them. Any error downloading a player
+        is then raised at that point instead of when the roster is created.
+        Defaults to False, which loads every player along with the roster.
+        Has no effect when ``slim`` is True.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, workers=None,
+                 processes=None, lazy=False):
         self._team = team
         self._slim = slim
+        self._workers = workers
+        self._processes = processes
+        self._player_ids = []
         if slim:
             self._players = {}
         else:
-            self._players = []
+            self._players = None
 
         self._find_players(year)
+        if not slim and not lazy:
+            self._players = list(self._load_players(self._player_ids,
+                                                    workers, processes))
 
-    def _pull_team_page(self, url):
+    def _pull_team_page(self, url, historical=False):
         """
         Download the team page.
 
@@ -658,6 +690,8 @@ class Roster:
         ----------
         url : string
             A string of the built URL for the requested team and season.
+        historical : boolean (optional)
+            Evaluates to True if the requested season has been completed.
 
         Returns
         -------
@@ -665,7 +699,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(url)
+            return utils._pull_page(url, historical)
         except HTTPError:
             return None
 
@@ -732,6 +766,71 @@ class Roster:
         name_tag = player('th[data-stat="player"] a')
         return name_tag.text()
 
+    def _player_url(self, player_id):
+        """
+        Build the URL of a player's stats page.
+
+        Parameters
+        ----------
+        player_id : string
+            A string of the player's ID.
+
+        Returns
+        -------
+        string
+            Returns a string of the URL of the player's stats page.
+        """
+        return PLAYER_URL % player_id
+
+    def _load_players(self, player_ids, workers=None, processes=None):
+        """
+        Create an instance of the Player class for each player ID.
+
+        When more than one worker is requested, the player pages are
+        downloaded concurrently ahead of the player currently being parsed.
+        When processes are requested, the pages are parsed on a pool of
+        processes as they finish downloading, and several pages are downloaded
+        at once even if no workers are requested. Either way, each player is
+        created in the same order as the IDs and handed back as soon as it is
+        ready.
+
+        Parameters
+        ----------
+        player_ids : list
+            A list of the player ID strings to create.
+        workers : int (optional)
+            The number of player pages to download at once. If left empty,
+            each player is downloaded in turn, or MAX_CONCURRENT_REQUESTS
+            pages are downloaded at once when processes are requested.
+        processes : int (optional)
+            The number of worker processes to parse the player pages with. If
+            left empty, every page is parsed in the current process.
+
+        Returns
+        -------
+        generator
+            A generator yielding an instance of the Player class for each
+            requested player ID.
+        """
+        if processes:
+            urls = [self._player_url(player_id) for player_id in player_ids]
+            pages = utils._iter_pages(urls, workers or
+                                      utils.MAX_CONCURRENT_REQUESTS)
+            items = (((player_id,), {url: page})
+                     for player_id, (url, page) in zip(player_ids, pages))
+            yield from utils._build_in_processes(Player, items, processes)
+            return
+        if not workers or workers <= 1:
+            for player_id in player_ids:
+                yield Player(player_id)
+            return
+        urls = [self._player_url(player_id) for player_id in player_ids]
+        pages = utils._iter_pages(urls, workers)
+        for player_id, (url, page) in zip(player_ids, pages):
+            with utils._preloaded_pages({url: page}):
+                player = Player(player_id)
+            yield player
+
     def _find_players(self, year):
         """
         Find all player IDs for the requested team.
@@ -748,21 +847,21 @@ class Roster:
             The 4-digit string representing the year to pull the team's roster
             from.
         """
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('ncaab')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(self._create_url(year)) and \
-               utils._url_exists(self._create_url(str(int(year) - 1))):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season('ncaab', self._create_url)
         url = self._create_url(year)
-        page = self._pull_team_page(url)
+        historical = utils._is_past_season('ncaab', year)
+        with utils._preloaded_pages(pages):
+            page = self._pull_team_page(url, historical)
         if not page:
             output = ("Can't pull requested team page. Ensure the follow "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         players = page('table#roster tbody tr').items()
         for player in players:
             player_id = self._get_id(player)
@@ -770,8 +869,9 @@ class Roster:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
+
+        self._player_ids = player_ids
 
     @property
     def players(self):
@@ -780,6 +880,51 @@ class Roster:
         team's roster if the ``slim`` property is False when calling the Roster
         class. If the ``slim`` property is True, returns a ``dictionary`` where
         each key is a string of the player's ID and each value is the player's
-        first and last name as listed on the roster page.
-        """
+        first and last name as listed on the roster page. If the roster was
+        requested with ``lazy`` set to True, every player is downloaded and
+        parsed the first time the players are requested.
+        """
+        if self._players is None:
+            self._players = list(self._load_players(self._player_ids,
+                                                    self._workers,
+                                                    self._processes))
         return self._players
+
+    def iter_players(self, workers=None, processes=None):
+        """
+        Iterate over an instance of the Player class for each player.
+
+        Each player is only downloaded and parsed once the iterator reaches
+        them, so processing can begin before the whole roster has loaded and
+        players which were already handled can be released. The players
+        aren't kept by the roster, so iterating again downloads them again.
+        Only a slim roster or one requested with ``lazy`` set to True is
+        streamed this way. Otherwise, or if the ``players`` property was
+        already requested, the players which were loaded are returned in turn
+        instead.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            Optionally specify the number of player pages to download at once
+            ahead of the player being returned. If left empty, the value
+            given to the roster is used.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            player pages with. If left empty, the value given to the roster is
+            used.
+
+        Returns
+        -------
+        iterator
+            An iterator yielding an instance of the Player class for each
+            player on the roster.
+        """
+        if self._slim:
+            player_ids = list(self._players)
+        elif self._players is not None:
+            return iter(self._players)
+        else:
+            player_ids = self._player_ids
+        return self._load_players(player_ids, workers or self._workers,
+                                  processes or self._processes)
@@ -4,10 +4,11 @@ from .constants import (ADVANCED_OPPONENT_STATS_URL,
                         ADVANCED_STATS_URL,
                         BASIC_OPPONENT_STATS_URL,
                         BASIC_STATS_URL,
-                        PARSING_SCHEME)
-from pyquery import PyQuery as pq
+                        PARSING_SCHEME,
+                        SCHEDULE_URL)
 from ..decorators import float_property_decorator, int_property_decorator
 from .. import utils
+from .boxscore import Boxscore
 from .conferences import Conferences
 from .roster import Roster
 from .schedule import Schedule
@@ -31,8 +32,11 @@ class Team:
         A string of the team's conference abbreviation, such as 'big-12'.
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each stat the first time it is requested
+        instead of parsing every stat up front.
     """
-    def __init__(self, team_data, team_conference=None, year=None):
+    def __init__(self, team_data, team_conference=None, year=None, lazy=False):
         self._team_conference = team_conference
         self._year = year
         self._abbreviation = None
@@ -118,9 +122,26 @@ class Team:
         self._opp_offensive_rebound_percentage = None
         self._opp_free_throws_per_field_goal_attempt = None
 
-        self._parse_team_data(team_data)
+        self._parse_team_data(team_data, lazy)
 
-    def _parse_team_data(self, team_data):
+    def __getattr__(self, name):
+        # Only called for attributes which haven't been set. In lazy mode,
+        # every field starts out unset and is parsed from the stored stats the
+        # first time it is requested.
+        return utils._parse_deferred_field(self, name, self._parse_deferred)
+
+    def _parse_deferred(self, name):
+        """
+        Parse a single field which was left unset in lazy mode.
+
+        Parameters
+        ----------
+        name : string
+            The name of the attribute to parse, such as '_wins'.
+        """
+        self._parse_fields(self._deferred_data, [name])
+
+    def _parse_team_data(self, team_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -138,23 +159,47 @@ class Team:
             A string containing all of the rows of stats for a given team. If
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
+        lazy : boolean (optional)
+            Set to True to store the stats and parse each field the first time
+            it is requested instead of parsing every field immediately.
+        """
+        stats = utils._StatIndex(team_data)
+        if lazy:
+            fields = [field for field, value in self.__dict__.items()
+                      if value is None]
+            for field in fields:
+                delattr(self, field)
+            self._deferred_fields = set(fields)
+            self._deferred_data = stats
+            return
+        self._parse_fields(stats, list(self.__dict__))
+
+    def _parse_fields(self, stats, fields):
         """
-        for field in self.__dict__:
+        Parse the requested fields from the team's stats.
+
+        Parameters
+        ----------
+        stats : _StatIndex
+            An index of all of the rows of stats for the team.
+        fields : list
+            A list of the attribute names to parse, such as '_points'.
+        """
+        for field in fields:
             if field == '_year' or \
                field == '_team_conference':
                 continue
             value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
+                                       stats,
                                        # Remove the '_' from the name
                                        str(field)[1:])
             setattr(self, field, value)
 
     @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'PURDUE'.
+        Returns a ``dictionary`` of the values included in the DataFrame, keyed
+        by the column name.
         """
         fields_to_include = {
             'abbreviation': self.abbreviation,
@@ -255,7 +300,17 @@ class Team:
             'win_percentage': self.win_percentage,
             'wins': self.wins
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'PURDUE'.
+        """
+        return pd.DataFrame([self._dataframe_fields],
+                            index=[self._abbreviation])
 
     @property
     def conference(self):
@@ -991,12 +1046,15 @@ class Teams:
     ----------
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each team's stats the first time they are
+        requested.
     """
-    def __init__(self, year=None):
+    def __init__(self, year=None, lazy=False):
         self._teams = []
         self._conferences_dict = Conferences(year).team_conference
 
-        self._retrieve_all_teams(year)
+        self._retrieve_all_teams(year, lazy)
 
     def __getitem__(self, abbreviation):
         """
@@ -1081,8 +1139,7 @@ class Teams:
             information included.
         """
         for team_data in teams_list:
-            if 'class="over_header thead"' in str(team_data) or\
-               'class="thead"' in str(team_data):
+            if team_data.attr('class') in ['over_header thead', 'thead']:
                 continue
             abbr = utils._parse_field(PARSING_SCHEME,
                                       team_data,
@@ -1093,7 +1150,7 @@ class Teams:
                 team_data_dict[abbr] = {'data': team_data}
         return team_data_dict
 
-    def _retrieve_all_teams(self, year):
+    def _retrieve_all_teams(self, year, lazy=False):
         """
         Find and create Team instances for all teams in the given season.
 
@@ -1110,26 +1167,32 @@ class Teams:
         ----------
         year : string
             The requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each team's stats the first time they
+            are requested.
         """
         team_data_dict = {}
 
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('ncaab')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(BASIC_STATS_URL % year) and \
-               utils._url_exists(BASIC_STATS_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
-        doc = pq(BASIC_STATS_URL % year)
-        teams_list = utils._get_stats_table(doc, 'table#basic_school_stats')
-        doc = pq(BASIC_OPPONENT_STATS_URL % year)
-        opp_list = utils._get_stats_table(doc, 'table#basic_opp_stats')
-        doc = pq(ADVANCED_STATS_URL % year)
-        adv_teams_list = utils._get_stats_table(doc, 'table#adv_school_stats')
-        doc = pq(ADVANCED_OPPONENT_STATS_URL % year)
-        adv_opp_list = utils._get_stats_table(doc, 'table#adv_opp_stats')
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'ncaab', lambda year: BASIC_STATS_URL % year)
+        historical = utils._is_past_season('ncaab', year)
+        urls = [BASIC_STATS_URL % year, BASIC_OPPONENT_STATS_URL % year,
+                ADVANCED_STATS_URL % year, ADVANCED_OPPONENT_STATS_URL % year]
+        with utils._preloaded_pages(pages):
+            basic_doc, opp_doc, adv_doc, adv_opp_doc = \
+                utils._pull_pages(urls, historical)
+        teams_list = utils._get_stats_table(basic_doc,
+                                            'table#basic_school_stats')
+        opp_list = utils._get_stats_table(opp_doc, 'table#basic_opp_stats')
+        adv_teams_list = utils._get_stats_table(adv_doc,
+                                                'table#adv_school_stats')
+        adv_opp_list = utils._get_stats_table(adv_opp_doc,
+                                              'table#adv_opp_stats')
 
         for stats_list in [teams_list, opp_list, adv_teams_list, adv_opp_list]:
             team_data_dict = self._add_stats_data(stats_list, team_data_dict)
@@ -1137,7 +1200,8 @@ class Teams:
         for team_name, team_data in team_data_dict.items():
             team = Team(team_data['data'],
                         self._conferences_dict[team_name.lower()],
-                        year)
+                        year,
+                        lazy)
             self._teams.append(team)
 
     @property
@@ -1146,7 +1210,54 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
+        fields = []
+        index = []
         for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+            fields.append(team._dataframe_fields)
+            index.append(team._abbreviation)
+        return pd.DataFrame(fields, index=index)
+
+    def new_boxscores(self, ingested,
+                      concurrency=utils.MAX_CONCURRENT_REQUESTS,
+                      processes=None):
+        """
+        Create Boxscore instances for games which haven't been ingested yet.
+
+        Keeping a table of every game in the season current by pulling every
+        team's 'dataframe_extended' downloads every completed game again.
+        Instead, only each team's schedule is downloaded and compared against
+        the 'boxscore_index' values which were already stored, so only games
+        which were added or completed since are downloaded and parsed. Each
+        game is only downloaded once, even though it appears in the
+        schedules of both teams.
+
+        Parameters
+        ----------
+        ingested : set
+            A container of the 'boxscore_index' values of every game which
+            was already stored, such as a ``set`` or a ``dict``.
+        concurrency : int (optional)
+            The maximum number of pages to download at once.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            downloaded boxscores with.
+
+        Returns
+        -------
+        dict
+            Returns a ``dictionary`` of Boxscore instances for every new game,
+            keyed by the 'boxscore_index'.
+        """
+        if not self._teams:
+            return {}
+        year = self._teams[0]._year
+        urls = [SCHEDULE_URL % (team._abbreviation.lower(), year)
+                for team in self._teams]
+        pages = utils._fetch_pages(urls, concurrency,
+                                   utils._is_past_season('ncaab', year))
+        with utils._preloaded_pages(pages):
+            schedules = [team.schedule for team in self._teams]
+        uris = utils._new_boxscore_uris(schedules, ingested)
+        boxscores = Boxscore.fetch_many(uris, concurrency,
+                                        processes=processes)
+        return dict(zip(uris, boxscores))
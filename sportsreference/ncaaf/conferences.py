@@ -1,10 +1,18 @@
-from pyquery import PyQuery as pq
 import re
 from urllib.error import HTTPError
 from .. import utils
 from .constants import CONFERENCE_URL, CONFERENCES_URL
 
 
+# {
+#   string of the year: tuple of the 'conferences' and 'team_conference'
+#         dictionaries for a completed season, which can no longer change.
+#         Conferences for the ongoing season are pulled again every time so
+#         changes are picked up.
+# }
+_season_conferences = {}
+
+
 class Conference:
     """
     Find teams that participated in a particular conference.
@@ -42,7 +50,9 @@ class Conference:
             A string of the requested year to pull conference information from.
         """
         try:
-            return pq(CONFERENCE_URL % (conference_abbreviation, year))
+            historical = utils._is_past_season('ncaaf', year)
+            return utils._pull_page(CONFERENCE_URL % (conference_abbreviation,
+                                                      year), historical)
         except HTTPError:
             return None
 
@@ -86,16 +96,16 @@ class Conference:
         year : string
             A string of the requested year to pull conference information from.
         """
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('ncaaf')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(CONFERENCES_URL % year) and \
-               utils._url_exists(CONFERENCES_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
-        page = self._pull_conference_page(conference_abbreviation, year)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'ncaaf',
+                lambda year: CONFERENCE_URL % (conference_abbreviation, year))
+        with utils._preloaded_pages(pages):
+            page = self._pull_conference_page(conference_abbreviation, year)
         if not page:
             url = CONFERENCE_URL % (conference_abbreviation, year)
             output = ("Can't pull requested conference page. Ensure the "
@@ -159,7 +169,8 @@ class Conferences:
             Returns a PyQuery object of the conference HTML page.
         """
         try:
-            return pq(CONFERENCES_URL % year)
+            historical = utils._is_past_season('ncaaf', year)
+            return utils._pull_page(CONFERENCES_URL % year, historical)
         except HTTPError:
             return None
 
@@ -195,39 +206,54 @@ class Conferences:
         the teams that participated in the conference during that year.
         Conference information includes abbreviation and full name for the
         conference as well as the abbreviation and full name for each team in
-        the conference.
+        the conference. Every conference page is downloaded concurrently and,
+        for completed seasons, the results are reused for any later requests
+        for the same season.
 
         Parameters
         ----------
         year : string
             A string of the requested year to pull conferences from.
         """
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('ncaaf')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(CONFERENCES_URL % year) and \
-               utils._url_exists(CONFERENCES_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
-        page = self._pull_conference_page(year)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'ncaaf', lambda year: CONFERENCES_URL % year)
+        historical = utils._is_past_season('ncaaf', year)
+        if historical and str(year) in _season_conferences:
+            conferences, team_conference = _season_conferences[str(year)]
+            self._conferences = dict(conferences)
+            self._team_conference = dict(team_conference)
+            return
+        with utils._preloaded_pages(pages):
+            page = self._pull_conference_page(year)
         if not page:
             output = ("Can't pull requested conference page. Ensure the "
                       "following URL exists: %s" % (CONFERENCES_URL % year))
             raise ValueError(output)
-        conferences = page('table#conferences tbody tr').items()
-        for conference in conferences:
-            conference_abbreviation = self._get_conference_id(conference)
-            conference_name = conference('td[data-stat="conf_name"]').text()
-            teams_dict = Conference(conference_abbreviation, year).teams
-            conference_dict = {
-                    'name': conference_name,
-                    'teams': teams_dict
-                }
-            for team in teams_dict.keys():
-                self._team_conference[team] = conference_abbreviation
-            self._conferences[conference_abbreviation] = conference_dict
+        rows = page('table#conferences tbody tr').items()
+        conferences = [(self._get_conference_id(conference),
+                        conference('td[data-stat="conf_name"]').text())
+                       for conference in rows]
+        urls = [CONFERENCE_URL % (conference_abbreviation, year)
+                for conference_abbreviation, _ in conferences]
+        pages = utils._fetch_pages(urls, historical=historical)
+        with utils._preloaded_pages(pages):
+            for conference_abbreviation, conference_name in conferences:
+                teams_dict = Conference(conference_abbreviation, year).teams
+                conference_dict = {
+                        'name': conference_name,
+                        'teams': teams_dict
+                    }
+                for team in teams_dict.keys():
+                    self._team_conference[team] = conference_abbreviation
+                self._conferences[conference_abbreviation] = conference_dict
+        if historical:
+            _season_conferences[str(year)] = (dict(self._conferences),
+                                              dict(self._team_conference))
 
     @property
     def conferences(self):
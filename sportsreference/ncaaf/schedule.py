@@ -4,7 +4,6 @@ from ..decorators import int_property_decorator
 from .constants import (SCHEDULE_SCHEME,
                         SCHEDULE_URL)
 from datetime import datetime
-from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import (WIN,
                                        LOSS,
@@ -29,6 +28,12 @@ class Game:
     game_data : string
         The row containing the specified game information.
     """
+    __slots__ = ('_game', '_date', '_time', '_day_of_week', '_boxscore',
+                 '_location', '_rank', '_opponent_rank', '_opponent_name',
+                 '_opponent_abbr', '_opponent_conference', '_result',
+                 '_points_for', '_points_against', '_wins', '_losses',
+                 '_streak')
+
     def __init__(self, game_data):
         self._game = None
         self._date = None
@@ -108,7 +113,8 @@ class Game:
         game_data : string
             A string containing all of the rows of stats for a given game.
         """
-        for field in self.__dict__:
+        stats = utils._StatIndex(game_data)
+        for field in self.__slots__:
             # Remove the leading '_' from the name
             short_name = str(field)[1:]
             if short_name == 'opponent_abbr':
@@ -117,14 +123,14 @@ class Game:
             elif short_name == 'boxscore':
                 self._parse_boxscore(game_data)
                 continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
+            value = utils._parse_field(SCHEDULE_SCHEME, stats, short_name)
             setattr(self, field, value)
 
     @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Returns a ``dictionary`` of the values included in the DataFrame, keyed
+        by the column name. Returns None if the game hasn't been played yet.
         """
         if self._points_for is None and self._points_against is None:
             return None
@@ -148,6 +154,17 @@ class Game:
             'time': self.time,
             'wins': self.wins
         }
+        return fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        fields_to_include = self._dataframe_fields
+        if fields_to_include is None:
+            return None
         return pd.DataFrame([fields_to_include], index=[self._boxscore])
 
     @property
@@ -199,9 +216,11 @@ class Game:
     def boxscore(self):
         """
         Returns an instance of the Boxscore class containing more detailed
-        stats on the game.
+        stats on the game. Once a game is complete, the instance is shared
+        with every other schedule the game appears in, so the game isn't
+        downloaded and parsed again.
         """
-        return Boxscore(self._boxscore)
+        return utils._get_boxscore(Boxscore, self._boxscore)
 
     @property
     def boxscore_index(self):
@@ -435,18 +454,18 @@ class Schedule:
         year : string
             The requested year to pull stats from.
         """
+        pages = {}
         if not year:
-            year = utils._find_year_for_season('ncaaf')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                     year)) and \
-               utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                 str(int(year) - 1))):
-                year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation.lower(), year))
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year, pages = utils._find_default_season(
+                'ncaaf',
+                lambda year: SCHEDULE_URL % (abbreviation.lower(), year))
+        historical = utils._is_past_season('ncaaf', year)
+        with utils._preloaded_pages(pages):
+            doc = utils._pull_page(SCHEDULE_URL % (abbreviation.lower(), year),
+                                   historical)
         schedule = utils._get_stats_table(doc, 'table#schedule')
 
         for item in schedule:
@@ -459,14 +478,16 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
+        fields = []
+        index = []
         for game in self.__iter__():
-            df = game.dataframe
-            if df is not None:
-                frames.append(df)
-        if frames == []:
+            fields_to_include = game._dataframe_fields
+            if fields_to_include is not None:
+                fields.append(fields_to_include)
+                index.append(game._boxscore)
+        if fields == []:
             return None
-        return pd.concat(frames)
+        return pd.DataFrame(fields, index=index)
 
     @property
     def dataframe_extended(self):
@@ -475,13 +496,50 @@ class Schedule:
         Boxscore class for every game in the schedule. Rows are indexed by the
         boxscore string. This property provides much richer context for the
         selected game, but takes longer to process compared to the lighter
-        'dataframe' property.
+        'dataframe' property. Every boxscore is downloaded concurrently, and
+        games which were already parsed, such as through the opposing team's
+        schedule, are reused.
         """
+        uris = [game._boxscore for game in self.__iter__()]
         frames = []
-        for game in self.__iter__():
-            df = game.dataframe_extended
+        for boxscore in Boxscore.fetch_many(uris):
+            df = boxscore.dataframe
             if df is not None:
                 frames.append(df)
         if frames == []:
             return None
         return pd.concat(frames)
+
+    def new_boxscores(self, ingested,
+                      concurrency=utils.MAX_CONCURRENT_REQUESTS,
+                      processes=None):
+        """
+        Create Boxscore instances for games which haven't been ingested yet.
+
+        Compares the schedule against the 'boxscore_index' values which were
+        already stored and only downloads and parses the games which were
+        completed since, rather than every game in the schedule like
+        'dataframe_extended'. Games which haven't been played yet are skipped
+        until they are completed.
+
+        Parameters
+        ----------
+        ingested : set
+            A container of the 'boxscore_index' values of every game which
+            was already stored, such as a ``set`` or a ``dict``.
+        concurrency : int (optional)
+            The maximum number of boxscore pages to download at once.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            downloaded boxscores with.
+
+        Returns
+        -------
+        dict
+            Returns a ``dictionary`` of Boxscore instances for every new game,
+            keyed by the 'boxscore_index' and ordered by the schedule.
+        """
+        uris = utils._new_boxscore_uris([self], ingested)
+        boxscores = Boxscore.fetch_many(uris, concurrency,
+                                        processes=processes)
+        return dict(zip(uris, boxscores))
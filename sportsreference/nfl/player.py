@@ -1,8 +1,6 @@
 import pandas as pd
 import re
-from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
@@ -21,33 +19,25 @@ def _cleanup(prop):
 
 
 def _int_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         value = _cleanup(prop[index])
         try:
             return int(value)
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, int, decode)
 
 
 def _float_property_decorator(func):
-    @property
-    @wraps(func)
-    def wrapper(*args):
-        index = args[0]._index
-        prop = func(*args)
+    def decode(prop, index):
         value = _cleanup(prop[index])
         try:
             return float(value)
         except (ValueError, TypeError, IndexError):
             # If there is no value, default to None
             return None
-    return wrapper
+    return utils._stat_property(func, float, decode)
 
 
 class AbstractPlayer:
@@ -77,11 +67,13 @@ class AbstractPlayer:
     player_name : string
         A string representing the player's first and last name, such as 'Drew
         Brees'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : PyQuery object
+        A PyQuery object of the player's HTML rows from the Boxscore page. If
+        the player appears in multiple tables, all of their rows will be
+        combined in one single object.
     """
+    __slots__ = ()
+
     def __init__(self, player_id, player_name, player_data):
         self._player_id = player_id
         self._name = player_name
@@ -152,9 +144,9 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _StatIndex
+            An index of all stats in HTML format for a particular player in a
+            single season or game.
         field : string
             A string of the field to parse from the HTML.
 
@@ -174,15 +166,20 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or PyQuery object
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains the HTML rows as a PyQuery object.
+            If this class is inherited from the ``BoxscorePlayer`` class,
+            player_data will be a PyQuery object of the player's game
+            statistics.
+        """
+        if isinstance(player_data, dict):
+            seasons = [utils._StatIndex(data['data'])
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._StatIndex(player_data)]
+        for field in utils._field_names(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -194,13 +191,7 @@ class AbstractPlayer:
                short_field == 'season':
                 continue
             field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
+            for stats in seasons:
                 value = self._parse_value(stats, short_field)
                 field_stats.append(value)
             setattr(self, field, field_stats)
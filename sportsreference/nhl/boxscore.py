@@ -1,7 +1,6 @@
 import pandas as pd
 import re
 from datetime import timedelta
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
 from .. import utils
 from ..constants import AWAY, HOME
@@ -78,6 +77,21 @@ class BoxscorePlayer(AbstractPlayer):
         page. If the player appears in multiple tables, all of their
         information will appear in one single string concatenated together.
     """
+    __slots__ = ('_index', '_player_id', '_decision', '_defensive_zone_starts',
+                 '_individual_corsi_for_events', '_offensive_zone_starts',
+                 '_on_ice_shot_attempts_against', '_on_ice_shot_attempts_for',
+                 '_shifts', '_name', '_goals', '_assists', '_points',
+                 '_plus_minus', '_penalties_in_minutes',
+                 '_even_strength_goals', '_power_play_goals',
+                 '_short_handed_goals', '_game_winning_goals',
+                 '_even_strength_assists', '_power_play_assists',
+                 '_short_handed_assists', '_shots_on_goal',
+                 '_shooting_percentage', '_time_on_ice',
+                 '_blocks_at_even_strength', '_hits_at_even_strength',
+                 '_corsi_for_percentage', '_relative_corsi_for_percentage',
+                 '_offensive_zone_start_percentage', '_goals_against',
+                 '_shots_against', '_saves', '_save_percentage', '_shutouts')
+
     def __init__(self, player_id, player_name, player_data):
         self._index = 0
         self._player_id = player_id
@@ -225,8 +239,14 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         '201806070VEG'.
+    lazy : boolean (optional)
+        Set to True to defer parsing until a field is first requested. Each
+        field is then parsed from the downloaded page on its first access and
+        stored, and the players are only parsed once ``home_players`` or
+        ``away_players`` is read. Useful when only a few fields are needed
+        from a large number of games.
     """
-    def __init__(self, uri):
+    def __init__(self, uri, lazy=False):
         self._uri = uri
         self._date = None
         self._time = None
@@ -273,7 +293,99 @@ class Boxscore:
         self._home_save_percentage = None
         self._home_shutout = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, lazy)
+
+    @classmethod
+    def fetch_many(cls, uris, concurrency=utils.MAX_CONCURRENT_REQUESTS,
+                   lazy=False, processes=None):
+        """
+        Create Boxscore instances for several games at once.
+
+        Rather than downloading each boxscore page one after another, all of
+        the requested pages are downloaded concurrently before each page is
+        parsed into a Boxscore instance. Completed games which were already
+        parsed in this process, such as through the opposing team's
+        schedule, are reused instead of being downloaded again, both while
+        they are still held elsewhere and for up to
+        ``utils.BOXSCORE_CACHE_SIZE`` of the most recently used games.
+
+        Parameters
+        ----------
+        uris : list
+            A list of the relative links to the boxscore HTML pages, such as
+            ['201806070VEG'].
+        concurrency : int (optional)
+            The maximum number of pages to download at once.
+        lazy : boolean (optional)
+            Set to True to only parse each field of a Boxscore once it is
+            first requested. Can't be combined with 'processes'.
+        processes : int (optional)
+            Optionally specify a number of worker processes to parse the
+            downloaded pages with. Parsing is CPU-bound, so spreading it
+            across processes speeds up building a large number of boxscores,
+            such as every game in a season which is already cached. If left
+            empty, every page is parsed in the current process.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of Boxscore instances in the same order as the
+            requested URIs.
+
+        Raises
+        ------
+        ValueError
+            If both 'lazy' and 'processes' are set. A lazy Boxscore still
+            holds the whole page, which would have to be sent back from the
+            worker process and parsed again.
+        """
+        if lazy and processes:
+            raise ValueError('Lazy boxscores cannot be parsed in processes.')
+        boxscores = utils._registered_boxscores(cls, uris)
+        missing = [uri for uri in dict.fromkeys(uris)
+                   if uri not in boxscores]
+        urls = [BOXSCORE_URL % uri for uri in missing]
+        # Only the pages of completed games can be cached indefinitely.
+        historical = [utils._is_completed_game(uri) for uri in missing]
+        pages = utils._fetch_pages(urls, concurrency, historical)
+        if processes:
+            items = [((uri, lazy), {url: pages[url]})
+                     for uri, url in zip(missing, urls)]
+            built = utils._build_in_processes(cls, items, processes)
+        else:
+            with utils._preloaded_pages(pages):
+                built = [cls(uri, lazy) for uri in missing]
+        built = dict(zip(missing, built))
+        utils._register_boxscores(cls, built)
+        boxscores.update(built)
+        return [boxscores[uri] for uri in uris]
+
+    def __getattr__(self, name):
+        # Only called for attributes which haven't been set. In lazy mode,
+        # every field starts out unset and is parsed from the stored page the
+        # first time it is requested.
+        return utils._parse_deferred_field(self, name, self._parse_deferred)
+
+    def _parse_deferred(self, name):
+        """
+        Parse a single field which was left unset in lazy mode.
+
+        Parameters
+        ----------
+        name : string
+            The name of the attribute to parse, such as '_home_points'.
+        """
+        boxscore, stats = self._deferred_data
+        if name == '_away_players' or name == '_home_players':
+            self._away_players, self._home_players = \
+                self._find_players(boxscore)
+        elif name == '_away_skaters' or name == '_away_goalies':
+            self._parse_skater_and_goalie_counts(boxscore)
+        else:
+            self._parse_fields(boxscore, stats, [name])
+        if name not in self.__dict__:
+            # The date, time, and venue details are all parsed together.
+            self._parse_game_date_and_location(boxscore)
 
     def _retrieve_html_page(self, uri):
         """
@@ -297,10 +409,12 @@ class Boxscore:
         """
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url,
+                                        utils._is_completed_game(uri),
+                                        uncomment=True)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return url_data
 
     def _parse_game_date_and_location(self, boxscore):
         """
@@ -319,7 +433,7 @@ class Boxscore:
             A PyQuery object containing all of the HTML data from the boxscore.
         """
         scheme = BOXSCORE_SCHEME["game_info"]
-        items = [i.text() for i in boxscore(scheme).items()]
+        items = [i.text() for i in utils._select(boxscore, scheme).items()]
         game_info = items[0].split('\n')
         arena = None
         attendance = None
@@ -375,7 +489,7 @@ class Boxscore:
             The complete text for the requested tag.
         """
         scheme = BOXSCORE_SCHEME[field]
-        return boxscore(scheme)
+        return utils._select(boxscore, scheme)
 
     def _find_boxscore_tables(self, boxscore):
         """
@@ -459,7 +573,7 @@ class Boxscore:
 
         Since each player generally has a couple of rows worth of stats (one
         for basic stats and another for advanced stats) on the boxscore page,
-        both rows should be combined into a single string object to easily
+        both rows should be combined into a single PyQuery object to easily
         query all fields from a single object instead of determining which row
         to pull metrics from.
 
@@ -492,11 +606,11 @@ class Boxscore:
                 continue
             name = self._find_player_name(row)
             try:
-                player_dict[player_id]['data'] += str(row).strip()
+                player_dict[player_id]['data'] += row
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
-                    'data': str(row).strip(),
+                    'data': row,
                     'team': home_or_away
                 }
         return player_dict
@@ -576,7 +690,7 @@ class Boxscore:
         away_players, home_players = self._instantiate_players(player_dict)
         return away_players, home_players
 
-    def _parse_game_data(self, uri):
+    def _parse_game_data(self, uri, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -593,6 +707,9 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '201802040nwe'.
+        lazy : boolean (optional)
+            Set to True to store the page and parse each field the first time
+            it is requested instead of parsing every field immediately.
         """
         boxscore = self._retrieve_html_page(uri)
         # If the boxscore is None, the game likely hasn't been played yet and
@@ -601,6 +718,37 @@ class Boxscore:
         if not boxscore:
             return
 
+        stats = utils._StatIndex(boxscore)
+        if lazy:
+            # Leave every unparsed field unset so it is parsed by __getattr__
+            # the first time it is requested.
+            fields = [field for field, value in self.__dict__.items()
+                      if value is None]
+            for field in fields:
+                delattr(self, field)
+            fields += ['_away_players', '_home_players', '_away_skaters',
+                       '_away_goalies']
+            self._deferred_fields = set(fields)
+            self._deferred_data = (boxscore, stats)
+            return
+        self._parse_fields(boxscore, stats, list(self.__dict__))
+        self._parse_skater_and_goalie_counts(boxscore)
+        self._parse_game_date_and_location(boxscore)
+        self._away_players, self._home_players = self._find_players(boxscore)
+
+    def _parse_fields(self, boxscore, stats, fields):
+        """
+        Parse the requested fields from the boxscore page.
+
+        Parameters
+        ----------
+        boxscore : PyQuery object
+            A PyQuery object containing all of the HTML data from the boxscore.
+        stats : _StatIndex
+            An index of the boxscore page's stats tables.
+        fields : list
+            A list of the attribute names to parse, such as '_home_points'.
+        """
         fields_to_special_parse = [
             'away_even_strength_assists',
             'away_power_play_assists',
@@ -618,7 +766,7 @@ class Boxscore:
             'home_shutout'
         ]
 
-        for field in self.__dict__:
+        for field in fields:
             # Remove the '_' from the name
             short_field = str(field)[1:]
             if short_field == 'winner' or \
@@ -641,25 +789,35 @@ class Boxscore:
                 continue
             if short_field in fields_to_special_parse:
                 scheme = BOXSCORE_SCHEME[short_field]
-                value = [i.text() for i in boxscore(scheme).items()]
+                value = [i.text() for i in
+                         utils._select(boxscore, scheme).items()]
                 setattr(self, field, value)
                 continue
             index = 0
             if short_field in BOXSCORE_ELEMENT_INDEX.keys():
                 index = BOXSCORE_ELEMENT_INDEX[short_field]
             value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
+                                       stats,
                                        short_field,
                                        index)
             setattr(self, field, value)
 
-        self._away_skaters = len(boxscore(BOXSCORE_SCHEME['away_skaters']))
-        num_away_goalies = boxscore(BOXSCORE_SCHEME['away_goalies']).items()
+    def _parse_skater_and_goalie_counts(self, boxscore):
+        """
+        Find the number of skaters and goalies on the away team.
+
+        Parameters
+        ----------
+        boxscore : PyQuery object
+            A PyQuery object containing all of the HTML data from the boxscore.
+        """
+        self._away_skaters = len(
+            utils._select(boxscore, BOXSCORE_SCHEME['away_skaters']))
+        num_away_goalies = utils._select(
+            boxscore, BOXSCORE_SCHEME['away_goalies']).items()
         # Skip the first element as it is dedicated to skaters and not goalies.
         next(num_away_goalies)
         self._away_goalies = len(next(num_away_goalies)('tbody tr'))
-        self._parse_game_date_and_location(boxscore)
-        self._away_players, self._home_players = self._find_players(boxscore)
 
     @property
     def dataframe(self):
@@ -1104,11 +1262,51 @@ class Boxscores:
         boxscores specified in the 'end_date' parameter will be pulled. If left
         empty, or if 'end_date' is prior to 'date', only the games from the day
         specified in the 'date' parameter will be saved.
+    workers : int (optional)
+        Optionally specify the number of days to download at once when
+        searching a range of dates. If left empty, each day is downloaded in
+        turn. Results are always saved in date order.
     """
-    def __init__(self, date, end_date=None):
+    def __init__(self, date, end_date=None, workers=None):
         self._boxscores = {}
 
-        self._find_games(date, end_date)
+        self._find_games(date, end_date, workers)
+
+    @classmethod
+    def iter_games(cls, date, end_date=None, workers=None):
+        """
+        Iterate over the games played on every day in a range.
+
+        Rather than saving the games for the entire range before returning,
+        as creating a Boxscores instance does, each day's games are yielded
+        as soon as that day's page is parsed. This keeps memory constant
+        while covering several seasons at once. To resume an interrupted
+        run, pass the day after the last one which was processed as 'date'.
+
+        Parameters
+        ----------
+        date : datetime object
+            The first day to search for any matches. The month, day, and year
+            are required for the search, but time is not factored into the
+            search.
+        end_date : datetime object (optional)
+            Optionally specify the last day to search. If left empty, or if
+            'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be yielded.
+        workers : int (optional)
+            Optionally specify the number of days to download at once. If
+            left empty, each day is downloaded in turn.
+
+        Yields
+        ------
+        tuple
+            A tuple of the day as a string in the 'MM-DD-YYYY' format and a
+            ``list`` of every game played on that day, each in the same format
+            as the 'games' property.
+        """
+        # None of the parsing helpers depend on the games which were already
+        # found, so an empty instance is used to parse each day.
+        return cls.__new__(cls)._iter_games(date, end_date, workers)
 
     @property
     def games(self):
@@ -1187,7 +1385,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1408,7 +1606,7 @@ class Boxscores:
             all_boxscores.append(game_info)
         return all_boxscores
 
-    def _find_games(self, date, end_date):
+    def _find_games(self, date, end_date, workers=None):
         """
         Retrieve all major games played on a given day.
 
@@ -1430,18 +1628,62 @@ class Boxscores:
             be pulled. If left empty, or if 'end_date' is prior to 'date', only
             the games from the day specified in the 'date' parameter will be
             saved.
+        workers : int (optional)
+            Optionally specify the number of days to download at once. If
+            left empty, each day is downloaded in turn.
+        """
+        for timestamp, boxscores in self._iter_games(date, end_date, workers):
+            self._boxscores[timestamp] = boxscores
+
+    def _iter_games(self, date, end_date, workers=None):
+        """
+        Retrieve all major games played on each day in a range.
+
+        Builds a URL for every requested day and downloads the HTML contents
+        before parsing any and all games played during that day. Each day's
+        games are yielded as soon as its page is parsed, so only the pages
+        which are downloaded ahead of the current day are held in memory.
+
+        Parameters
+        ----------
+        date : datetime object
+            The first day to search for any matches.
+        end_date : datetime object (optional)
+            Optionally specify the last day to search. If left empty, or if
+            'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be found.
+        workers : int (optional)
+            Optionally specify the number of days to download at once. If
+            left empty, each day is downloaded in turn.
+
+        Yields
+        ------
+        tuple
+            A tuple of the day as a string in the 'MM-DD-YYYY' format and a
+            ``list`` of dictionaries for every game played on that day, in
+            date order.
         """
         # Set the end date to the start date if the end date is before the
         # start date.
         if not end_date or date > end_date:
             end_date = date
+        dates = []
         date_step = date
         while date_step <= end_date:
-            url = self._create_url(date_step)
-            page = self._get_requested_page(url)
+            dates.append(date_step)
+            date_step += timedelta(days=1)
+        urls = [self._create_url(date_step) for date_step in dates]
+        if workers and workers > 1 and len(urls) > 1:
+            pages = utils._iter_pages(urls, workers)
+        else:
+            pages = ((url, None) for url in urls)
+        # Parse the downloaded pages in date order so the days are yielded in
+        # the same order regardless of which download finished first.
+        for date_step, (url, body) in zip(dates, pages):
+            preloaded = {url: body} if body is not None else {}
+            with utils._preloaded_pages(preloaded):
+                page = self._get_requested_page(url)
             games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
             timestamp = '%s-%s-%s' % (date_step.month, date_step.day,
                                       date_step.year)
-            self._boxscores[timestamp] = boxscores
-            date_step += timedelta(days=1)
+            yield timestamp, self._extract_game_info(games)
@@ -1,8 +1,33 @@
+import codecs
+import hashlib
+import io
+import json
+import numpy as np
+import os
+import pandas as pd
+import pickle
+import random
 import re
 import requests
-from datetime import datetime
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from itertools import islice
+from lxml import etree, html as lxml_html
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
+from pyquery.cssselectpatch import JQueryTranslator
+from pyquery.text import extract_text
+from requests.adapters import HTTPAdapter
+from urllib.error import HTTPError
+from urllib.parse import urlparse
 
 
 # {
@@ -23,50 +48,1351 @@ SEASON_START_MONTH = {
     'nhl': {'start': 10, 'wrap': True}
 }
 
+# The maximum number of keep-alive connections held open for a single host.
+# Requests beyond this limit still succeed, but the extra connections are
+# discarded once the response is read instead of being reused.
+POOL_MAXSIZE = 10
+
+# {
+#   host: requests.Session instance which is shared by every request sent to
+#         the host, such as 'www.basketball-reference.com'.
+# }
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# The default number of pages which are downloaded at once when pulling pages
+# in bulk. Matches the number of connections kept alive per host so every
+# concurrent request can reuse an open connection.
+MAX_CONCURRENT_REQUESTS = POOL_MAXSIZE
+
+# The maximum number of times a request is retried after the server responds
+# with one of the RETRY_STATUS_CODES before the error is raised.
+MAX_RETRIES = 5
+RETRY_STATUS_CODES = (429, 503)
+
+# The delay in seconds before the first retry when the server doesn't send a
+# Retry-After header. The delay doubles with every retry, up to
+# RETRY_MAX_DELAY seconds, and is randomized so concurrent requests which were
+# throttled together don't retry together.
+RETRY_BASE_DELAY = 2
+RETRY_MAX_DELAY = 5 * 60
+
+# The (requests per second, burst) limit applied to every host, or None if
+# requests are only slowed down once the server starts throttling them.
+_rate_limit = None
+
+# {
+#   host: _TokenBucket instance which every request sent to the host waits
+#         on, such as 'www.basketball-reference.com'.
+# }
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+# Holds pages which were already downloaded in bulk and should be returned to
+# the current thread instead of being requested again.
+_thread_state = threading.local()
+
+# Held while a lazily parsed instance parses one of its deferred fields, so a
+# field requested by several threads at once is only parsed once. Reentrant as
+# parsing one field can request another.
+_deferred_lock = threading.RLock()
+
+# {
+#   URL of a page for the season based on the current date: a string of the
+#         season's year to use for that page when no year is requested, which
+#         is the previous season if the page doesn't exist yet.
+# }
+_default_seasons = {}
+
+# The default number of seconds a page from an ongoing season is served from
+# the on-disk cache before it is downloaded again. Pages from completed
+# seasons and games never expire.
+CACHE_TTL = 60 * 60
+
+# The default maximum size of the on-disk cache in bytes. Once exceeded, the
+# least recently used pages are evicted until the cache fits again.
+CACHE_MAX_SIZE = 500 * 1024 * 1024
+
+# Parses the raw bytes of every downloaded page. Bodies are always UTF-8, see
+# _response_body, which takes precedence over any charset the page declares.
+HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# Finds the charset parameter of a Content-Type header.
+CHARSET = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# The maximum number of pages from ongoing seasons kept in memory along with
+# the validators needed to ask the server whether they have changed. Pages
+# which haven't changed are reused without being downloaded or parsed again.
+REVALIDATION_CACHE_SIZE = 64
+
+# {
+#   url: dictionary of the 'etag' and 'last_modified' validators the page was
+#        sent with, the page's 'body', and the parsed 'document' and
+#        'uncommented' document once the page has been pulled. Ordered from
+#        the least to the most recently used.
+# }
+_revalidation_cache = OrderedDict()
+_revalidation_lock = threading.Lock()
+
+# Finds the date a game was played in a boxscore URI, such as '201710310LAL',
+# 'BOS/BOS201806070', or '2018-01-08-21-purdue'.
+BOXSCORE_DATE = re.compile(r'(\d{4})-?(\d{2})-?(\d{2})')
+
+# The maximum number of parsed boxscores of completed games kept alive after
+# every caller dropped them. Large enough to hold every game of a season, so
+# walking the schedule of every team only downloads each game once, even
+# though it is played by two of them. Set to 0 to only share boxscores which
+# are still in use elsewhere.
+BOXSCORE_CACHE_SIZE = 2500
+
+# {
+#   (Boxscore class, boxscore URI): Boxscore instance for a completed game
+#         which was already parsed. Entries are only weakly referenced, so a
+#         boxscore is shared while any caller still holds it and is released
+#         along with the last reference.
+# }
+_boxscore_registry = weakref.WeakValueDictionary()
+_boxscore_registry_lock = threading.Lock()
+
+# {
+#   (Boxscore class, boxscore URI): the same Boxscore instance as in the
+#         registry for up to BOXSCORE_CACHE_SIZE of the most recently used
+#         completed games, keeping them alive once callers drop them. Ordered
+#         from the least to the most recently used.
+# }
+_boxscore_cache = OrderedDict()
+
+
+class _PageCache:
+    """
+    A size-capped on-disk cache of raw page bodies keyed by URL.
+
+    Each page is stored as a pair of files in the cache directory: the body
+    itself and a small JSON file with the URL, the time the entry expires,
+    and whether the body was stored as raw bytes or as text.
+    Entries for historical pages never expire. The modification time of the
+    body is refreshed on every hit and is used to find the least recently used
+    pages once the cache grows beyond its maximum size.
+
+    Parameters
+    ----------
+    directory : string
+        The path to the directory to store pages in. The directory is created
+        if it doesn't exist.
+    max_size : int
+        The maximum combined size of all cached files in bytes.
+    ttl : int
+        The number of seconds a non-historical page is valid for.
+    """
+    def __init__(self, directory, max_size, ttl):
+        self.directory = directory
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(os.path.getsize(os.path.join(directory, name))
+                         for name in os.listdir(directory))
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return '%s.html' % base, '%s.json' % base
+
+    def _write(self, path, contents):
+        temp_path = '%s.%s.tmp' % (path, threading.get_ident())
+        if isinstance(contents, str):
+            contents = contents.encode('utf-8')
+        with open(temp_path, 'wb') as temp_file:
+            temp_file.write(contents)
+        os.replace(temp_path, path)
+
+    def _read_body(self, path, meta):
+        with open(path, 'rb') as body_file:
+            body = body_file.read()
+        if meta.get('binary'):
+            return body
+        return body.decode('utf-8')
+
+    def _remove(self, path):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        self._size -= size
+
+    def get(self, url):
+        """
+        Return the cached body for a URL.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+
+        Returns
+        -------
+        bytes or string
+            The page body if a valid entry exists, otherwise None.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            if meta['expires'] and meta['expires'] < time.time():
+                return None
+            body = self._read_body(body_path, meta)
+            os.utime(body_path, None)
+        except (OSError, ValueError, KeyError):
+            return None
+        return body
+
+    def get_stale(self, url):
+        """
+        Return a cached page which can be revalidated, even if it expired.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the requested page.
+
+        Returns
+        -------
+        tuple
+            A tuple of the page body, its ETag, and its Last-Modified date if
+            the page was stored with either validator, otherwise None.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            etag = meta.get('etag')
+            last_modified = meta.get('last_modified')
+            if not etag and not last_modified:
+                return None
+            body = self._read_body(body_path, meta)
+        except (OSError, ValueError, AttributeError):
+            return None
+        return body, etag, last_modified
+
+    def set(self, url, body, historical=False, etag=None,
+            last_modified=None):
+        """
+        Store a page body in the cache.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the page.
+        body : bytes or string
+            The contents of the page.
+        historical : boolean (optional)
+            Set to True if the page can no longer change, such as a completed
+            game or a past season, to store it without an expiration.
+        etag : string (optional)
+            The ETag header the page was sent with, if any.
+        last_modified : string (optional)
+            The Last-Modified header the page was sent with, if any.
+        """
+        body_path, meta_path = self._paths(url)
+        expires = None
+        if not historical:
+            expires = time.time() + self.ttl
+        meta = json.dumps({'url': url, 'expires': expires, 'etag': etag,
+                           'last_modified': last_modified,
+                           'binary': isinstance(body, bytes)})
+        with self._lock:
+            self._remove(body_path)
+            self._remove(meta_path)
+            self._write(body_path, body)
+            self._write(meta_path, meta)
+            self._size += os.path.getsize(body_path) + \
+                os.path.getsize(meta_path)
+            if self._size > self.max_size:
+                self._evict()
+
+    def delete(self, url):
+        """
+        Remove a page from the cache.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the page to remove.
+        """
+        with self._lock:
+            for path in self._paths(url):
+                self._remove(path)
+
+    def _evict(self):
+        """
+        Remove entries until the cache fits within its maximum size.
+
+        Expired entries are removed first as they would be downloaded again on
+        their next request anyways, followed by the least recently used pages.
+        """
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = '%s.html' % meta_path[:-len('.json')]
+            try:
+                with open(meta_path, encoding='utf-8') as meta_file:
+                    expires = json.load(meta_file)['expires']
+                last_used = os.path.getmtime(body_path)
+            except (OSError, ValueError, KeyError):
+                expires, last_used = now, 0
+            expired = bool(expires) and expires < now
+            entries.append((not expired, last_used, body_path, meta_path))
+        for _, _, body_path, meta_path in sorted(entries):
+            if self._size <= self.max_size:
+                break
+            self._remove(body_path)
+            self._remove(meta_path)
+
+
+# The on-disk page cache, which is disabled unless enable_cache is called.
+_page_cache = None
+
+
+def enable_cache(directory, max_size=CACHE_MAX_SIZE, ttl=CACHE_TTL):
+    """
+    Store downloaded pages in an on-disk cache.
+
+    Once enabled, every page is first looked up in the cache before being
+    downloaded. Pages which can no longer change, such as boxscores for
+    completed games or stats from past seasons, are kept indefinitely while
+    pages for the ongoing season expire after 'ttl' seconds. The least
+    recently used pages are evicted once the cache exceeds 'max_size' bytes.
+
+    Parameters
+    ----------
+    directory : string
+        The path to the directory to store pages in.
+    max_size : int (optional)
+        The maximum size of the cache in bytes. Defaults to 500 MB.
+    ttl : int (optional)
+        The number of seconds pages from the ongoing season are cached for.
+        Defaults to one hour.
+    """
+    global _page_cache
+    _page_cache = _PageCache(directory, max_size, ttl)
+
+
+def disable_cache():
+    """
+    Stop using the on-disk cache. Pages which were already stored are left on
+    disk and will be used again if the cache is re-enabled.
+    """
+    global _page_cache
+    _page_cache = None
+
+
+class _TokenBucket:
+    """
+    Limit the rate of requests sent to a single host.
+
+    The bucket holds up to 'capacity' tokens and is refilled at 'rate' tokens
+    per second. Every request takes a token, waiting until one is available
+    once the bucket is empty. Requests can also be paused entirely, such as
+    when the server asks clients to slow down.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests allowed per second, or None to not limit the
+        rate of requests.
+    capacity : int
+        The maximum number of requests which can be sent at once after the
+        host has been idle.
+    """
+    def __init__(self, rate=None, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait until a request can be sent to the host.
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._paused_until - now, 0)
+            if self.rate:
+                # Tokens are reserved immediately, even if it takes a while
+                # until they are refilled, so concurrent callers queue up
+                # behind each other instead of all waking up at once.
+                self._tokens = min(self.capacity, self._tokens +
+                                   (now - self._updated) * self.rate)
+                self._updated = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self.rate)
+        if delay:
+            time.sleep(delay)
+
+    def pause(self, delay):
+        """
+        Hold every request to the host for the next 'delay' seconds.
+
+        Parameters
+        ----------
+        delay : float
+            The number of seconds to wait before sending the next request.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until,
+                                     time.monotonic() + delay)
+
+
+def enable_rate_limit(requests_per_second, burst=1):
+    """
+    Limit the number of requests sent to each sports-reference site.
+
+    The sports-reference sites temporarily block clients which send too many
+    requests, so long-running jobs get through more pages by staying below
+    the limit than by being throttled. Every request waits for its turn,
+    regardless of how many threads are downloading pages. Requests which are
+    throttled anyway are always retried after the delay the server asks for.
+
+    Parameters
+    ----------
+    requests_per_second : float
+        The number of requests sent to a single host per second.
+    burst : int (optional)
+        The number of requests which can be sent at once after a host has
+        been idle. Defaults to 1.
+    """
+    global _rate_limit
+    with _rate_limiters_lock:
+        _rate_limit = (requests_per_second, burst)
+        for limiter in _rate_limiters.values():
+            limiter.rate = requests_per_second
+            limiter.capacity = burst
+
+
+def disable_rate_limit():
+    """
+    Stop limiting the number of requests sent to each site. Requests are
+    still retried when the server throttles them.
+    """
+    global _rate_limit
+    with _rate_limiters_lock:
+        _rate_limit = None
+        for limiter in _rate_limiters.values():
+            limiter.rate = None
+
+
+def _get_rate_limiter(url):
+    """
+    Return the rate limiter for the URL's host.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to request.
+
+    Returns
+    -------
+    _TokenBucket
+        The token bucket shared by every request sent to the host.
+    """
+    host = urlparse(url).netloc
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(host)
+        if not limiter:
+            limiter = _TokenBucket(*(_rate_limit or ()))
+            _rate_limiters[host] = limiter
+    return limiter
+
+
+def _retry_delay(response, attempt):
+    """
+    Determine how long to wait before retrying a throttled request.
+
+    The server's Retry-After header is honored when it is present, either as
+    a number of seconds or as a date. Otherwise, the delay grows
+    exponentially with every attempt and is randomized between half and the
+    full delay.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response with the throttled status code.
+    attempt : int
+        The number of retries which were already sent for the request.
+
+    Returns
+    -------
+    float
+        The number of seconds to wait before retrying the request.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+            return max((retry_date -
+                        datetime.now(timezone.utc)).total_seconds(), 0)
+        except (TypeError, ValueError):
+            pass
+    delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+    return random.uniform(delay / 2, delay)
+
 
 def _todays_date():
     """
-    Get today's date.
+    Get today's date.
+
+    Returns the current date and time. In a standalone function to easily be
+    mocked in unit tests.
+
+    Returns
+    -------
+    datetime.datetime
+        The current date and time as a datetime object.
+    """
+    return datetime.now()
+
+
+def _get_session(url):
+    """
+    Return the shared session for the URL's host.
+
+    Every page on a sports-reference site is downloaded through a single
+    ``requests.Session`` per host, allowing the underlying TCP and TLS
+    connections to be kept alive and reused across requests instead of being
+    re-established for every page. The session is created the first time a
+    host is requested.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to request.
+
+    Returns
+    -------
+    requests.Session
+        The pooled session for the requested host.
+    """
+    host = urlparse(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if not session:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1,
+                                  pool_maxsize=POOL_MAXSIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[host] = session
+    return session
+
+
+def _request_page(url, headers=None):
+    """
+    Download the requested URL.
+
+    Send a GET request for the URL using the shared session for its host,
+    waiting for the host's rate limiter first. Requests which are throttled
+    by the server are retried up to MAX_RETRIES times, pausing every request
+    to the host in the meantime. Any other response outside of the 2xx range
+    raises an HTTPError, matching the behavior callers expect when a page
+    doesn't exist. The only exception is a 304 response to a conditional
+    request, which is returned as-is.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to download.
+    headers : dictionary (optional)
+        Additional headers to send with the request, such as the validators
+        of a conditional request.
+
+    Returns
+    -------
+    requests.Response
+        The response for the requested URL.
+
+    Raises
+    ------
+    HTTPError
+        If the server returns a non-2xx status code.
+    """
+    session = _get_session(url)
+    limiter = _get_rate_limiter(url)
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        if headers:
+            response = session.get(url, headers=headers)
+        else:
+            response = session.get(url)
+        throttled = response.status_code in RETRY_STATUS_CODES
+        if not throttled or attempt == MAX_RETRIES:
+            break
+        limiter.pause(_retry_delay(response, attempt))
+    if response.status_code == 304 and headers:
+        return response
+    if not 200 <= response.status_code < 300:
+        raise HTTPError(url, response.status_code,
+                        getattr(response, 'reason', None),
+                        getattr(response, 'headers', {}), None)
+    return response
+
+
+def _response_body(response):
+    """
+    Return the body of a response without decoding it to a string.
+
+    Decoding a page to a string only for lxml to encode it again while parsing
+    doubles the memory held for every page, so the raw bytes are kept instead.
+    Pages are parsed as UTF-8, which is what sports-reference sends, so only a
+    page which declares a different charset in its Content-Type header is
+    re-encoded. Responses without a raw body are returned as text.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response for a downloaded page.
+
+    Returns
+    -------
+    bytes or string
+        The page's HTML contents as UTF-8 encoded bytes, or as a string if the
+        response doesn't have a raw body.
+    """
+    content = getattr(response, 'content', None)
+    if not isinstance(content, bytes):
+        return response.text
+    headers = getattr(response, 'headers', None) or {}
+    match = CHARSET.search(headers.get('Content-Type', ''))
+    if match:
+        try:
+            encoding = codecs.lookup(match.group(1)).name
+        except LookupError:
+            encoding = 'utf-8'
+        if encoding != 'utf-8':
+            return content.decode(encoding, 'replace').encode('utf-8')
+    return content
+
+
+def _fetch_page(url, historical=False):
+    """
+    Return the contents of the requested URL.
+
+    Pages which were preloaded for the current thread with _preloaded_pages,
+    such as pages downloaded in bulk or while finding the default season, are
+    returned directly. If the on-disk cache is enabled and holds a valid copy
+    of the page, the cached contents are returned without sending a request.
+    Otherwise, the page is downloaded and stored in the cache when enabled.
+    Pages which were previously sent with an ETag or Last-Modified header are
+    requested conditionally, and the stored copy is reused if the server
+    reports that it hasn't changed.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to download.
+    historical : boolean (optional)
+        Set to True if the page can no longer change, such as a completed game
+        or a past season, which allows the page to be cached indefinitely.
+
+    Returns
+    -------
+    bytes or string
+        The page's HTML contents, generally as UTF-8 encoded bytes.
+
+    Raises
+    ------
+    HTTPError
+        If the server returns a non-2xx status code.
+    """
+    preloaded = getattr(_thread_state, 'pages', None)
+    if preloaded and url in preloaded:
+        body = preloaded[url]
+        if isinstance(body, HTTPError):
+            raise body
+        return body
+    cache = _page_cache
+    if cache:
+        body = cache.get(url)
+        if body is not None:
+            return body
+    stale = _stale_page(url, historical)
+    headers = {}
+    if stale:
+        body, etag, last_modified = stale
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    response = _request_page(url, headers)
+    if response.status_code != 304:
+        body = _response_body(response)
+        response_headers = getattr(response, 'headers', None) or {}
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+    if cache:
+        cache.set(url, body, historical, etag=etag,
+                  last_modified=last_modified)
+    if not historical and (etag or last_modified):
+        _remember_page(url, body, etag, last_modified)
+    return body
+
+
+def _stale_page(url, historical=False):
+    """
+    Find a previously downloaded copy of a page which can be revalidated.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to look up.
+    historical : boolean (optional)
+        Set to True if the page can no longer change. Historical pages are
+        never revalidated.
+
+    Returns
+    -------
+    tuple
+        A tuple of the page body, its ETag, and its Last-Modified date, or
+        None if no copy with validators exists.
+    """
+    if historical:
+        return None
+    with _revalidation_lock:
+        entry = _revalidation_cache.get(url)
+        if entry:
+            _revalidation_cache.move_to_end(url)
+            return entry['body'], entry['etag'], entry['last_modified']
+    if _page_cache:
+        return _page_cache.get_stale(url)
+    return None
+
+
+def _remember_page(url, body, etag, last_modified):
+    """
+    Keep a page from an ongoing season in memory for revalidation.
+
+    If the page is unchanged from the copy which is already kept, the entry
+    is left as-is so its parsed document can be reused.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the page's url.
+    body : string
+        The page's HTML contents.
+    etag : string
+        The ETag header the page was sent with, if any.
+    last_modified : string
+        The Last-Modified header the page was sent with, if any.
+    """
+    with _revalidation_lock:
+        entry = _revalidation_cache.get(url)
+        if not entry or entry['body'] is not body:
+            entry = {'body': body, 'document': None, 'uncommented': None}
+            _revalidation_cache[url] = entry
+        entry['etag'] = etag
+        entry['last_modified'] = last_modified
+        _revalidation_cache.move_to_end(url)
+        while len(_revalidation_cache) > REVALIDATION_CACHE_SIZE:
+            _revalidation_cache.popitem(last=False)
+
+
+def _discard_cached_page(url):
+    """
+    Remove a page from the on-disk cache if it is enabled.
+
+    Some sites return placeholder pages for content that doesn't exist yet
+    without an error status code. These pages shouldn't be served from the
+    cache once the real contents become available.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to remove.
+    """
+    if _page_cache:
+        _page_cache.delete(url)
+    with _revalidation_lock:
+        _revalidation_cache.pop(url, None)
+
+
+def _parse_page(body, uncomment=False):
+    """
+    Create a PyQuery object of a page's HTML contents.
+
+    Raw bytes are handed to lxml directly to be parsed as UTF-8, which skips
+    decoding the page to a string first.
+
+    Parameters
+    ----------
+    body : bytes or string
+        The page's HTML contents.
+    uncomment : boolean (optional)
+        Set to True to also include the contents of every HTML comment in the
+        document.
+
+    Returns
+    -------
+    PyQuery object
+        A queriable PyQuery object of the page's HTML contents.
+    """
+    if isinstance(body, bytes):
+        document = pq(lxml_html.fromstring(body, parser=HTML_PARSER))
+    else:
+        document = pq(body, parser='html')
+    if uncomment:
+        _uncomment_html(document)
+    return document
+
+
+def _pull_page(url, historical=False, uncomment=False):
+    """
+    Download the requested URL and return a PyQuery object of the contents.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to download.
+    historical : boolean (optional)
+        Set to True if the page can no longer change, such as a completed game
+        or a past season, which allows the page to be cached indefinitely.
+    uncomment : boolean (optional)
+        Set to True to include the contents of the HTML comments in the
+        document, which is where many of the stats tables are hidden.
+
+    Returns
+    -------
+    PyQuery object
+        A queriable PyQuery object of the page's HTML contents.
+
+    Raises
+    ------
+    HTTPError
+        If the server returns a non-2xx status code.
+    """
+    body = _fetch_page(url, historical)
+    with _revalidation_lock:
+        entry = _revalidation_cache.get(url)
+    if not entry or (entry['body'] is not body and entry['body'] != body):
+        return _parse_page(body, uncomment)
+    # The page hasn't changed since it was last pulled, so the document which
+    # was already parsed is reused. Documents with the comments included are
+    # kept separately so the plain document is never modified.
+    key = 'uncommented' if uncomment else 'document'
+    if entry.get(key) is None:
+        entry[key] = _parse_page(body, uncomment)
+    return entry[key]
+
+
+def _fetch_page_or_error(url, historical=False):
+    """
+    Return the contents of the requested URL or the error it raised.
+
+    Used by the bulk downloaders so a single missing page doesn't stop the
+    rest of the pages from being downloaded.
+
+    Parameters
+    ----------
+    url : string
+        A string representation of the url to download.
+    historical : boolean (optional)
+        Set to True if the page can no longer change, which allows the page
+        to be cached indefinitely.
+
+    Returns
+    -------
+    bytes, string, or HTTPError
+        The page's HTML contents, or the HTTPError raised while downloading
+        the page.
+    """
+    try:
+        return _fetch_page(url, historical)
+    except HTTPError as error:
+        return error
+
+
+def _fetch_pages(urls, concurrency=MAX_CONCURRENT_REQUESTS, historical=False):
+    """
+    Download several pages concurrently and wait for all of them to finish.
+
+    Every URL is downloaded with _fetch_page on a pool of 'concurrency'
+    threads, so no more than 'concurrency' requests are in flight at once.
+    No event loop is involved, so the pages can be downloaded from within an
+    application which is already running one, such as a Jupyter notebook.
+
+    Parameters
+    ----------
+    urls : list
+        A list of the string URLs to download.
+    concurrency : int (optional)
+        The maximum number of pages to download at once.
+    historical : boolean or list (optional)
+        Set to True if the pages can no longer change, such as completed
+        games, which allows the pages to be cached indefinitely. Pass a list
+        with a boolean for each URL if only some of the pages can no longer
+        change.
+
+    Returns
+    -------
+    dictionary
+        A dictionary where each key is a requested URL and each value is
+        either the page's HTML contents or the HTTPError raised while
+        downloading the page.
+    """
+    urls = list(urls)
+    if not urls:
+        return {}
+    if isinstance(historical, bool):
+        historical = [historical] * len(urls)
+    workers = max(1, min(concurrency, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = executor.map(_fetch_page_or_error, urls, historical)
+        return dict(zip(urls, pages))
+
+
+def _pull_pages(urls, historical=False):
+    """
+    Download several pages concurrently and create a PyQuery object for each.
+
+    Used when a single object is built from several independent pages, such
+    as the standings and the team stats for a season, so every page is
+    requested at once instead of one after another. Pages which are already
+    available to the current thread, such as the page downloaded while
+    finding the default season, aren't requested again.
+
+    Parameters
+    ----------
+    urls : list
+        A list of the string URLs to download.
+    historical : boolean (optional)
+        Set to True if the pages can no longer change, such as stats from a
+        past season, which allows the pages to be cached indefinitely.
+
+    Returns
+    -------
+    list
+        A list of PyQuery objects in the same order as the requested URLs.
+
+    Raises
+    ------
+    HTTPError
+        If the server returns a non-2xx status code for any of the pages.
+    """
+    available = set(getattr(_thread_state, 'pages', None) or ())
+    remaining = [url for url in urls if url not in available]
+    pages = {}
+    if len(remaining) > 1:
+        pages = _fetch_pages(remaining, historical=historical)
+    with _preloaded_pages(pages):
+        return [_pull_page(url, historical) for url in urls]
+
+
+def _iter_pages(urls, concurrency=MAX_CONCURRENT_REQUESTS, historical=False):
+    """
+    Download several pages concurrently and yield each one in order.
+
+    Unlike _fetch_pages, the pages are handed back one at a time as soon as
+    the next page in order has finished, so the caller can parse a page while
+    the following ones are still being downloaded. No more than 'concurrency'
+    pages are downloaded ahead of the caller, and any downloads which haven't
+    started yet are cancelled if the caller stops early.
+
+    Parameters
+    ----------
+    urls : list
+        A list of the string URLs to download.
+    concurrency : int (optional)
+        The maximum number of pages to download at once.
+    historical : boolean (optional)
+        Set to True if the pages can no longer change, such as completed
+        games, which allows the pages to be cached indefinitely.
+
+    Yields
+    ------
+    tuple
+        A tuple of the URL and either the page's HTML contents or the
+        HTTPError raised while downloading the page, in the same order as the
+        requested URLs.
+    """
+    def fetch(url):
+        return _fetch_page_or_error(url, historical)
+
+    concurrency = max(1, concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    urls = iter(urls)
+    try:
+        for url in islice(urls, concurrency):
+            pending.append((url, executor.submit(fetch, url)))
+        while pending:
+            url, future = pending.popleft()
+            page = future.result()
+            for next_url in islice(urls, 1):
+                pending.append((next_url, executor.submit(fetch, next_url)))
+            yield url, page
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+@contextmanager
+def _preloaded_pages(pages):
+    """
+    Serve already downloaded pages to the current thread.
 
-    Returns the current date and time. In a standalone function to easily be
-    mocked in unit tests.
+    While the context is active, any request made by the current thread for
+    one of the given URLs returns the preloaded contents (or raises the stored
+    HTTPError) instead of downloading the page again. This allows objects to
+    be built with their regular constructors after their pages were pulled in
+    bulk.
+
+    Parameters
+    ----------
+    pages : dictionary
+        A dictionary as returned by _fetch_pages where each key is a URL and
+        each value is the page's contents or an HTTPError.
+    """
+    previous = getattr(_thread_state, 'pages', None)
+    combined = dict(previous or {})
+    combined.update(pages)
+    _thread_state.pages = combined
+    try:
+        yield
+    finally:
+        _thread_state.pages = previous
+
+
+class _RecordPickler(pickle.Pickler):
+    """
+    Pickle parsed objects along with the HTML they still reference.
+
+    Parsed objects hold on to a few PyQuery objects and lxml elements which
+    can't be pickled directly, so they are stored as HTML and parsed again
+    when the record is loaded. Errors raised while downloading a page are
+    stored by their arguments for the same reason.
+    """
+    def persistent_id(self, obj):
+        if isinstance(obj, pq):
+            return ('pyquery', [_dump_element(element) for element in obj])
+        if isinstance(obj, etree._Element):
+            return ('element', _dump_element(obj))
+        if isinstance(obj, HTTPError):
+            return ('http_error', (obj.url, obj.code, obj.msg,
+                                   dict(obj.hdrs or {})))
+        return None
+
+
+class _RecordUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        kind, value = pid
+        if kind == 'pyquery':
+            return pq([_load_element(element) for element in value])
+        if kind == 'element':
+            return _load_element(value)
+        url, code, msg, hdrs = value
+        return HTTPError(url, code, msg, hdrs, None)
+
+
+def _dump_element(element):
+    if isinstance(element, str):
+        return (None, str(element))
+    is_html = isinstance(element, lxml_html.HtmlMixin)
+    # Serializing as XML keeps elements such as table rows intact when they
+    # are parsed on their own again.
+    return (is_html, etree.tostring(element, encoding='unicode',
+                                    method='xml', with_tail=False))
+
+
+def _load_element(value):
+    is_html, markup = value
+    if is_html is None:
+        return markup
+    if is_html:
+        return etree.fromstring(markup, lxml_html.xhtml_parser)
+    return etree.fromstring(markup)
+
+
+def _dump_record(obj):
+    buffer = io.BytesIO()
+    _RecordPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+def _load_record(record):
+    return _RecordUnpickler(io.BytesIO(record)).load()
+
+
+def _build_record(payload):
+    """
+    Build an object from preloaded pages and return its attributes.
+
+    Runs in a worker process. The class, its arguments, and the pages it
+    needs are passed in as a record, and the attributes of the new instance
+    are returned as a record so only plain data crosses the process boundary.
+
+    Parameters
+    ----------
+    payload : bytes
+        A record of a tuple of the class to build, a tuple of the arguments
+        to create it with, and a dictionary of the pages it requests as
+        returned by _fetch_pages.
 
     Returns
     -------
-    datetime.datetime
-        The current date and time as a datetime object.
+    bytes
+        A record of the instance's attribute dictionary.
     """
-    return datetime.now()
+    cls, args, pages = _load_record(payload)
+    with _preloaded_pages(pages):
+        instance = cls(*args)
+    return _dump_record(instance.__dict__)
 
 
-def _url_exists(url):
+def _build_in_processes(cls, items, processes):
     """
-    Determine if a URL is valid and exists.
+    Parse downloaded pages into objects on a pool of processes.
 
-    Not every URL that is provided is valid and exists, such as requesting
-    stats for a season that hasn't yet begun. In this case, the URL needs to be
-    validated prior to continuing any code to ensure no unhandled exceptions
-    occur.
+    Parsing HTML is CPU-bound and can't be spread across threads, so each
+    object is built by its regular constructor in a worker process instead.
+    The workers only receive the raw pages and send back the attributes of
+    every instance, which are then restored onto a new instance here without
+    parsing anything again. Items are handed to the workers as they are
+    taken from 'items', so pages which are still being downloaded can be
+    parsed as soon as they arrive, and only a few items per process are
+    queued up at once.
 
     Parameters
     ----------
-    url : string
-        A string representation of the url to check.
+    cls : class
+        The class to build, such as ``Boxscore``.
+    items : iterable
+        An iterable of tuples for each instance to build, where the first
+        element is a tuple of the arguments to pass to the class and the
+        second is a dictionary of the pages the instance requests, as returned
+        by _fetch_pages.
+    processes : int
+        The number of worker processes to parse with.
+
+    Yields
+    ------
+    object
+        An instance of the class for each item, in the same order as the
+        items.
+    """
+    processes = max(1, processes)
+    # Keep every worker busy while the next items are being prepared without
+    # holding the pages for the whole batch in memory.
+    queued = processes * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            for args, pages in items:
+                payload = _dump_record((cls, args, pages))
+                pending.append(executor.submit(_build_record, payload))
+                if len(pending) >= queued:
+                    yield _restore_record(cls, pending.popleft().result())
+            while pending:
+                yield _restore_record(cls, pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _restore_record(cls, record):
+    """
+    Create an instance of a class from the attributes built by a worker.
+
+    Parameters
+    ----------
+    cls : class
+        The class of the instance, such as ``Boxscore``.
+    record : bytes
+        A record of the instance's attribute dictionary, as returned by
+        _build_record.
 
     Returns
     -------
-    bool
-        Evaluates to True when the URL exists and is valid, otherwise returns
-        False.
+    object
+        An instance of the class with the attributes restored.
+    """
+    instance = cls.__new__(cls)
+    instance.__dict__.update(_load_record(record))
+    return instance
+
+
+def _is_completed_game(uri):
+    """
+    Determine whether a game has been completed based on its boxscore URI.
+
+    Every boxscore URI includes the date the game was played. Once that day
+    has passed, the game is final and its boxscore can no longer change.
+
+    Parameters
+    ----------
+    uri : string
+        The relative link to the boxscore HTML page, such as '201710310LAL'.
+
+    Returns
+    -------
+    boolean
+        Evaluates to True if the game was played before today. Returns False
+        if the game is today or later, or if the URI has no date.
     """
+    match = BOXSCORE_DATE.search(uri or '')
+    if not match:
+        return False
     try:
-        response = requests.head(url)
-        if response.status_code < 400:
-            return True
-        else:
-            return False
-    except Exception:
+        played = date(*[int(value) for value in match.groups()])
+    except ValueError:
         return False
+    today = _todays_date()
+    return played < date(today.year, today.month, today.day)
+
+
+def _registered_boxscores(boxscore_class, uris):
+    """
+    Find the boxscores which were already parsed and are still shared.
+
+    Parameters
+    ----------
+    boxscore_class : class
+        The league's Boxscore class.
+    uris : list
+        A list of the relative links to the requested boxscores.
+
+    Returns
+    -------
+    dict
+        A dictionary of the Boxscore instances which were found, keyed by
+        their URI.
+    """
+    found = {}
+    with _boxscore_registry_lock:
+        for uri in uris:
+            boxscore = _boxscore_registry.get((boxscore_class, uri))
+            if boxscore is not None:
+                _hold_boxscore((boxscore_class, uri), boxscore)
+                found[uri] = boxscore
+    return found
+
+
+def _hold_boxscore(key, boxscore):
+    """
+    Keep a shared boxscore alive as one of the most recently used.
+
+    The least recently used boxscores are dropped once more than
+    BOXSCORE_CACHE_SIZE are held. They stay shared through the registry for
+    as long as a caller still holds them. Must be called with the registry
+    lock held.
+
+    Parameters
+    ----------
+    key : tuple
+        A tuple of the league's Boxscore class and the boxscore URI.
+    boxscore : Boxscore instance
+        The parsed boxscore of a completed game.
+    """
+    _boxscore_cache[key] = boxscore
+    _boxscore_cache.move_to_end(key)
+    while len(_boxscore_cache) > max(BOXSCORE_CACHE_SIZE, 0):
+        _boxscore_cache.popitem(last=False)
+
+
+def _register_boxscores(boxscore_class, boxscores):
+    """
+    Share newly parsed boxscores with the rest of the process.
+
+    Only completed games are shared, as the boxscore of a game which is still
+    in progress or hasn't started yet changes. Boxscores whose page couldn't
+    be downloaded are left out so they are requested again the next time.
+
+    Parameters
+    ----------
+    boxscore_class : class
+        The league's Boxscore class.
+    boxscores : dict
+        A dictionary of the newly created Boxscore instances, keyed by their
+        URI.
+    """
+    with _boxscore_registry_lock:
+        for uri, boxscore in boxscores.items():
+            if not _is_completed_game(uri) or boxscore._date is None:
+                continue
+            _boxscore_registry[(boxscore_class, uri)] = boxscore
+            _hold_boxscore((boxscore_class, uri), boxscore)
+
+
+def _get_boxscore(boxscore_class, uri):
+    """
+    Return the shared Boxscore instance for a game.
+
+    The boxscore is only downloaded and parsed if it wasn't already, such as
+    through the schedule of the opposing team.
+
+    Parameters
+    ----------
+    boxscore_class : class
+        The league's Boxscore class.
+    uri : string
+        The relative link to the boxscore HTML page.
+
+    Returns
+    -------
+    Boxscore instance
+        The parsed boxscore for the requested game.
+    """
+    boxscore = _registered_boxscores(boxscore_class, [uri]).get(uri)
+    if boxscore is None:
+        boxscore = boxscore_class(uri)
+        _register_boxscores(boxscore_class, {uri: boxscore})
+    return boxscore
+
+
+def _new_boxscore_uris(schedules, ingested):
+    """
+    Find the games which were completed but haven't been ingested yet.
+
+    Games which haven't been played yet don't have any stats and are skipped.
+    Every game is only included once, even if it appears in several of the
+    schedules, such as once for each of the two teams.
+
+    Parameters
+    ----------
+    schedules : list
+        A list of Schedule instances to compare against the ingested games.
+    ingested : set
+        A container of the 'boxscore_index' values of every game which was
+        already stored.
+
+    Returns
+    -------
+    list
+        A list of the 'boxscore_index' values of the new games in the order
+        they appear in the schedules.
+    """
+    uris = []
+    found = set()
+    for schedule in schedules:
+        for game in schedule:
+            uri = game._boxscore
+            if not uri or uri in found or uri in ingested or \
+               game._dataframe_fields is None:
+                continue
+            found.add(uri)
+            uris.append(uri)
+    return uris
 
 
 def _find_year_for_season(league):
@@ -121,6 +1447,82 @@ def _find_year_for_season(league):
         return today.year
 
 
+def _is_past_season(league, year):
+    """
+    Determine if the requested year refers to a completed season.
+
+    Pages for completed seasons no longer change and can be cached
+    indefinitely.
+
+    Parameters
+    ----------
+    league : string
+        A string pertaining to the league start information as listed in
+        SEASON_START_MONTH (ie. 'mlb', 'nba', 'nfl', etc.).
+    year : string
+        The requested season's year.
+
+    Returns
+    -------
+    bool
+        Evaluates to True when the season is prior to the current season.
+    """
+    try:
+        return int(year) < _find_year_for_season(league)
+    except (TypeError, ValueError):
+        return False
+
+
+def _find_default_season(league, url_for_year):
+    """
+    Return the season's year to use when no year is requested.
+
+    The season is first determined by the current date. If the page for that
+    season doesn't exist yet, as is the case right before a new season begins,
+    the previous season is used instead. A single GET request is sent for each
+    season which is tried, and the downloaded page is handed back to the
+    caller so it can be served with _preloaded_pages instead of being pulled
+    again. The chosen season is remembered for the page so later calls don't
+    send any extra requests. It is remembered for each page rather than for
+    the whole league, as pages of the same season aren't all published at
+    once, such as the roster of a team which has just joined the league.
+
+    Parameters
+    ----------
+    league : string
+        A string pertaining to the league start information as listed in
+        SEASON_START_MONTH (ie. 'mlb', 'nba', 'nfl', etc.).
+    url_for_year : function
+        A function which accepts a season's year and returns the URL of the
+        page which is pulled for that season.
+
+    Returns
+    -------
+    tuple
+        A tuple of the season's year and a dictionary of the pages which were
+        downloaded while finding it. The year is a string of the year
+        returned by _find_year_for_season, or of the previous year if the
+        current season's page doesn't exist yet. The dictionary maps the
+        season's URL to the page's contents, and is empty if no page was
+        downloaded.
+    """
+    year = str(_find_year_for_season(league))
+    key = url_for_year(year)
+    if key in _default_seasons:
+        return _default_seasons[key], {}
+    for season in [year, str(int(year) - 1)]:
+        url = url_for_year(season)
+        try:
+            body = _fetch_page(url, _is_past_season(league, season))
+        except HTTPError as error:
+            if error.code == 404:
+                continue
+            return year, {}
+        _default_seasons[key] = season
+        return season, {url: body}
+    return year, {}
+
+
 def _parse_abbreviation(uri_link):
     """
     Returns a team's abbreviation.
@@ -148,6 +1550,160 @@ def _parse_abbreviation(uri_link):
     return abbr.upper()
 
 
+# Translates the PyQuery-readable selectors used in every parsing scheme,
+# including jQuery extensions such as ':first' and ':eq()', to XPath.
+SELECTOR_TRANSLATOR = JQueryTranslator(xhtml=False)
+# {
+#   selector string: compiled lxml XPath object
+# }
+_compiled_selectors = {}
+
+
+def _compile_selector(selector):
+    """
+    Return the compiled XPath expression for a PyQuery-readable selector.
+
+    PyQuery translates a CSS selector to XPath every time it is run, which is
+    a large share of the time spent parsing a page since the same few hundred
+    selectors from the parsing schemes are run against every team, game, and
+    player. Each selector is translated and compiled once on first use
+    instead, and the compiled expression is reused from then on.
+
+    Parameters
+    ----------
+    selector : string
+        A PyQuery-readable selector, such as 'td[data-stat="wins"]:first'.
+
+    Returns
+    -------
+    lxml.etree.XPath
+        The compiled XPath expression which matches the same elements as the
+        selector when called with a root element.
+    """
+    compiled = _compiled_selectors.get(selector)
+    if compiled is None:
+        xpath = SELECTOR_TRANSLATOR.css_to_xpath(selector.replace('[@', '['),
+                                                 'descendant-or-self::')
+        compiled = _compiled_selectors.setdefault(selector,
+                                                  etree.XPath(xpath))
+    return compiled
+
+
+def _select(html_data, selector):
+    """
+    Run a selector against HTML using its precompiled XPath expression.
+
+    Behaves like calling the PyQuery object with the selector, returning every
+    matching element from each root in turn, but skips translating the
+    selector again.
+
+    Parameters
+    ----------
+    html_data : PyQuery object
+        A PyQuery object containing the HTML to search.
+    selector : string
+        A PyQuery-readable selector, such as 'td[data-stat="wins"]'.
+
+    Returns
+    -------
+    PyQuery object
+        A PyQuery object of every element matching the selector.
+    """
+    if not selector:
+        return html_data._copy([])
+    compiled = _compile_selector(selector)
+    elements = []
+    for root in html_data:
+        elements.extend(compiled(root))
+    return html_data._copy(elements, parent=html_data)
+
+
+# Matches the plain data-stat cell selectors which make up the vast majority
+# of every parsing scheme, such as 'td[data-stat="wins"]:first' or
+# 'tfoot td[data-stat="pts"]'. Anything else is handed to PyQuery.
+DATA_STAT_SELECTOR = re.compile(r'^(tfoot )?(td|th)\[data-stat="([^"]+)"\]'
+                                r'(:first)?$')
+
+
+class _StatIndex:
+    """
+    A single-pass index of every data-stat cell in a block of HTML.
+
+    Parsing a team, game, or player previously ran one selector over the
+    entire HTML block per attribute. Instead, every table cell is visited once
+    and filed under its tag and data-stat name, after which each
+    'td[data-stat="..."]' selector in a parsing scheme is answered with a
+    dictionary lookup. Text is only extracted for cells which are actually
+    requested. Selectors of any other form fall back to PyQuery, and calling
+    the index directly runs a PyQuery selector against the original HTML so
+    the index can be passed wherever the PyQuery object was expected.
+
+    Parameters
+    ----------
+    html_data : PyQuery object
+        A PyQuery object containing one or more table rows, tables, or an
+        entire page.
+    """
+    def __init__(self, html_data):
+        self.html = html_data
+        self._cells = None
+
+    def __call__(self, selector):
+        return _select(self.html, selector)
+
+    def _index_cells(self):
+        # Results are kept per root element to mirror PyQuery, which runs the
+        # selector against each root in turn. As a result, ':first' matches
+        # the first cell in every root rather than only the very first cell.
+        cells = {}
+        for root in self.html:
+            first_seen = set()
+            for cell in root.iter('td', 'th'):
+                stat = cell.get('data-stat')
+                if stat is None:
+                    continue
+                key = (cell.tag, stat)
+                cells.setdefault((False, cell.tag, stat, False),
+                                 []).append(cell)
+                if key not in first_seen:
+                    first_seen.add(key)
+                    cells.setdefault((False, cell.tag, stat, True),
+                                     []).append(cell)
+            for footer in root.iter('tfoot'):
+                for cell in footer.iter('td', 'th'):
+                    stat = cell.get('data-stat')
+                    if stat is not None:
+                        cells.setdefault((True, cell.tag, stat, False),
+                                         []).append(cell)
+        self._cells = cells
+
+    def texts(self, selector):
+        """
+        Return the text of every element matching the selector.
+
+        Parameters
+        ----------
+        selector : string
+            A PyQuery-readable selector, such as 'td[data-stat="wins"]'.
+
+        Returns
+        -------
+        list
+            A list of the text contents of each matching element in document
+            order.
+        """
+        match = DATA_STAT_SELECTOR.match(selector)
+        # The first cell in each footer doesn't line up with the per-root
+        # ordering kept by the index, so leave that rare case to PyQuery.
+        if not match or (match.group(1) and match.group(4)):
+            return [i.text() for i in _select(self.html, selector).items()]
+        if self._cells is None:
+            self._index_cells()
+        key = (bool(match.group(1)), match.group(2), match.group(3),
+               bool(match.group(4)))
+        return [extract_text(cell) for cell in self._cells.get(key, [])]
+
+
 def _parse_field(parsing_scheme, html_data, field, index=0):
     """
     Parse an HTML table to find the requested field's value.
@@ -164,10 +1720,11 @@ def _parse_field(parsing_scheme, html_data, field, index=0):
         field. The key corresponds to the attribute name to parse, and the
         value is a PyQuery-readable parsing scheme as a string (such as
         'td[data-stat="wins"]').
-    html_data : string
-        A string containing all of the rows of stats for a given team. If
-        multiple tables are being referenced, this will be comprised of
-        multiple rows in a single string.
+    html_data : PyQuery object or _StatIndex
+        A PyQuery object containing all of the rows of stats for a given team.
+        If multiple tables are being referenced, this will be comprised of
+        multiple rows. When several fields are parsed from the same HTML, pass
+        a _StatIndex of the HTML instead so the rows are only walked once.
     field : string
         The name of the attribute to match. Field must be a key in
         parsing_scheme.
@@ -184,10 +1741,15 @@ def _parse_field(parsing_scheme, html_data, field, index=0):
         The value at the specified index for the requested field. If no value
         could be found, returns None.
     """
-    if field == 'abbreviation':
-        return _parse_abbreviation(html_data)
-    scheme = parsing_scheme[field]
-    items = [i.text() for i in html_data(scheme).items()]
+    if isinstance(html_data, _StatIndex):
+        if field == 'abbreviation':
+            return _parse_abbreviation(html_data.html)
+        items = html_data.texts(parsing_scheme[field])
+    else:
+        if field == 'abbreviation':
+            return _parse_abbreviation(html_data)
+        scheme = parsing_scheme[field]
+        items = [i.text() for i in _select(html_data, scheme).items()]
     # Stats can be added and removed on a yearly basis. If not stats are found,
     # return None and have the be the value.
     if len(items) == 0:
@@ -200,26 +1762,311 @@ def _parse_field(parsing_scheme, html_data, field, index=0):
         return None
 
 
-def _remove_html_comment_tags(html):
+class _StatColumn:
+    """
+    A single stat for every season of a player's career in a typed array.
+
+    Players hold one list of raw strings per stat with an element for every
+    season, which were cleaned up and converted each time a property was
+    requested. Once a player has loaded, every stat is converted a single time
+    and stored as a NumPy array alongside a mask flagging the seasons which
+    have no value, so requesting a stat is an array lookup and the full
+    DataFrame can be built from the arrays directly.
+
+    Parameters
+    ----------
+    values : list
+        A list of the converted value of the stat for each season, where
+        missing values are None.
+    dtype : type
+        The type every value is converted to, such as ``int`` or ``float``.
+    """
+    __slots__ = ('values', 'missing')
+
+    def __init__(self, values, dtype):
+        self.missing = np.array([value is None for value in values],
+                                dtype=bool)
+        filled = [0 if value is None else value for value in values]
+        try:
+            self.values = np.array(filled, dtype=dtype)
+        except OverflowError:
+            # Integers beyond 64 bits are kept as Python objects.
+            self.values = np.array(filled, dtype=object)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        # An unknown index, such as the career stats of a player without any,
+        # has no value.
+        if type(index) is not int:
+            return None
+        try:
+            if self.missing.item(index):
+                return None
+        except IndexError:
+            return None
+        return self.values.item(index)
+
+    def take(self, positions):
+        """
+        Return the values at the requested positions as a column for pandas.
+
+        Parameters
+        ----------
+        positions : list
+            A list of the integer positions of the seasons to include.
+
+        Returns
+        -------
+        numpy array
+            The typed values when none are missing. Otherwise, missing values
+            are NaN when at least one value exists and None when all of them
+            are missing, matching how pandas fills in the same values when
+            they are passed one row at a time.
+        """
+        values = self.values[positions]
+        missing = self.missing[positions]
+        if not missing.any():
+            return values
+        if missing.all():
+            return np.full(len(positions), None, dtype=object)
+        return np.where(missing, np.nan, values.astype(float))
+
+
+def _stat_property(func, dtype, decode):
+    """
+    Create a property for a player stat which holds a value for every season.
+
+    Parameters
+    ----------
+    func : function
+        The function being decorated which returns the stat for every season.
+    dtype : type
+        The type the stat is converted to, such as ``int`` or ``float``.
+    decode : function
+        A function accepting the raw values for every season and the index of
+        a season which returns the converted value for that season.
+
+    Returns
+    -------
+    property
+        A property returning the stat for the season the player currently
+        points to. The values are read from the stat's ``_StatColumn`` once
+        ``_convert_stat_columns`` has run and are decoded from the raw values
+        otherwise.
+    """
+    @wraps(func)
+    def wrapper(player):
+        index = player._index
+        prop = func(player)
+        if isinstance(prop, _StatColumn):
+            return prop[index]
+        return decode(prop, index)
+    wrapper._stat_column = (func, dtype, decode)
+    return property(wrapper)
+
+
+# {
+#   class: list of (func, dtype, decode) tuples for every property created by
+#          _stat_property on the class, including inherited properties.
+# }
+_stat_properties = {}
+
+
+def _find_stat_properties(player_class):
+    if player_class not in _stat_properties:
+        stats = []
+        for name in dir(player_class):
+            prop = getattr(player_class, name, None)
+            if isinstance(prop, property) and \
+               hasattr(prop.fget, '_stat_column'):
+                stats.append(prop.fget._stat_column)
+        _stat_properties[player_class] = stats
+    return _stat_properties[player_class]
+
+
+def _convert_stat_columns(player):
+    """
+    Convert the raw values of every stat into a ``_StatColumn``.
+
+    Each stat created with ``_stat_property`` whose attribute holds a list of
+    raw values for every season is decoded once and replaced with a typed
+    column, releasing the raw strings.
+
+    Parameters
+    ----------
+    player : Player class instance
+        A player whose stats have been parsed for every season.
+    """
+    for func, dtype, decode in _find_stat_properties(type(player)):
+        name = '_%s' % func.__name__
+        prop = player.__dict__.get(name)
+        # Only replace attributes which are known to back the property.
+        if not isinstance(prop, list) or func(player) is not prop:
+            continue
+        values = [decode(prop, index) for index in range(len(prop))]
+        setattr(player, name, _StatColumn(values, dtype))
+
+
+def _parse_deferred_field(instance, name, parse):
+    """
+    Parse a field of a lazily parsed instance the first time it is requested.
+
+    The field is only removed from the instance's deferred fields once it was
+    parsed successfully, so an error raised while parsing is raised again the
+    next time the field is requested.
+
+    Parameters
+    ----------
+    instance : object
+        The instance whose attribute was requested. The fields which haven't
+        been parsed yet are listed in its '_deferred_fields' attribute.
+    name : string
+        The name of the requested attribute, such as '_home_points'.
+    parse : function
+        A function which accepts the attribute name and sets the parsed value
+        on the instance.
+
+    Returns
+    -------
+    The parsed value of the field, or None if it couldn't be found.
+
+    Raises
+    ------
+    AttributeError
+        If the requested attribute isn't one of the deferred fields.
+    """
+    with _deferred_lock:
+        # Another thread might have parsed the field while this one waited.
+        if name not in instance.__dict__:
+            deferred = instance.__dict__.get('_deferred_fields')
+            if not deferred or name not in deferred:
+                raise AttributeError("'%s' object has no attribute '%s'" %
+                                     (type(instance).__name__, name))
+            parse(name)
+            if name not in instance.__dict__:
+                setattr(instance, name, None)
+            deferred.discard(name)
+        return instance.__dict__[name]
+
+
+def _field_names(instance):
+    """
+    Return the names of every attribute holding one of an instance's fields.
+
+    Classes which are created in large numbers, such as the players in every
+    boxscore, declare their fields in '__slots__' instead of keeping them in a
+    per-instance '__dict__'. Both are supported so the same parsing code can
+    be shared with classes which still use a '__dict__'.
+
+    Parameters
+    ----------
+    instance : object
+        The instance to list the fields of.
+
+    Returns
+    -------
+    list
+        A list of the attribute names in the order they were declared.
+    """
+    if hasattr(instance, '__dict__'):
+        return list(instance.__dict__)
+    return [name for cls in reversed(type(instance).__mro__)
+            for name in cls.__dict__.get('__slots__', ())]
+
+
+def _player_dataframe(player, seasons):
+    """
+    Build a DataFrame of a player's stats with one row for every season.
+
+    Stats held in a ``_StatColumn`` are sliced directly from their arrays.
+    Every other field is read through its property for each season in turn.
+
+    Parameters
+    ----------
+    player : Player class instance
+        A player whose stats have been converted with
+        ``_convert_stat_columns``.
+    seasons : list
+        A list of the season strings to include, in order. Every season must
+        be in the player's season index.
+
+    Returns
+    -------
+    Pandas DataFrame
+        A DataFrame with the fields from the player's ``_dataframe_fields``
+        as columns where each index is one of the requested seasons.
+    """
+    positions = [player._season_index[season] for season in seasons]
+    if not positions:
+        return pd.DataFrame([], index=[[]])
+    temp_index = player._index
+    columns = {}
+    for field in player._dataframe_fields():
+        prop = getattr(type(player), field, None)
+        column = player.__dict__.get('_%s' % field)
+        if isinstance(column, _StatColumn) and \
+           hasattr(getattr(prop, 'fget', None), '_stat_column'):
+            columns[field] = column.take(positions)
+            continue
+        values = []
+        for position in positions:
+            player._index = position
+            values.append(getattr(player, field))
+        columns[field] = values
+    player._index = temp_index
+    return pd.DataFrame(columns, index=[list(seasons)])
+
+
+def _uncomment_html(html):
     """
-    Returns the passed HTML contents with all comment tags removed while
-    keeping the contents within the tags.
+    Replace every HTML comment with the elements written inside of it.
 
-    Some pages embed the HTML contents in comments. Since the HTML contents are
-    valid, removing the content tags (but not the actual code within the
-    comments) will return the desired contents.
+    Many tables on sports-reference are sent inside of HTML comments and only
+    displayed by JavaScript. Instead of converting the entire document to a
+    string, stripping the comment tags, and parsing the result again, only the
+    contents of each comment are parsed, and the resulting elements take the
+    comment's place in the tree. The HTML is modified in place.
 
     Parameters
     ----------
     html : PyQuery object
-        A PyQuery object which contains the requested HTML page contents.
+        A PyQuery object which contains the HTML contents to uncomment.
 
     Returns
     -------
-    string
-        The passed HTML contents with all comment tags removed.
+    PyQuery object
+        The same PyQuery object with the contents of every comment included.
     """
-    return str(html).replace('<!--', '').replace('-->', '')
+    for root in html:
+        for comment in list(root.iter(etree.Comment)):
+            parent = comment.getparent()
+            if parent is None:
+                continue
+            contents = comment.text or ''
+            try:
+                fragments = lxml_html.fragments_fromstring(contents)
+            except (ParserError, XMLSyntaxError):
+                continue
+            # The parser drops any whitespace ahead of the first element.
+            text = contents[:len(contents) - len(contents.lstrip())]
+            if fragments and isinstance(fragments[0], str):
+                text = fragments.pop(0)
+            tail = comment.tail or ''
+            if not fragments:
+                text += tail
+            else:
+                fragments[-1].tail = (fragments[-1].tail or '') + tail
+            index = parent.index(comment)
+            previous = comment.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or '') + text
+            else:
+                parent.text = (parent.text or '') + text
+            parent.remove(comment)
+            parent[index:index] = fragments
+    return html
 
 
 def _get_stats_table(html_page, div, footer=False):
@@ -247,13 +2094,16 @@ def _get_stats_table(html_page, div, footer=False):
     generator
         A generator of all row items in a given table.
     """
-    stats_html = html_page(div)
-    try:
-        stats_table = pq(_remove_html_comment_tags(stats_html))
-    except (ParserError, XMLSyntaxError):
+    stats_table = _select(html_page, div)
+    if not stats_table:
         return None
+    # Only copy the requested table when it still has comments to remove so
+    # the original page is left untouched.
+    if any(True for root in stats_table for _ in root.iter(etree.Comment)):
+        stats_table = _uncomment_html(pq([deepcopy(root) for root
+                                          in stats_table]))
     if footer:
-        teams_list = stats_table('tfoot tr').items()
+        teams_list = _select(stats_table, 'tfoot tr').items()
     else:
-        teams_list = stats_table('tbody tr').items()
+        teams_list = _select(stats_table, 'tbody tr').items()
     return teams_list
@@ -0,0 +1,28 @@
+import pytest
+from sportsreference import utils
+from sportsreference.ncaab import conferences as ncaab_conferences
+from sportsreference.ncaaf import conferences as ncaaf_conferences
+
+
+@pytest.fixture(autouse=True)
+def reset_default_seasons():
+    # The default season is remembered for the lifetime of the process, but
+    # tests mock the current date and the available pages independently. The
+    # same goes for pages kept in memory for revalidation, hosts which were
+    # paused after a throttled request, boxscores which were parsed, and the
+    # conferences pulled for each season.
+    utils._default_seasons.clear()
+    utils._revalidation_cache.clear()
+    utils._rate_limiters.clear()
+    utils._boxscore_registry.clear()
+    utils._boxscore_cache.clear()
+    ncaab_conferences._season_conferences.clear()
+    ncaaf_conferences._season_conferences.clear()
+    yield
+    utils._default_seasons.clear()
+    utils._revalidation_cache.clear()
+    utils._rate_limiters.clear()
+    utils._boxscore_registry.clear()
+    utils._boxscore_cache.clear()
+    ncaab_conferences._season_conferences.clear()
+    ncaaf_conferences._season_conferences.clear()
@@ -1,12 +1,15 @@
+import gc
 import mock
 import os
 import pandas as pd
+import pytest
 from datetime import datetime
 from flexmock import flexmock
 from sportsreference import utils
 from sportsreference.constants import AWAY
 from sportsreference.mlb.constants import BOXSCORE_URL, BOXSCORES_URL, NIGHT
 from sportsreference.mlb.boxscore import Boxscore, Boxscores
+from sportsreference.mlb.schedule import Game
 
 
 MONTH = 10
@@ -26,6 +29,7 @@ def mock_pyquery(url):
             self.status_code = 200
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if url == BOXSCORES_URL % (YEAR, 7, 17):
         return MockPQ(read_file('boxscore-7-17-2017.html'))
@@ -37,13 +41,14 @@ def mock_pyquery(url):
 
 
 class MockDateTime:
-    def __init__(self, year, month):
+    def __init__(self, year, month, day=1):
         self.year = year
         self.month = month
+        self.day = day
 
 
 class TestMLBBoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': 'Thursday, June 7, 2018',
@@ -140,6 +145,96 @@ class TestMLBBoxscore:
         for attribute, value in self.results.items():
             assert getattr(self.boxscore, attribute) == value
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_fetch_many_returns_boxscores(self, *args, **kwargs):
+        boxscores = Boxscore.fetch_many([BOXSCORE, BOXSCORE])
+
+        assert len(boxscores) == 2
+        for boxscore in boxscores:
+            for attribute, value in self.results.items():
+                assert getattr(boxscore, attribute) == value
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_boxscore_on_game_day_is_not_cached_forever(self, *args,
+                                                            **kwargs):
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(datetime(2018, 6, 7, 20))
+        flexmock(utils) \
+            .should_call('_fetch_page') \
+            .with_args(BOXSCORE_URL % BOXSCORE, True) \
+            .never()
+        flexmock(utils) \
+            .should_call('_fetch_page') \
+            .with_args(BOXSCORE_URL % BOXSCORE, False) \
+            .at_least() \
+            .twice()
+
+        Boxscore(BOXSCORE)
+        Boxscore.fetch_many([BOXSCORE])
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_fetch_many_reuses_parsed_boxscores(self, mock_get):
+        # Only completed games are shared, so the game has to be in the past.
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(datetime.now())
+        first = Boxscore.fetch_many([BOXSCORE])
+        second = Boxscore.fetch_many([BOXSCORE, BOXSCORE])
+
+        assert second == [first[0], first[0]]
+        assert mock_get.call_count == 1
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_boxscore_is_downloaded_once_for_both_teams(self, mock_get):
+        # Each team's schedule has its own Game for the same boxscore, and the
+        # first team's boxscore is dropped before the second team's is read.
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(datetime.now())
+        flexmock(Game) \
+            .should_receive('_parse_game_data') \
+            .and_return(None)
+
+        for _ in range(2):
+            game = Game(None, None)
+            game._boxscore = BOXSCORE
+            game.boxscore.dataframe
+            del game
+            gc.collect()
+
+        assert mock_get.call_count == 1
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_lazy_boxscores_are_not_parsed_in_processes(self, mock_get):
+        with pytest.raises(ValueError):
+            Boxscore.fetch_many([BOXSCORE], lazy=True, processes=2)
+
+        assert mock_get.call_count == 0
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_fetch_many_parses_in_processes(self, *args, **kwargs):
+        boxscores = Boxscore.fetch_many([BOXSCORE, BOXSCORE], processes=2)
+
+        assert len(boxscores) == 2
+        for boxscore in boxscores:
+            for attribute, value in self.results.items():
+                assert getattr(boxscore, attribute) == value
+            assert boxscore.dataframe.equals(self.boxscore.dataframe)
+            assert len(boxscore.home_players) == \
+                len(self.boxscore.home_players)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_lazy_boxscore_parses_on_access(self, *args, **kwargs):
+        boxscore = Boxscore(BOXSCORE, lazy=True)
+
+        assert '_home_players' not in boxscore.__dict__
+        for attribute, value in self.results.items():
+            assert getattr(boxscore, attribute) == value
+        assert len(boxscore.home_players) == len(self.boxscore.home_players)
+        assert len(boxscore.away_players) == len(self.boxscore.away_players)
+        assert boxscore.dataframe.equals(self.boxscore.dataframe)
+
     def test_invalid_url_yields_empty_class(self):
         flexmock(Boxscore) \
             .should_receive('_retrieve_html_page') \
@@ -328,19 +423,19 @@ class TestMLBBoxscores:
             ]
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 7, 17)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_invalid_end(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 7, 17), datetime(2017, 7, 16)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_multiple_days(self, *args, **kwargs):
         expected = {
             '7-17-2017': [
@@ -659,3 +754,26 @@ class TestMLBBoxscores:
         result = Boxscores(datetime(2017, 7, 17), datetime(2017, 7, 18)).games
 
         assert result == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_boxscores_search_multiple_days_with_workers(self, *args,
+                                                         **kwargs):
+        start = datetime(2017, 7, 17)
+        end = datetime(2017, 7, 18)
+        expected = Boxscores(start, end).games
+        result = Boxscores(start, end, workers=2).games
+
+        assert result == expected
+        assert list(result) == list(expected)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_boxscores_iter_games_yields_each_day(self, *args, **kwargs):
+        start = datetime(2017, 7, 17)
+        end = datetime(2017, 7, 18)
+        expected = Boxscores(start, end).games
+
+        result = list(Boxscores.iter_games(start, end, workers=2))
+        resumed = list(Boxscores.iter_games(end, end))
+
+        assert result == list(expected.items())
+        assert resumed == result[1:]
@@ -1,3 +1,4 @@
+import asyncio
 import mock
 import pytest
 from flexmock import flexmock
@@ -23,6 +24,7 @@ def mock_pyquery(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
         def __call__(self, div):
             return read_file()
@@ -45,6 +47,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -52,6 +55,13 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestNCAABConferences:
     def setup_method(self):
         team_conference = {'kansas': 'big-12',
@@ -105,7 +115,7 @@ class TestNCAABConferences:
         self.team_conference = team_conference
         self.conferences_result = conferences_result
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conferences_integration(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -116,17 +126,56 @@ class TestNCAABConferences:
         assert conferences.team_conference == self.team_conference
         assert conferences.conferences == self.conferences_result
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_conferences_are_reused_for_the_same_season(self, mock_get):
+        Conferences(str(YEAR))
+        call_count = mock_get.call_count
+
+        conferences = Conferences(str(YEAR))
+
+        assert mock_get.call_count == call_count
+        assert conferences.team_conference == self.team_conference
+        assert conferences.conferences == self.conferences_result
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_ongoing_season_conferences_are_pulled_again(self, mock_get):
+        flexmock(utils) \
+            .should_receive('_is_past_season') \
+            .and_return(False)
+        Conferences(str(YEAR))
+        call_count = mock_get.call_count
+
+        conferences = Conferences(str(YEAR))
+
+        assert mock_get.call_count == 2 * call_count
+        assert conferences.team_conference == self.team_conference
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_conferences_build_inside_event_loop(self, *args, **kwargs):
+        async def build():
+            return Conferences(str(YEAR))
+
+        # asyncio.run is only available from Python 3.7.
+        loop = asyncio.new_event_loop()
+        try:
+            conferences = loop.run_until_complete(build())
+        finally:
+            loop.close()
+
+        assert conferences.team_conference == self.team_conference
+        assert conferences.conferences == self.conferences_result
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conferences_integration_bad_url(self, *args, **kwargs):
         with pytest.raises(ValueError):
             conferences = Conferences('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conference_integration_bad_url(self, *args, **kwargs):
         with pytest.raises(ValueError):
             conference = Conference('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conference_with_no_names_is_empty(self, *args, **kwargs):
         flexmock(Conference) \
             .should_receive('_get_team_abbreviation') \
@@ -136,8 +185,7 @@ class TestNCAABConferences:
 
         assert len(conference._teams) == 0
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -150,8 +198,7 @@ class TestNCAABConferences:
         assert conferences.team_conference == self.team_conference
         assert conferences.conferences == self.conferences_result
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_conference_year_reverts_to_previous_year(self,
                                                               *args,
                                                               **kwargs):
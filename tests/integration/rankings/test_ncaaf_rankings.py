@@ -23,6 +23,7 @@ def mock_pyquery(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
         def __call__(self, div):
             return read_file()
@@ -39,6 +40,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -46,6 +48,13 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestNCAAFRankings:
     def setup_method(self):
         results_extended = [
@@ -660,7 +669,7 @@ class TestNCAAFRankings:
         self.results = results
         self.results_complete = results_complete
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_rankings_integration(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -672,13 +681,12 @@ class TestNCAAFRankings:
         assert rankings.current == self.results
         assert rankings.complete == self.results_complete
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_rankings_integration_bad_url(self, *args, **kwargs):
         with pytest.raises(ValueError):
             rankings = Rankings('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -26,9 +26,10 @@ def mock_pyquery(url):
             self.status_code = status
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if 'BAD' in url:
-        return MockPQ(None, 404)
+        return MockPQ('', 404)
     if 'HOU' in url:
         return MockPQ(read_file('2017'))
     if 'verlaju01' in url:
@@ -36,12 +37,21 @@ def mock_pyquery(url):
     return MockPQ(read_file('altuvjo01'))
 
 
+def mock_latin1_page(url):
+    response = mock_pyquery(url)
+    response.headers = {'Content-Type': 'text/html; charset=ISO-8859-1'}
+    response.content = response.text.encode('iso-8859-1',
+                                            'xmlcharrefreplace')
+    return response
+
+
 def mock_request(url):
     class MockRequest:
         def __init__(self, html_contents, status_code=200):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -49,8 +59,15 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestMLBPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'assists': 2763,
@@ -233,6 +250,16 @@ class TestMLBPlayer:
         for attribute, value in self.results_2017.items():
             assert getattr(player, attribute) == value
 
+    def test_seasons_returns_requested_seasons(self):
+        dataframe = self.player.seasons(['2017', 'career', '1900'])
+
+        assert list(dataframe.index.get_level_values(0)) == \
+            ['2017', 'Career']
+        assert dataframe.loc['2017']['games'].iloc[0] == \
+            self.results_2017['games']
+        assert dataframe.loc['Career']['games'].iloc[0] == \
+            self.results_career['games']
+
     def test_dataframe_returns_dataframe(self):
         dataframe = [
             {'assists': 2763,
@@ -502,6 +529,15 @@ class TestMLBPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
+    @mock.patch('requests.Session.get', side_effect=mock_latin1_page)
+    def test_player_from_non_utf8_page_matches(self, *args, **kwargs):
+        player = Player('altuvjo01')
+
+        assert args[0].called
+        assert player.name == u'José Altuve'
+        pd.testing.assert_frame_equal(player.dataframe,
+                                      self.player.dataframe)
+
     def test_player_contract_returns_contract(self):
         contract = self.player.contract
 
@@ -577,7 +613,7 @@ class TestMLBPlayer:
 
 
 class TestMLBPitcher:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'assists': 278,
@@ -1168,7 +1204,7 @@ class TestMLBPitcher:
 
 
 class TestMLBRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1181,12 +1217,12 @@ class TestMLBRoster:
             assert player.name in [u'José Altuve', 'Justin Verlander',
                                    'Charlie Morton']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('bad')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -1200,9 +1236,81 @@ class TestMLBRoster:
         for player in team.roster.players:
             assert player.name in [u'José Altuve', 'Justin Verlander',
                                    'Charlie Morton']
-        type(team)._abbreviation = None
+        del type(team)._abbreviation
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_downloads_players_concurrently(self,
+                                                         *args,
+                                                         **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU', workers=3)
+        expected = [player.name for player in Roster('HOU').players]
+
+        assert [player.name for player in roster.players] == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_parses_players_in_processes(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU', workers=2, processes=2)
+        expected = Roster('HOU').players
+
+        assert [player.name for player in roster.players] == \
+            [player.name for player in expected]
+        for player, parsed in zip(roster.players, expected):
+            assert player.dataframe.equals(parsed.dataframe)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_iterates_over_players(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU', slim=True)
+
+        players = roster.iter_players(workers=2)
+
+        assert [player.player_id for player in players] == \
+            list(roster.players)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_streams_players_before_they_are_loaded(self, *args,
+                                                           **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        flexmock(utils) \
+            .should_call('_iter_pages') \
+            .with_args(list, utils.MAX_CONCURRENT_REQUESTS) \
+            .once()
+        roster = Roster('HOU', lazy=True)
+        requests = args[0].call_count
+
+        players = roster.iter_players(processes=2)
+        first = next(players)
+
+        assert requests == 1
+        assert roster._players is None
+        assert [first.name] + [player.name for player in players] == \
+            [player.name for player in Roster('HOU').players]
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_loads_players_when_created(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU')
+        requests = args[0].call_count
+
+        players = roster.players
+
+        assert requests > 1
+        assert args[0].call_count == requests
+        assert roster._players is players
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1216,8 +1324,7 @@ class TestMLBRoster:
             'mortoch02': 'Charlie Morton'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_mlb_invalid_default_year_reverts_to_previous_year(self,
                                                                *args,
                                                                **kwargs):
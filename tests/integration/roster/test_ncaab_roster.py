@@ -26,6 +26,7 @@ def mock_pyquery(url):
             self.status_code = status
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if 'purdue' in url:
         return MockPQ(read_file('2018'))
@@ -34,7 +35,7 @@ def mock_pyquery(url):
     if 'vince-edwards-2' in url:
         return MockPQ(read_file('vince-edwards-2'))
     if 'bad' in url:
-        return MockPQ(None, 404)
+        return MockPQ('', 404)
     return MockPQ(read_file('carsen-edwards-1'))
 
 
@@ -44,6 +45,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -51,8 +53,15 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestNCAABPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'assist_percentage': 17.3,
@@ -190,6 +199,16 @@ class TestNCAABPlayer:
 
         assert player._index == 1
 
+    def test_seasons_returns_requested_seasons(self):
+        dataframe = self.player.seasons(['2017-18', 'career', '1900'])
+
+        assert list(dataframe.index.get_level_values(0)) == \
+            ['2017-18', 'Career']
+        assert dataframe.loc['2017-18']['points'].iloc[0] == \
+            self.results_2018['points']
+        assert dataframe.loc['Career']['points'].iloc[0] == \
+            self.results_career['points']
+
     def test_dataframe_returns_dataframe(self):
         dataframe = [
             {'assist_percentage': 17.3,
@@ -362,7 +381,7 @@ class TestNCAABPlayer:
 
 
 class TestNCAABRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -375,12 +394,12 @@ class TestNCAABRoster:
             assert player.name in ['Carsen Edwards', 'Isaac Haas',
                                    'Vince Edwards']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -394,9 +413,81 @@ class TestNCAABRoster:
         for player in team.roster.players:
             assert player.name in ['Carsen Edwards', 'Isaac Haas',
                                    'Vince Edwards']
-        type(team)._abbreviation = None
+        del type(team)._abbreviation
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_downloads_players_concurrently(self,
+                                                         *args,
+                                                         **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE', workers=3)
+        expected = [player.name for player in Roster('PURDUE').players]
+
+        assert [player.name for player in roster.players] == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_parses_players_in_processes(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE', workers=2, processes=2)
+        expected = Roster('PURDUE').players
+
+        assert [player.name for player in roster.players] == \
+            [player.name for player in expected]
+        for player, parsed in zip(roster.players, expected):
+            assert player.dataframe.equals(parsed.dataframe)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_iterates_over_players(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE', slim=True)
+
+        players = roster.iter_players(workers=2)
+
+        assert [player.player_id for player in players] == \
+            list(roster.players)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_streams_players_before_they_are_loaded(self, *args,
+                                                           **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        flexmock(utils) \
+            .should_call('_iter_pages') \
+            .with_args(list, utils.MAX_CONCURRENT_REQUESTS) \
+            .once()
+        roster = Roster('PURDUE', lazy=True)
+        requests = args[0].call_count
+
+        players = roster.iter_players(processes=2)
+        first = next(players)
+
+        assert requests == 1
+        assert roster._players is None
+        assert [first.name] + [player.name for player in players] == \
+            [player.name for player in Roster('PURDUE').players]
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_loads_players_when_created(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE')
+        requests = args[0].call_count
+
+        players = roster.players
+
+        assert requests > 1
+        assert args[0].call_count == requests
+        assert roster._players is players
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -410,8 +501,7 @@ class TestNCAABRoster:
             'vince-edwards-2': 'Vince Edwards'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -25,9 +25,10 @@ def mock_pyquery(url):
             self.status_code = status
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if 'BAD' in url or 'bad' in url:
-        return MockPQ(None, 404)
+        return MockPQ('', 404)
     if 'brycen-hopkins' in url:
         return MockPQ(read_file('brycen-hopkins-1'))
     if '2018-roster' in url:
@@ -41,6 +42,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -48,8 +50,15 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestNCAAFPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'adjusted_yards_per_attempt': 6.1,
@@ -177,6 +186,16 @@ class TestNCAAFPlayer:
         for attribute, value in self.results_2017.items():
             assert getattr(player, attribute) == value
 
+    def test_seasons_returns_requested_seasons(self):
+        dataframe = self.player.seasons(['2017', 'career', '1900'])
+
+        assert list(dataframe.index.get_level_values(0)) == \
+            ['2017', 'Career']
+        assert dataframe.loc['2017']['points'].iloc[0] == \
+            self.results_2017['points']
+        assert dataframe.loc['Career']['points'].iloc[0] == \
+            self.results_career['points']
+
     def test_dataframe_returns_dataframe(self):
         dataframe = [
             {'adjusted_yards_per_attempt': 4.8,
@@ -475,7 +494,7 @@ class TestNCAAFPlayer:
 
 
 class TestNCAAFRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -487,12 +506,12 @@ class TestNCAAFRoster:
         for player in roster.players:
             assert player.name in ['David Blough', 'Rondale Moore']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -505,9 +524,81 @@ class TestNCAAFRoster:
 
         for player in team.roster.players:
             assert player.name in ['David Blough', 'Rondale Moore']
-        type(team)._abbreviation = None
+        del type(team)._abbreviation
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_downloads_players_concurrently(self,
+                                                         *args,
+                                                         **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE', workers=3)
+        expected = [player.name for player in Roster('PURDUE').players]
+
+        assert [player.name for player in roster.players] == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_parses_players_in_processes(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE', workers=2, processes=2)
+        expected = Roster('PURDUE').players
+
+        assert [player.name for player in roster.players] == \
+            [player.name for player in expected]
+        for player, parsed in zip(roster.players, expected):
+            assert player.dataframe.equals(parsed.dataframe)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_iterates_over_players(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE', slim=True)
+
+        players = roster.iter_players(workers=2)
+
+        assert [player.player_id for player in players] == \
+            list(roster.players)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_streams_players_before_they_are_loaded(self, *args,
+                                                           **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        flexmock(utils) \
+            .should_call('_iter_pages') \
+            .with_args(list, utils.MAX_CONCURRENT_REQUESTS) \
+            .once()
+        roster = Roster('PURDUE', lazy=True)
+        requests = args[0].call_count
+
+        players = roster.iter_players(processes=2)
+        first = next(players)
+
+        assert requests == 1
+        assert roster._players is None
+        assert [first.name] + [player.name for player in players] == \
+            [player.name for player in Roster('PURDUE').players]
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_loads_players_when_created(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('PURDUE')
+        requests = args[0].call_count
+
+        players = roster.players
+
+        assert requests > 1
+        assert args[0].call_count == requests
+        assert roster._players is players
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -520,8 +611,7 @@ class TestNCAAFRoster:
             'rondale-moore-1': 'Rondale Moore'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -25,9 +25,10 @@ def mock_pyquery(url):
             self.status_code = status
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if 'BAD' in url or 'bad' in url:
-        return MockPQ(None, 404)
+        return MockPQ('', 404)
     if '404' in url:
         return MockPQ('Page Not Found (404 error)')
     if 'Davi' in url:
@@ -51,6 +52,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -58,6 +60,13 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestNFLPlayer:
     def setup_method(self):
         self.qb_results_career = {
@@ -738,7 +747,7 @@ class TestNFLPlayer:
             'yards_returned_from_interception': None
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_qb_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('BreeDr00')
@@ -747,7 +756,7 @@ class TestNFLPlayer:
         for attribute, value in self.qb_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_qb_returns_requested_player_season_stats(self,
                                                           *args,
                                                           **kwargs):
@@ -758,7 +767,7 @@ class TestNFLPlayer:
         for attribute, value in self.qb_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_olb_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('DaviDe00')
@@ -767,7 +776,7 @@ class TestNFLPlayer:
         for attribute, value in self.olb_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_kicker_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('LutzWi00')
@@ -776,7 +785,7 @@ class TestNFLPlayer:
         for attribute, value in self.kicker_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_punter_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('MorsTh00')
@@ -785,7 +794,7 @@ class TestNFLPlayer:
         for attribute, value in self.punter_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_olb_receiver_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('LewiTo00')
@@ -794,7 +803,19 @@ class TestNFLPlayer:
         for attribute, value in self.receiver_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_seasons_returns_requested_seasons(self, *args, **kwargs):
+        player = Player('BreeDr00')
+        dataframe = player.seasons(['2017', 'career', '1900'])
+
+        assert list(dataframe.index.get_level_values(0)) == \
+            ['2017', 'Career']
+        assert dataframe.loc['2017']['passing_yards'].iloc[0] == \
+            self.qb_results_2017['passing_yards']
+        assert dataframe.loc['Career']['passing_yards'].iloc[0] == \
+            self.qb_results_career['passing_yards']
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_dataframe_returns_dataframe(self, *args, **kwargs):
         dataframe = [
             {'adjusted_net_yards_per_attempt_index': 116,
@@ -1143,7 +1164,7 @@ class TestNFLPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_fake_404_page_returns_none_with_no_errors(self,
                                                            *args,
                                                            **kwargs):
@@ -1152,7 +1173,7 @@ class TestNFLPlayer:
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_fake_404_page_returns_none_for_different_season(self,
                                                                  *args,
                                                                  **kwargs):
@@ -1162,7 +1183,7 @@ class TestNFLPlayer:
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_player_with_no_career_stats_handled_properly(self,
                                                               *args,
                                                               **kwargs):
@@ -1172,7 +1193,7 @@ class TestNFLPlayer:
 
 
 class TestNFLRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1186,12 +1207,12 @@ class TestNFLRoster:
                                    'Tommylee Lewis', 'Wil Lutz',
                                    'Thomas Morstead']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -1206,9 +1227,81 @@ class TestNFLRoster:
             assert player.name in ['Drew Brees', 'Demario Davis',
                                    'Tommylee Lewis', 'Wil Lutz',
                                    'Thomas Morstead']
-        type(team)._abbreviation = None
+        del type(team)._abbreviation
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_downloads_players_concurrently(self,
+                                                         *args,
+                                                         **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('NOR', workers=3)
+        expected = [player.name for player in Roster('NOR').players]
+
+        assert [player.name for player in roster.players] == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_parses_players_in_processes(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('NOR', workers=2, processes=2)
+        expected = Roster('NOR').players
+
+        assert [player.name for player in roster.players] == \
+            [player.name for player in expected]
+        for player, parsed in zip(roster.players, expected):
+            assert player.dataframe.equals(parsed.dataframe)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_iterates_over_players(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('NOR', slim=True)
+
+        players = roster.iter_players(workers=2)
+
+        assert [player.player_id for player in players] == \
+            list(roster.players)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_streams_players_before_they_are_loaded(self, *args,
+                                                           **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        flexmock(utils) \
+            .should_call('_iter_pages') \
+            .with_args(list, utils.MAX_CONCURRENT_REQUESTS) \
+            .once()
+        roster = Roster('NOR', lazy=True)
+        requests = args[0].call_count
+
+        players = roster.iter_players(processes=2)
+        first = next(players)
+
+        assert requests == 1
+        assert roster._players is None
+        assert [first.name] + [player.name for player in players] == \
+            [player.name for player in Roster('NOR').players]
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_loads_players_when_created(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('NOR')
+        requests = args[0].call_count
+
+        players = roster.players
+
+        assert requests > 1
+        assert args[0].call_count == requests
+        assert roster._players is players
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1224,8 +1317,7 @@ class TestNFLRoster:
             'MorsTh00': 'Thomas Morstead'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
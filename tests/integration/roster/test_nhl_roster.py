@@ -25,9 +25,10 @@ def mock_pyquery(url):
             self.status_code = status
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if 'BAD' in url or 'bad' in url:
-        return MockPQ(None, 404)
+        return MockPQ('', 404)
     if 'zettehe01' in url:
         return MockPQ(read_file('zettehe01'))
     if '2018' in url:
@@ -41,6 +42,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -48,6 +50,13 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class TestNHLPlayer:
     def setup_method(self):
         self.skater_results_career = {
@@ -426,7 +435,7 @@ class TestNHLPlayer:
             'wins': 22
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_skater_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('zettehe01')
@@ -435,7 +444,7 @@ class TestNHLPlayer:
         for attribute, value in self.skater_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_skater_returns_player_season_stats(self, *args, **kwargs):
         # Request the 2017 stats
         player = Player('zettehe01')
@@ -444,7 +453,7 @@ class TestNHLPlayer:
         for attribute, value in self.skater_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_goalie_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('howarja02')
@@ -453,7 +462,7 @@ class TestNHLPlayer:
         for attribute, value in self.goalie_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_goalie_returns_player_season_stats(self, *args, **kwargs):
         # Request the 2017 stats
         player = Player('howarja02')
@@ -462,7 +471,19 @@ class TestNHLPlayer:
         for attribute, value in self.goalie_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_seasons_returns_requested_seasons(self, *args, **kwargs):
+        player = Player('zettehe01')
+        dataframe = player.seasons(['2017-18', 'career', '1900'])
+
+        assert list(dataframe.index.get_level_values(0)) == \
+            ['2017-18', 'Career']
+        assert dataframe.loc['2017-18']['points'].iloc[0] == \
+            self.skater_results_2017['points']
+        assert dataframe.loc['Career']['points'].iloc[0] == \
+            self.skater_results_career['points']
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_dataframe_returns_dataframe(self, *args, **kwargs):
         dataframe = [
             {'adjusted_assists': 46,
@@ -662,14 +683,14 @@ class TestNHLPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_404_returns_none_with_no_errors(self, *args, **kwargs):
         player = Player('bad')
 
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_404_returns_none_for_different_season(self, *args, **kwargs):
         player = Player('bad')
 
@@ -678,7 +699,7 @@ class TestNHLPlayer:
 
 
 class TestNHLRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -690,12 +711,12 @@ class TestNHLRoster:
         for player in roster.players:
             assert player.name in ['Jimmy Howard', 'Henrik Zetterberg']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('bad')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -708,9 +729,81 @@ class TestNHLRoster:
 
         for player in team.roster.players:
             assert player.name in ['Jimmy Howard', 'Henrik Zetterberg']
-        type(team)._abbreviation = None
+        del type(team)._abbreviation
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_downloads_players_concurrently(self,
+                                                         *args,
+                                                         **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('DET', workers=3)
+        expected = [player.name for player in Roster('DET').players]
+
+        assert [player.name for player in roster.players] == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_class_parses_players_in_processes(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('DET', workers=2, processes=2)
+        expected = Roster('DET').players
+
+        assert [player.name for player in roster.players] == \
+            [player.name for player in expected]
+        for player, parsed in zip(roster.players, expected):
+            assert player.dataframe.equals(parsed.dataframe)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_iterates_over_players(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('DET', slim=True)
+
+        players = roster.iter_players(workers=2)
+
+        assert [player.player_id for player in players] == \
+            list(roster.players)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_streams_players_before_they_are_loaded(self, *args,
+                                                           **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        flexmock(utils) \
+            .should_call('_iter_pages') \
+            .with_args(list, utils.MAX_CONCURRENT_REQUESTS) \
+            .once()
+        roster = Roster('DET', lazy=True)
+        requests = args[0].call_count
+
+        players = roster.iter_players(processes=2)
+        first = next(players)
+
+        assert requests == 1
+        assert roster._players is None
+        assert [first.name] + [player.name for player in players] == \
+            [player.name for player in Roster('DET').players]
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_loads_players_when_created(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('DET')
+        requests = args[0].call_count
+
+        players = roster.players
+
+        assert requests > 1
+        assert args[0].call_count == requests
+        assert roster._players is players
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -723,8 +816,7 @@ class TestNHLRoster:
             'zettehe01': 'Henrik Zetterberg'
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
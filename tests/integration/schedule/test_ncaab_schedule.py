@@ -28,6 +28,7 @@ def mock_pyquery(url):
             self.status_code = 200
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
         def __call__(self, div):
             return read_file('table.html')
@@ -42,6 +43,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -49,14 +51,22 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class MockDateTime:
-    def __init__(self, year, month):
+    def __init__(self, year, month, day=1):
         self.year = year
         self.month = month
+        self.day = day
 
 
 class TestNCAABSchedule:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'game': 2,
@@ -138,19 +148,31 @@ class TestNCAABSchedule:
         assert len(result) == NUM_GAMES_IN_SCHEDULE
         assert set(result.columns.values) == set(self.results.keys())
 
-    def test_ncaab_schedule_all_dataframe_extended_returns_dataframe(self):
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_ncaab_schedule_all_dataframe_extended_returns_dataframe(self,
+                                                                     *args,
+                                                                     **kwargs):
         result = self.schedule.dataframe_extended
 
         assert len(result) == NUM_GAMES_IN_SCHEDULE
 
+    def test_ncaab_schedule_new_boxscores_skips_ingested_games(self):
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .replace_with(lambda uris, *args, **kwargs: list(uris))
+
+        result = self.schedule.new_boxscores({'2017-11-14-21-kansas'})
+
+        assert '2017-11-14-21-kansas' not in result
+        assert len(result) == NUM_GAMES_IN_SCHEDULE - 1
+
     def test_no_games_for_date_raises_value_error(self):
         with pytest.raises(ValueError):
             self.schedule(datetime.now())
 
 
 class TestNCAABScheduleInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -1,11 +1,14 @@
+import asyncio
 import mock
 import os
 import pandas as pd
 import pytest
 from flexmock import flexmock
 from sportsreference import utils
-from sportsreference.mlb.constants import STANDINGS_URL, TEAM_STATS_URL
-from sportsreference.mlb.teams import Teams
+from sportsreference.mlb.boxscore import Boxscore
+from sportsreference.mlb.constants import (SCHEDULE_URL, STANDINGS_URL,
+                                           TEAM_STATS_URL)
+from sportsreference.mlb.teams import Team, Teams
 
 
 MONTH = 4
@@ -23,6 +26,7 @@ def mock_pyquery(url):
             self.status_code = 200
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
         def __call__(self, div):
             if div == 'div#all_teams_standard_batting':
@@ -47,6 +51,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -54,14 +59,22 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class MockDateTime:
-    def __init__(self, year, month):
+    def __init__(self, year, month, day=1):
         self.year = year
         self.month = month
+        self.day = day
 
 
 class TestMLBIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 3,
@@ -179,14 +192,14 @@ class TestMLBIntegration:
             .should_receive('_todays_date') \
             .and_return(MockDateTime(YEAR, MONTH))
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_returns_correct_number_of_teams(self, *args,
                                                              **kwargs):
         teams = Teams()
 
         assert len(teams) == len(self.abbreviations)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_returns_correct_attributes_for_team(self,
                                                                  *args,
                                                                  **kwargs):
@@ -197,7 +210,7 @@ class TestMLBIntegration:
         for attribute, value in self.results.items():
             assert getattr(houston, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_returns_correct_team_abbreviations(self,
                                                                 *args,
                                                                 **kwargs):
@@ -206,7 +219,7 @@ class TestMLBIntegration:
         for team in teams:
             assert team.abbreviation in self.abbreviations
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_dataframe_returns_dataframe(self, *args,
                                                          **kwargs):
         teams = Teams()
@@ -224,7 +237,7 @@ class TestMLBIntegration:
 
         assert df1.empty
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_all_teams_dataframe_returns_dataframe(self,
                                                                    *args,
                                                                    **kwargs):
@@ -234,15 +247,38 @@ class TestMLBIntegration:
         assert len(result) == len(self.abbreviations)
         assert set(result.columns.values) == set(self.results.keys())
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_integration_lazy_teams_match_eager_teams(self,
+                                                          *args,
+                                                          **kwargs):
+        teams = Teams(lazy=True)
+
+        assert teams.dataframes.equals(Teams().dataframes)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_integration_teams_build_inside_event_loop(self,
+                                                           *args,
+                                                           **kwargs):
+        async def build():
+            return Teams()
+
+        # asyncio.run is only available from Python 3.7.
+        loop = asyncio.new_event_loop()
+        try:
+            teams = loop.run_until_complete(build())
+        finally:
+            loop.close()
+
+        assert teams.dataframes.equals(Teams().dataframes)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_invalid_team_name_raises_value_error(self, *args, **kwargs):
         teams = Teams()
 
         with pytest.raises(ValueError):
             teams('INVALID_NAME')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_mlb_invalid_default_year_reverts_to_previous_year(self,
                                                                *args,
                                                                **kwargs):
@@ -254,3 +290,37 @@ class TestMLBIntegration:
 
         for team in teams:
             assert team._year == '2017'
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_mlb_teams_new_boxscores_skips_ingested_and_repeated_games(
+            self, *args, **kwargs):
+        teams = Teams()
+        teams._teams = teams._teams[:2]
+        urls = [SCHEDULE_URL % (team._abbreviation, team._year)
+                for team in teams._teams]
+        schedules = [
+            [flexmock(_boxscore='game-1', _dataframe_fields={}),
+             flexmock(_boxscore='game-2', _dataframe_fields={}),
+             flexmock(_boxscore='game-3', _dataframe_fields=None)],
+            [flexmock(_boxscore='game-2', _dataframe_fields={}),
+             flexmock(_boxscore='game-4', _dataframe_fields={})]
+        ]
+        flexmock(utils) \
+            .should_receive('_fetch_pages') \
+            .with_args(urls, utils.MAX_CONCURRENT_REQUESTS, bool) \
+            .and_return({}) \
+            .once()
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-2', 'game-4'], utils.MAX_CONCURRENT_REQUESTS,
+                       processes=None) \
+            .replace_with(lambda uris, *args, **kwargs:
+                          ['boxscore %s' % uri for uri in uris]) \
+            .once()
+
+        schedule = mock.PropertyMock(side_effect=schedules)
+        with mock.patch.object(Team, 'schedule', schedule):
+            result = teams.new_boxscores({'game-1'})
+
+        assert result == {'game-2': 'boxscore game-2',
+                          'game-4': 'boxscore game-4'}
@@ -1,15 +1,18 @@
+import asyncio
 import mock
 import os
 import pandas as pd
 import pytest
 from flexmock import flexmock
 from sportsreference import utils
+from sportsreference.ncaab.boxscore import Boxscore
 from sportsreference.ncaab.conferences import Conferences
 from sportsreference.ncaab.constants import (ADVANCED_OPPONENT_STATS_URL,
                                              ADVANCED_STATS_URL,
                                              BASIC_OPPONENT_STATS_URL,
-                                             BASIC_STATS_URL)
-from sportsreference.ncaab.teams import Teams
+                                             BASIC_STATS_URL,
+                                             SCHEDULE_URL)
+from sportsreference.ncaab.teams import Team, Teams
 
 
 MONTH = 1
@@ -27,6 +30,7 @@ def mock_pyquery(url):
             self.status_code = 200
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
         def __call__(self, div):
             if div == 'table#basic_school_stats':
@@ -59,6 +63,7 @@ def mock_request(url):
             self.status_code = status_code
             self.html_contents = html_contents
             self.text = html_contents
+            self.content = html_contents.encode('utf-8')
 
     if str(YEAR) in url:
         return MockRequest('good')
@@ -66,14 +71,22 @@ def mock_request(url):
         return MockRequest('bad', status_code=404)
 
 
+def mock_missing_season(url):
+    # Pages for the season after the saved one don't exist yet.
+    if str(YEAR + 1) in url:
+        return mock_request(url)
+    return mock_pyquery(url)
+
+
 class MockDateTime:
-    def __init__(self, year, month):
+    def __init__(self, year, month, day=1):
         self.year = year
         self.month = month
+        self.day = day
 
 
 class TestNCAABIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'conference': 'big-ten',
@@ -655,14 +668,69 @@ class TestNCAABIntegration:
         assert len(result) == len(self.abbreviations)
         assert set(result.columns.values) == set(self.results.keys())
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_ncaab_integration_lazy_teams_match_eager_teams(self,
+                                                            *args,
+                                                            **kwargs):
+        teams = Teams(lazy=True)
+
+        assert teams.dataframes.equals(self.teams.dataframes)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_ncaab_integration_teams_build_inside_event_loop(self,
+                                                             *args,
+                                                             **kwargs):
+        async def build():
+            return Teams()
+
+        # asyncio.run is only available from Python 3.7.
+        loop = asyncio.new_event_loop()
+        try:
+            teams = loop.run_until_complete(build())
+        finally:
+            loop.close()
+
+        assert teams.dataframes.equals(self.teams.dataframes)
+
     def test_ncaab_invalid_team_name_raises_value_error(self):
         with pytest.raises(ValueError):
             self.teams('INVALID_NAME')
 
+    def test_ncaab_teams_new_boxscores_skips_ingested_and_repeated_games(self):
+        teams = self.teams
+        teams._teams = teams._teams[:2]
+        urls = [SCHEDULE_URL % (team._abbreviation.lower(), team._year)
+                for team in teams._teams]
+        schedules = [
+            [flexmock(_boxscore='game-1', _dataframe_fields={}),
+             flexmock(_boxscore='game-2', _dataframe_fields={}),
+             flexmock(_boxscore='game-3', _dataframe_fields=None)],
+            [flexmock(_boxscore='game-2', _dataframe_fields={}),
+             flexmock(_boxscore='game-4', _dataframe_fields={})]
+        ]
+        flexmock(utils) \
+            .should_receive('_fetch_pages') \
+            .with_args(urls, utils.MAX_CONCURRENT_REQUESTS, bool) \
+            .and_return({}) \
+            .once()
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-2', 'game-4'], utils.MAX_CONCURRENT_REQUESTS,
+                       processes=None) \
+            .replace_with(lambda uris, *args, **kwargs:
+                          ['boxscore %s' % uri for uri in uris]) \
+            .once()
+
+        schedule = mock.PropertyMock(side_effect=schedules)
+        with mock.patch.object(Team, 'schedule', schedule):
+            result = teams.new_boxscores({'game-1'})
+
+        assert result == {'game-2': 'boxscore game-2',
+                          'game-4': 'boxscore game-4'}
+
 
 class TestNCAABIntegrationInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_missing_season)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
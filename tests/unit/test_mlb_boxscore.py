@@ -3,8 +3,10 @@ from mock import patch, PropertyMock
 from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import AWAY, HOME
-from sportsreference.mlb.boxscore import Boxscore, Boxscores
-from sportsreference.mlb.constants import DAY, NIGHT
+from sportsreference.mlb.boxscore import (Boxscore,
+                                          BoxscorePlayer,
+                                          Boxscores)
+from sportsreference.mlb.constants import DAY, NIGHT, PLAYER_SCHEME
 from urllib.error import HTTPError
 
 
@@ -16,23 +18,10 @@ class MockName:
         return self._name
 
 
-class MockField:
-    def __init__(self, field):
-        self._field = field
-
-    def text(self):
-        return self._field
-
-
-class MockBoxscoreData:
-    def __init__(self, fields):
-        self._fields = fields
-
-    def __call__(self, field):
-        return self
-
-    def items(self):
-        return [self._fields]
+def mock_scorebox_meta(game_info):
+    # Each line of the game information is a separate element on the page.
+    lines = ''.join('<div>%s</div>' % line for line in game_info.splitlines())
+    return pq('<div class="scorebox_meta">%s</div>' % lines)
 
 
 def mock_pyquery(url):
@@ -49,7 +38,7 @@ def mock_pyquery(url):
 
 
 class TestMLBBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -169,7 +158,7 @@ class TestMLBBoxscore:
 
         assert self.boxscore.losing_abbr == expected_name
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         result = Boxscore(None)._retrieve_html_page('')
 
@@ -193,7 +182,7 @@ Game Duration: 2:55
 Night Game, on grass
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -217,7 +206,7 @@ Night Game, on grass
 First game of doubleheader
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -241,7 +230,7 @@ Night Game, on grass
 Second game of doubleheader
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -264,7 +253,7 @@ Game Duration: 3:43
 Day Game, on grass
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -321,7 +310,7 @@ Day Game, on grass
 
 
 class TestMLBBoxscores:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores) \
             .should_receive('_find_games') \
@@ -408,3 +397,21 @@ class TestMLBBoxscores:
                 'winning_name': None
             }
         ]
+
+
+class TestMLBBoxscorePlayer:
+    def test_every_scheme_property_has_a_slot(self):
+        properties = [name for name in dir(BoxscorePlayer)
+                      if isinstance(getattr(BoxscorePlayer, name), property)]
+        missing = [name for name in properties
+                   if name in PLAYER_SCHEME and
+                   '_%s' % name not in BoxscorePlayer.__slots__]
+
+        assert missing == []
+
+    def test_every_slot_is_in_the_scheme(self):
+        extras = ['_index', '_player_id']
+        unknown = [slot for slot in BoxscorePlayer.__slots__
+                   if slot[1:] not in PLAYER_SCHEME and slot not in extras]
+
+        assert unknown == []
@@ -56,16 +56,18 @@ class TestMLBPlayer:
         mock_position = PropertyMock(return_value=[''])
         mock_season = PropertyMock(return_value='2018')
         mock_seasons = PropertyMock(return_value=['2018'])
+        mock_season_index = PropertyMock(return_value={'2018': 0})
         player = Player(None)
         type(player)._position = mock_position
         type(player)._season = mock_seasons
+        type(player)._season_index = mock_season_index
         type(player)._most_recent_season = mock_season
 
         result = player.position
 
         assert result is None
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_return_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
@@ -6,7 +6,8 @@ from sportsreference.constants import (AWAY,
                                        HOME,
                                        LOSS,
                                        WIN)
-from sportsreference.mlb.constants import DAY, NIGHT
+from sportsreference.mlb.boxscore import Boxscore
+from sportsreference.mlb.constants import DAY, NIGHT, SCHEDULE_SCHEME
 from sportsreference.mlb.schedule import Game, Schedule
 
 
@@ -18,6 +19,12 @@ class TestMLBSchedule:
 
         self.game = Game(None, None)
 
+    def test_every_scheme_field_has_a_slot(self):
+        missing = [field for field in SCHEDULE_SCHEME
+                   if '_%s' % field not in Game.__slots__]
+
+        assert missing == []
+
     def test_double_header_returns_second_game(self):
         fake_date = PropertyMock(return_value='Sunday, May 14 (2)')
         fake_year = PropertyMock(return_value='2017')
@@ -141,10 +148,17 @@ class TestMLBSchedule:
             .and_return(None)
         schedule = Schedule('HOU')
 
-        fake_game = flexmock(dataframe_extended=None)
+        fake_game = flexmock(_runs_scored=5, _runs_allowed=3,
+                             _boxscore='game-1')
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-1']) \
+            .and_return([flexmock(dataframe=None)]) \
+            .once()
+
         assert schedule.dataframe_extended is None
 
     def test_bad_games_up_returns_default(self):
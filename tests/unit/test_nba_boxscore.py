@@ -3,7 +3,10 @@ from mock import patch, PropertyMock
 from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import AWAY, HOME
-from sportsreference.nba.boxscore import Boxscore, Boxscores
+from sportsreference.nba.boxscore import (Boxscore,
+                                          BoxscorePlayer,
+                                          Boxscores)
+from sportsreference.nba.constants import PLAYER_SCHEME
 
 
 class MockName:
@@ -14,23 +17,10 @@ class MockName:
         return self._name
 
 
-class MockField:
-    def __init__(self, field):
-        self._field = field
-
-    def text(self):
-        return self._field
-
-
-class MockBoxscoreData:
-    def __init__(self, fields):
-        self._fields = fields
-
-    def __call__(self, field):
-        return self
-
-    def items(self):
-        return [self._fields]
+def mock_scorebox_meta(game_info):
+    # Each line of the game information is a separate element on the page.
+    lines = ''.join('<div>%s</div>' % line for line in game_info.splitlines())
+    return pq('<div class="scorebox_meta">%s</div>' % lines)
 
 
 def mock_pyquery(url):
@@ -45,7 +35,7 @@ def mock_pyquery(url):
 
 
 class TestNBABoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -212,7 +202,7 @@ State Farm Arena, Atlanta, Georgia
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         for field, value in fields.items():
             result = self.boxscore._parse_game_date_and_location(field, m)
@@ -227,7 +217,7 @@ Logos via Sports Logos.net / About logos
         mock_field = """7:30 PM, November 9, 2018
 Logos via Sports Logos.net / About logos"""
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         for field, value in fields.items():
             result = self.boxscore._parse_game_date_and_location(field, m)
@@ -235,7 +225,7 @@ Logos via Sports Logos.net / About logos"""
 
 
 class TestNBABoxscores:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores) \
             .should_receive('_find_games') \
@@ -322,3 +312,21 @@ class TestNBABoxscores:
                 'away_score': None
             }
         ]
+
+
+class TestNBABoxscorePlayer:
+    def test_every_scheme_property_has_a_slot(self):
+        properties = [name for name in dir(BoxscorePlayer)
+                      if isinstance(getattr(BoxscorePlayer, name), property)]
+        missing = [name for name in properties
+                   if name in PLAYER_SCHEME and
+                   '_%s' % name not in BoxscorePlayer.__slots__]
+
+        assert missing == []
+
+    def test_every_slot_is_in_the_scheme(self):
+        extras = ['_index', '_player_id']
+        unknown = [slot for slot in BoxscorePlayer.__slots__
+                   if slot[1:] not in PLAYER_SCHEME and slot not in extras]
+
+        assert unknown == []
@@ -65,7 +65,7 @@ class TestNBAPlayer:
 
         assert result is None
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
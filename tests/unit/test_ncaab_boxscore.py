@@ -3,15 +3,10 @@ from mock import patch, PropertyMock
 from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import AWAY, HOME
-from sportsreference.ncaab.boxscore import Boxscore, Boxscores
-
-
-class MockBoxscore:
-    def __init__(self, name):
-        self._name = name
-
-    def __call__(self, scheme):
-        return self._name
+from sportsreference.ncaab.boxscore import (Boxscore,
+                                            BoxscorePlayer,
+                                            Boxscores)
+from sportsreference.ncaab.constants import PLAYER_SCHEME
 
 
 class MockName:
@@ -25,23 +20,10 @@ class MockName:
         return self._name.replace('<a>cbb/schools</a>', '')
 
 
-class MockField:
-    def __init__(self, field):
-        self._field = field
-
-    def text(self):
-        return self._field
-
-
-class MockBoxscoreData:
-    def __init__(self, fields):
-        self._fields = fields
-
-    def __call__(self, field):
-        return self
-
-    def items(self):
-        return [self._fields]
+def mock_scorebox_meta(game_info):
+    # Each line of the game information is a separate element on the page.
+    lines = ''.join('<div>%s</div>' % line for line in game_info.splitlines())
+    return pq('<div class="scorebox_meta">%s</div>' % lines)
 
 
 def mock_pyquery(url):
@@ -56,7 +38,7 @@ def mock_pyquery(url):
 
 
 class TestNCAABBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -319,7 +301,7 @@ class TestNCAABBoxscore:
 
     def test_parsing_name_for_non_di_school(self):
         name = 'Away name'
-        boxscore = MockBoxscore(name)
+        boxscore = pq('<div><a itemprop="name">%s</a></div>' % name)
 
         result = self.boxscore._parse_name('away_name', boxscore)
 
@@ -366,7 +348,7 @@ class TestNCAABBoxscore:
 
     def test_ranking_with_no_boxscores(self):
         ranking = self.boxscore._parse_ranking('home_ranking',
-                                               MockBoxscore(''))
+                                               pq('<div></div>'))
 
         assert ranking is None
 
@@ -381,7 +363,7 @@ WVU Coliseum, Morgantown, West Virginia
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         for field, value in fields.items():
             result = self.boxscore._parse_game_date_and_location(field, m)
@@ -396,7 +378,7 @@ Logos via Sports Logos.net / About logos
         mock_field = """November 9, 2018
 Logos via Sports Logos.net / About logos"""
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         for field, value in fields.items():
             result = self.boxscore._parse_game_date_and_location(field, m)
@@ -404,7 +386,7 @@ Logos via Sports Logos.net / About logos"""
 
 
 class TestNCAABBoxscores:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores) \
             .should_receive('_find_games') \
@@ -450,3 +432,21 @@ class TestNCAABBoxscores:
                 'losing_abbr': None
             }
         ]
+
+
+class TestNCAABBoxscorePlayer:
+    def test_every_scheme_property_has_a_slot(self):
+        properties = [name for name in dir(BoxscorePlayer)
+                      if isinstance(getattr(BoxscorePlayer, name), property)]
+        missing = [name for name in properties
+                   if name in PLAYER_SCHEME and
+                   '_%s' % name not in BoxscorePlayer.__slots__]
+
+        assert missing == []
+
+    def test_every_slot_is_in_the_scheme(self):
+        extras = ['_index', '_player_id', '_player_data']
+        unknown = [slot for slot in BoxscorePlayer.__slots__
+                   if slot[1:] not in PLAYER_SCHEME and slot not in extras]
+
+        assert unknown == []
@@ -10,10 +10,12 @@ from sportsreference.constants import (AWAY,
                                        NON_DI,
                                        REGULAR_SEASON,
                                        WIN)
+from sportsreference.ncaab.boxscore import Boxscore
 from sportsreference.ncaab.constants import (CBI_TOURNAMENT,
                                              CIT_TOURNAMENT,
                                              NCAA_TOURNAMENT,
-                                             NIT_TOURNAMENT)
+                                             NIT_TOURNAMENT,
+                                             SCHEDULE_SCHEME)
 from sportsreference.ncaab.schedule import Game, Schedule
 
 
@@ -25,6 +27,12 @@ class TestNCAABSchedule:
 
         self.game = Game(None)
 
+    def test_every_scheme_field_has_a_slot(self):
+        missing = [field for field in SCHEDULE_SCHEME
+                   if '_%s' % field not in Game.__slots__]
+
+        assert missing == []
+
     def test_away_game_returns_away_location(self):
         fake_location = PropertyMock(return_value='@')
         type(self.game)._location = fake_location
@@ -151,7 +159,7 @@ class TestNCAABSchedule:
             .and_return(None)
         schedule = Schedule('PURDUE')
 
-        fake_game = flexmock(dataframe=None)
+        fake_game = flexmock(_dataframe_fields=None)
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
@@ -163,10 +171,17 @@ class TestNCAABSchedule:
             .and_return(None)
         schedule = Schedule('PURDUE')
 
-        fake_game = flexmock(dataframe_extended=None)
+        fake_game = flexmock(_points_for=70, _points_against=65,
+                             _boxscore='game-1')
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-1']) \
+            .and_return([flexmock(dataframe=None)]) \
+            .once()
+
         assert schedule.dataframe_extended is None
 
 
@@ -3,26 +3,16 @@ from mock import patch, PropertyMock
 from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import AWAY, HOME
-from sportsreference.ncaaf.boxscore import Boxscore, Boxscores
+from sportsreference.ncaaf.boxscore import (Boxscore,
+                                            BoxscorePlayer,
+                                            Boxscores)
+from sportsreference.ncaaf.constants import PLAYER_SCHEME
 
 
-class MockField:
-    def __init__(self, field):
-        self._field = field
-
-    def text(self):
-        return self._field
-
-
-class MockBoxscoreData:
-    def __init__(self, fields):
-        self._fields = fields
-
-    def __call__(self, field):
-        return self
-
-    def items(self):
-        return [self._fields]
+def mock_scorebox_meta(game_info):
+    # Each line of the game information is a separate element on the page.
+    lines = ''.join('<div>%s</div>' % line for line in game_info.splitlines())
+    return pq('<div class="scorebox_meta">%s</div>' % lines)
 
 
 class MockName:
@@ -48,7 +38,7 @@ def mock_pyquery(url):
 
 
 class TestNCAAFBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -298,7 +288,7 @@ class TestNCAAFBoxscore:
 Ross-Ade Stadium - West Lafayette, Indiana
 Logos via Sports Logos.net / About logos
 """
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -318,7 +308,7 @@ Saturday Dec 2, 2017
 Lucas Oil Stadium - Indianapolis, Indiana
 Logos via Sports Logos.net / About logos
 """
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -335,7 +325,7 @@ Logos via Sports Logos.net / About logos
         mock_field = """Friday Nov 24, 2017
 Logos via Sports Logos.net / About logos
 """
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -350,7 +340,7 @@ Logos via Sports Logos.net / About logos
         }
 
         mock_field = 'Friday Nov 24, 2017'
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -368,7 +358,7 @@ Logos via Sports Logos.net / About logos
 Saturday Dec 2, 2017
 Logos via Sports Logos.net / About logos
 """
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -385,7 +375,7 @@ Logos via Sports Logos.net / About logos
         mock_field = """Big Ten Conference Championship
 Logos via Sports Logos.net / About logos
 """
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -414,7 +404,7 @@ Logos via Sports Logos.net / About logos
 
 
 class TestNCAABBoxscores:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores) \
             .should_receive('_find_games') \
@@ -463,3 +453,21 @@ class TestNCAABBoxscores:
                 'losing_abbr': None
             }
         ]
+
+
+class TestNCAAFBoxscorePlayer:
+    def test_every_scheme_property_has_a_slot(self):
+        properties = [name for name in dir(BoxscorePlayer)
+                      if isinstance(getattr(BoxscorePlayer, name), property)]
+        missing = [name for name in properties
+                   if name in PLAYER_SCHEME and
+                   '_%s' % name not in BoxscorePlayer.__slots__]
+
+        assert missing == []
+
+    def test_every_slot_is_in_the_scheme(self):
+        extras = ['_index', '_player_id']
+        unknown = [slot for slot in BoxscorePlayer.__slots__
+                   if slot[1:] not in PLAYER_SCHEME and slot not in extras]
+
+        assert unknown == []
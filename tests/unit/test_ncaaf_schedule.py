@@ -11,6 +11,8 @@ from sportsreference.constants import (AWAY,
                                        NON_DI,
                                        REGULAR_SEASON,
                                        WIN)
+from sportsreference.ncaaf.boxscore import Boxscore
+from sportsreference.ncaaf.constants import SCHEDULE_SCHEME
 from sportsreference.ncaaf.schedule import Game, Schedule
 
 
@@ -22,6 +24,12 @@ class TestNCAAFSchedule:
 
         self.game = Game(None)
 
+    def test_every_scheme_field_has_a_slot(self):
+        missing = [field for field in SCHEDULE_SCHEME
+                   if '_%s' % field not in Game.__slots__]
+
+        assert missing == []
+
     def test_away_game_returns_away_location(self):
         fake_location = PropertyMock(return_value='@')
         type(self.game)._location = fake_location
@@ -95,7 +103,7 @@ class TestNCAAFSchedule:
             .and_return(None)
         schedule = Schedule('PURDUE')
 
-        fake_game = flexmock(dataframe=None)
+        fake_game = flexmock(_dataframe_fields=None)
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
@@ -107,10 +115,16 @@ class TestNCAAFSchedule:
             .and_return(None)
         schedule = Schedule('PURDUE')
 
-        fake_game = flexmock(dataframe_extended=None)
+        fake_game = flexmock(_boxscore='game-1')
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-1']) \
+            .and_return([flexmock(dataframe=None)]) \
+            .once()
+
         assert schedule.dataframe_extended is None
 
 
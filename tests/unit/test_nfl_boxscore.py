@@ -4,7 +4,10 @@ from pyquery import PyQuery as pq
 from os.path import dirname, join
 from sportsreference import utils
 from sportsreference.constants import AWAY, HOME
-from sportsreference.nfl.boxscore import Boxscore, Boxscores
+from sportsreference.nfl.boxscore import (Boxscore,
+                                          BoxscorePlayer,
+                                          Boxscores)
+from sportsreference.nfl.constants import PLAYER_SCHEME
 
 
 class MockName:
@@ -15,23 +18,10 @@ class MockName:
         return self._name
 
 
-class MockField:
-    def __init__(self, field):
-        self._field = field
-
-    def text(self):
-        return self._field
-
-
-class MockBoxscoreData:
-    def __init__(self, fields):
-        self._fields = fields
-
-    def __call__(self, field):
-        return self
-
-    def items(self):
-        return [self._fields]
+def mock_scorebox_meta(game_info):
+    # Each line of the game information is a separate element on the page.
+    lines = ''.join('<div>%s</div>' % line for line in game_info.splitlines())
+    return pq('<div class="scorebox_meta">%s</div>' % lines)
 
 
 def read_file(filename):
@@ -57,7 +47,7 @@ def mock_pyquery(url, status_code=404):
 
 
 class TestNFLBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -177,7 +167,7 @@ class TestNFLBoxscore:
 
         assert self.boxscore.losing_abbr == expected_name
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         result = Boxscore(None)._retrieve_html_page('bad')
 
@@ -224,7 +214,7 @@ Time of Game: 2:49
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -245,7 +235,7 @@ Attendance: 22,000
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -267,7 +257,7 @@ itemprop="name">New England Patriots</a>')
 
 
 class TestNFLBoxscores:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores) \
             .should_receive('_find_games') \
@@ -360,3 +350,21 @@ class TestNFLBoxscores:
                 'away_score': None
             }
         ]
+
+
+class TestNFLBoxscorePlayer:
+    def test_every_scheme_property_has_a_slot(self):
+        properties = [name for name in dir(BoxscorePlayer)
+                      if isinstance(getattr(BoxscorePlayer, name), property)]
+        missing = [name for name in properties
+                   if name in PLAYER_SCHEME and
+                   '_%s' % name not in BoxscorePlayer.__slots__]
+
+        assert missing == []
+
+    def test_every_slot_is_in_the_scheme(self):
+        extras = ['_index', '_player_id']
+        unknown = [slot for slot in BoxscorePlayer.__slots__
+                   if slot[1:] not in PLAYER_SCHEME and slot not in extras]
+
+        assert unknown == []
@@ -29,7 +29,7 @@ class TestNFLPlayer:
             .should_receive('_find_initial_index') \
             .and_return(None)
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
@@ -7,8 +7,10 @@ from sportsreference.constants import (AWAY,
                                        POST_SEASON,
                                        REGULAR_SEASON,
                                        WIN)
+from sportsreference.nfl.boxscore import Boxscore
 from sportsreference.nfl.constants import (CONF_CHAMPIONSHIP,
                                            DIVISION,
+                                           SCHEDULE_SCHEME,
                                            SUPER_BOWL,
                                            WILD_CARD)
 from sportsreference.nfl.schedule import Game, Schedule
@@ -25,6 +27,12 @@ class TestNFLSchedule:
 
         self.game = Game(None, REGULAR_SEASON, YEAR)
 
+    def test_every_scheme_field_has_a_slot(self):
+        missing = [field for field in SCHEDULE_SCHEME
+                   if '_%s' % field not in Game.__slots__]
+
+        assert missing == []
+
     def test_away_game_returns_away_location(self):
         fake_location = PropertyMock(return_value='@')
         type(self.game)._location = fake_location
@@ -110,7 +118,7 @@ class TestNFLSchedule:
             .and_return(None)
         schedule = Schedule('DET')
 
-        fake_game = flexmock(dataframe=None)
+        fake_game = flexmock(_dataframe_fields=None)
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
@@ -122,8 +130,14 @@ class TestNFLSchedule:
             .and_return(None)
         schedule = Schedule('DET')
 
-        fake_game = flexmock(dataframe_extended=None)
+        fake_game = flexmock(_boxscore='game-1')
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-1']) \
+            .and_return([flexmock(dataframe=None)]) \
+            .once()
+
         assert schedule.dataframe_extended is None
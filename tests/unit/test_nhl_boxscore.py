@@ -3,26 +3,16 @@ from mock import patch, PropertyMock
 from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.constants import AWAY, HOME
-from sportsreference.nhl.boxscore import Boxscore, Boxscores
+from sportsreference.nhl.boxscore import (Boxscore,
+                                          BoxscorePlayer,
+                                          Boxscores)
+from sportsreference.nhl.constants import PLAYER_SCHEME
 
 
-class MockField:
-    def __init__(self, field):
-        self._field = field
-
-    def text(self):
-        return self._field
-
-
-class MockBoxscoreData:
-    def __init__(self, fields):
-        self._fields = fields
-
-    def __call__(self, field):
-        return self
-
-    def items(self):
-        return [self._fields]
+def mock_scorebox_meta(game_info):
+    # Each line of the game information is a separate element on the page.
+    lines = ''.join('<div>%s</div>' % line for line in game_info.splitlines())
+    return pq('<div class="scorebox_meta">%s</div>' % lines)
 
 
 class MockName:
@@ -45,7 +35,7 @@ def mock_pyquery(url):
 
 
 class TestNHLBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -271,7 +261,7 @@ Game Duration: 2:39
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -295,7 +285,7 @@ Game Duration: 2:45
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -313,7 +303,7 @@ Logos via Sports Logos.net / About logos
 
         mock_field = '\n'
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -335,7 +325,7 @@ Arena: T-Mobile Arena
 Logos via Sports Logos.net / About logos
 """
 
-        m = MockBoxscoreData(MockField(mock_field))
+        m = mock_scorebox_meta(mock_field)
 
         self.boxscore._parse_game_date_and_location(m)
         for field, value in fields.items():
@@ -508,7 +498,7 @@ Logos via Sports Logos.net / About logos
 
 
 class TestMLBBoxscores:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscores) \
             .should_receive('_find_games') \
@@ -595,3 +585,24 @@ class TestMLBBoxscores:
                 'winning_name': None
             }
         ]
+
+
+class TestNHLBoxscorePlayer:
+    def test_every_scheme_property_has_a_slot(self):
+        properties = [name for name in dir(BoxscorePlayer)
+                      if isinstance(getattr(BoxscorePlayer, name), property)]
+        # The defensive zone start percentage is derived from the offensive
+        # zone start percentage instead of being parsed.
+        missing = [name for name in properties
+                   if name in PLAYER_SCHEME and
+                   '_%s' % name not in BoxscorePlayer.__slots__ and
+                   name != 'defensive_zone_start_percentage']
+
+        assert missing == []
+
+    def test_every_slot_is_in_the_scheme(self):
+        extras = ['_index', '_player_id']
+        unknown = [slot for slot in BoxscorePlayer.__slots__
+                   if slot[1:] not in PLAYER_SCHEME and slot not in extras]
+
+        assert unknown == []
@@ -7,7 +7,10 @@ from sportsreference.constants import (AWAY,
                                        POST_SEASON,
                                        REGULAR_SEASON,
                                        WIN)
-from sportsreference.nhl.constants import OVERTIME_LOSS, SHOOTOUT
+from sportsreference.nhl.boxscore import Boxscore
+from sportsreference.nhl.constants import (OVERTIME_LOSS,
+                                           SCHEDULE_SCHEME,
+                                           SHOOTOUT)
 from sportsreference.nhl.schedule import Game, Schedule
 
 
@@ -22,6 +25,14 @@ class TestNHLSchedule:
 
         self.game = Game(None, YEAR)
 
+    def test_every_scheme_field_has_a_slot(self):
+        # The start time is in the scheme but is not exposed by a Game.
+        missing = [field for field in SCHEDULE_SCHEME
+                   if '_%s' % field not in Game.__slots__ and
+                   field != 'time']
+
+        assert missing == []
+
     def test_away_game_returns_away_location(self):
         fake_location = PropertyMock(return_value='@')
         type(self.game)._location = fake_location
@@ -241,7 +252,7 @@ class TestNHLSchedule:
             .and_return(None)
         schedule = Schedule('DET')
 
-        fake_game = flexmock(dataframe=None)
+        fake_game = flexmock(_dataframe_fields=None)
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
@@ -253,8 +264,14 @@ class TestNHLSchedule:
             .and_return(None)
         schedule = Schedule('DET')
 
-        fake_game = flexmock(dataframe_extended=None)
+        fake_game = flexmock(_boxscore='game-1')
         fake_games = PropertyMock(return_value=fake_game)
         type(schedule).__iter__ = fake_games
 
+        flexmock(Boxscore) \
+            .should_receive('fetch_many') \
+            .with_args(['game-1']) \
+            .and_return([flexmock(dataframe=None)]) \
+            .once()
+
         assert schedule.dataframe_extended is None
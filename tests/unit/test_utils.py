@@ -1,6 +1,16 @@
+import asyncio
+import gc
+import os
+import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from mock import patch
+from pyquery import PyQuery as pq
 from flexmock import flexmock
+from lxml import etree
 from sportsreference import utils
+from urllib.error import HTTPError
 
 
 class SeasonStarts:
@@ -48,6 +58,15 @@ class MockHtml:
         return Html(self.html_string, self.item_list)
 
 
+class MockLazy:
+    def __init__(self, parse):
+        self._deferred_fields = {'_points'}
+        self._parse = parse
+
+    def __getattr__(self, name):
+        return utils._parse_deferred_field(self, name, self._parse)
+
+
 def mock_pyquery(url):
     class MockPQ:
         def __init__(self, html_contents, status_code=200):
@@ -62,6 +81,40 @@ def mock_pyquery(url):
     return MockPQ('This is good', 200)
 
 
+def mock_revalidated_page(url, headers=None):
+    class MockResponse:
+        def __init__(self, text, status_code):
+            self.status_code = status_code
+            self.text = text
+            self.headers = {'ETag': '"v1"',
+                            'Last-Modified': 'Sat, 01 Jun 2019 00:00:00 GMT'}
+
+    if headers and headers.get('If-None-Match') == '"v1"':
+        return MockResponse('', 304)
+    return MockResponse('<p>This is good</p>', 200)
+
+
+class MockThrottledPages:
+    def __init__(self, throttled_count, retry_after=None):
+        self.throttled_count = throttled_count
+        self.retry_after = retry_after
+
+    def __call__(self, url):
+        class MockResponse:
+            def __init__(self, status_code, headers):
+                self.status_code = status_code
+                self.text = 'This is good'
+                self.headers = headers
+
+        if self.throttled_count:
+            self.throttled_count -= 1
+            headers = {}
+            if self.retry_after:
+                headers['Retry-After'] = self.retry_after
+            return MockResponse(429, headers)
+        return MockResponse(200, {})
+
+
 class TestUtils:
     def test__find_year_for_season_returns_correct_year(self):
         season_start_matrix = [
@@ -154,37 +207,45 @@ class TestUtils:
             result = utils._find_year_for_season(month.league)
             assert result == month.expected_year
 
-    def test_remove_html_comment_tags_removes_comments(self):
-        html_string = '''<html>
+    def test_uncomment_html_keeps_comment_contents(self):
+        html_string = """<html>
     <body>
         <!--<p>This should be kept.</p>-->
     </body>
-</html>'''
-        expected_output = '''<html>
-    <body>
-        <p>This should be kept.</p>
-    </body>
-</html>'''
+</html>"""
 
-        result = utils._remove_html_comment_tags(html_string)
+        result = utils._uncomment_html(pq(html_string, parser='html'))
 
-        assert result == expected_output
+        assert result('p').text() == 'This should be kept.'
+        assert not list(result[0].iter(etree.Comment))
 
-    def test_remove_html_comment_tags_without_comments_doesnt_change(self):
-        html_string = '''<html>
-    <body>
-        <p>This should be the same.</p>
-    </body>
-</html>'''
-        expected_output = '''<html>
-    <body>
-        <p>This should be the same.</p>
-    </body>
-</html>'''
+    def test_uncomment_html_without_comments_doesnt_change(self):
+        html_string = '<div><p>This should be the same.</p></div>'
+
+        result = utils._uncomment_html(pq(html_string, parser='html'))
 
-        result = utils._remove_html_comment_tags(html_string)
+        assert str(result) == html_string
 
-        assert result == expected_output
+    def test_uncomment_html_includes_commented_tables(self):
+        html_string = """<div id="all_stats">before <!--
+<table id="stats"><tbody><tr><td data-stat="pts">1</td></tr></tbody>
+</table> inside-->after <!-- note --><p>end</p></div>"""
+
+        result = utils._uncomment_html(pq(html_string, parser='html'))
+
+        assert result('table#stats td').text() == '1'
+        assert result.text() == 'before\n1\ninsideafter note\nend'
+        assert not list(result[0].iter(etree.Comment))
+
+    def test_stats_table_leaves_commented_page_unchanged(self):
+        html = pq("""<div><div id="all_stats"><!--
+<table id="stats"><tbody><tr><td>1</td></tr><tr><td>2</td></tr></tbody>
+</table>--></div></div>""", parser='html')
+
+        rows = list(utils._get_stats_table(html, 'div#all_stats'))
+
+        assert [row.text() for row in rows] == ['1', '2']
+        assert not html('table')
 
     def test_abbreviation_is_parsed_correctly(self):
         test_abbreviations = {'/teams/ARI/2018.shtml': 'ARI',
@@ -221,7 +282,7 @@ class TestUtils:
         expected = None
 
         result = utils._parse_field(parsing_scheme,
-                                    MockHtml(html_string, [expected]),
+                                    pq(html_string),
                                     'batters_used',
                                     index=3)
         assert result == expected
@@ -234,13 +295,14 @@ class TestUtils:
         expected = '32'
 
         result = utils._parse_field(parsing_scheme,
-                                    MockHtml(html_string, [expected]),
+                                    pq(html_string),
                                     'batters_used')
         assert result == expected
 
     def test__get_stats_table_returns_correct_table(self):
-        html_string = '''<div>
-    <table class="stats_table" id="all_stats">
+        html_string = '''<div id="all_stats">
+<!--
+    <table class="stats_table">
         <tbody>
             <tr data-row="0">
                 <td class="right " data-stat="column1">1</td>
@@ -250,39 +312,577 @@ class TestUtils:
             </tr>
         </tbody>
     </table>
+-->
 </div>'''
-        expected = ['<tr data-row="0">\n<td class="right " '
-                    'data-stat="column1">1</td>\n</tr>',
-                    '<tr data-row="1">\n<td class="right " '
-                    'data-stat="column2">2</td>\n</tr>']
-        div = 'table#all_stats'
+        html = pq(html_string)
+        div = 'div#all_stats'
         flexmock(utils) \
-            .should_receive('_remove_html_comment_tags') \
-            .and_return(html_string) \
+            .should_call('_uncomment_html') \
             .once()
 
-        result = utils._get_stats_table(MockHtml(html_string, expected), div)
+        result = utils._get_stats_table(html, div)
+
+        assert [row.text() for row in result] == ['1', '2']
+        assert not html('table')
+
+    def test_session_is_reused_for_same_host(self):
+        first = utils._get_session('https://www.example.com/page/1.html')
+        second = utils._get_session('https://www.example.com/page/2.html')
+        other = utils._get_session('https://www.other.com/page/1.html')
+
+        assert first is second
+        assert first is not other
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_pull_page_returns_pyquery_object(self, *args, **kwargs):
+        page = utils._pull_page('http://www.good_url.com/this/is/valid')
+
+        assert page.text() == 'This is good'
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_pull_page_raises_http_error_on_404(self, *args, **kwargs):
+        with pytest.raises(HTTPError):
+            utils._pull_page('http://www.404.com/doesnt/exist')
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_cached_page_is_not_downloaded_again(self, mock_get, tmpdir):
+        url = 'http://www.good_url.com/this/is/valid'
+        utils.enable_cache(str(tmpdir))
+        try:
+            first = utils._fetch_page(url)
+            second = utils._fetch_page(url)
+        finally:
+            utils.disable_cache()
+
+        assert first == second == 'This is good'
+        assert mock_get.call_count == 1
+
+    def test_response_body_is_parsed_from_utf8_bytes(self):
+        class MockResponse:
+            def __init__(self, content, content_type):
+                self.content = content
+                self.headers = {'Content-Type': content_type}
+
+        html = '<html><body><p>Montréal</p></body></html>'
+        utf8 = MockResponse(html.encode('utf-8'), 'text/html; charset=UTF-8')
+        latin = MockResponse(html.encode('latin-1'),
+                             'text/html; charset=ISO-8859-1')
+
+        for response in [utf8, latin]:
+            body = utils._response_body(response)
+
+            assert body == html.encode('utf-8')
+            assert utils._parse_page(body)('p').text() == 'Montréal'
+
+    def test_cache_keeps_body_type(self, tmpdir):
+        utils.enable_cache(str(tmpdir))
+        try:
+            utils._page_cache.set('http://a.com', b'<p>\xc3\xa9</p>')
+            utils._page_cache.set('http://b.com', '<p>é</p>')
+            first = utils._page_cache.get('http://a.com')
+            second = utils._page_cache.get('http://b.com')
+        finally:
+            utils.disable_cache()
+
+        assert first == '<p>é</p>'.encode('utf-8')
+        assert second == '<p>é</p>'
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_expired_page_is_downloaded_again(self, mock_get, tmpdir):
+        url = 'http://www.good_url.com/this/is/valid'
+        utils.enable_cache(str(tmpdir), ttl=-1)
+        try:
+            utils._fetch_page(url)
+            utils._fetch_page(url)
+        finally:
+            utils.disable_cache()
+
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_historical_page_never_expires(self, mock_get, tmpdir):
+        url = 'http://www.good_url.com/this/is/valid'
+        utils.enable_cache(str(tmpdir), ttl=-1)
+        try:
+            utils._fetch_page(url, historical=True)
+            utils._fetch_page(url, historical=True)
+        finally:
+            utils.disable_cache()
+
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=mock_revalidated_page)
+    def test_unchanged_page_is_revalidated_without_parsing(self, mock_get):
+        url = 'http://www.good_url.com/this/is/valid'
+        first = utils._pull_page(url)
+        second = utils._pull_page(url)
+
+        assert first is second
+        assert first.text() == 'This is good'
+        assert mock_get.call_count == 2
+        mock_get.assert_called_with(url, headers={
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Sat, 01 Jun 2019 00:00:00 GMT'
+        })
+
+    @patch('requests.Session.get', side_effect=mock_revalidated_page)
+    def test_expired_cached_page_is_revalidated(self, mock_get, tmpdir):
+        url = 'http://www.good_url.com/this/is/valid'
+        utils.enable_cache(str(tmpdir), ttl=-1)
+        try:
+            utils._fetch_page(url)
+            utils._revalidation_cache.clear()
+            body = utils._fetch_page(url)
+        finally:
+            utils.disable_cache()
+
+        assert body == '<p>This is good</p>'
+        assert mock_get.call_args[1]['headers']['If-None-Match'] == '"v1"'
+
+    @patch('requests.Session.get', side_effect=mock_revalidated_page)
+    def test_historical_page_is_not_revalidated(self, mock_get):
+        url = 'http://www.good_url.com/this/is/valid'
+        utils._fetch_page(url, historical=True)
+        utils._fetch_page(url, historical=True)
+
+        assert url not in utils._revalidation_cache
+        for call in mock_get.call_args_list:
+            assert 'headers' not in call[1]
+
+    @patch('time.sleep')
+    def test_throttled_request_waits_for_retry_after(self, mock_sleep):
+        url = 'http://www.good_url.com/this/is/valid'
+        flexmock(utils.requests.Session) \
+            .should_receive('get') \
+            .replace_with(MockThrottledPages(1, '3'))
+
+        body = utils._fetch_page(url)
+
+        assert body == 'This is good'
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args[0][0] == pytest.approx(3, abs=0.5)
+
+    @patch('time.sleep')
+    def test_throttled_request_raises_after_max_retries(self, mock_sleep):
+        url = 'http://www.good_url.com/this/is/valid'
+        flexmock(utils.requests.Session) \
+            .should_receive('get') \
+            .replace_with(MockThrottledPages(utils.MAX_RETRIES + 1))
+
+        with pytest.raises(HTTPError):
+            utils._fetch_page(url)
+        assert mock_sleep.call_count == utils.MAX_RETRIES
+
+    def test_retry_delay_grows_exponentially(self):
+        response = flexmock(headers={})
+
+        for attempt in range(3):
+            delay = utils._retry_delay(response, attempt)
+            full_delay = utils.RETRY_BASE_DELAY * 2 ** attempt
+
+            assert full_delay / 2 <= delay <= full_delay
+
+    @patch('time.sleep')
+    def test_rate_limiter_spaces_out_requests(self, mock_sleep):
+        limiter = utils._TokenBucket(rate=2, capacity=1)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert delays == [pytest.approx(0.5, abs=0.1),
+                          pytest.approx(1, abs=0.1)]
+
+    def test_new_boxscore_uris_skips_ingested_and_duplicate_games(self):
+        def game(uri, played=True):
+            return flexmock(_boxscore=uri,
+                            _dataframe_fields={} if played else None)
+
+        home = [game('game-1'), game('game-2'), game('game-3', False)]
+        away = [game('game-2'), game('game-4')]
+
+        uris = utils._new_boxscore_uris([home, away], {'game-1'})
+
+        assert uris == ['game-2', 'game-4']
+
+    def test_parsed_boxscore_is_shared_after_it_is_dropped(self):
+        parsed = []
+
+        class MockBoxscore:
+            def __init__(self, uri):
+                self._date = 'October 31, 2017'
+                parsed.append(uri)
+
+        utils._get_boxscore(MockBoxscore, '201710310LAL')
+        gc.collect()
+        utils._get_boxscore(MockBoxscore, '201710310LAL')
+
+        assert parsed == ['201710310LAL']
+
+    @patch.object(utils, 'BOXSCORE_CACHE_SIZE', 1)
+    def test_least_recently_used_boxscore_is_released(self):
+        class MockBoxscore:
+            def __init__(self, uri):
+                self._date = 'October 31, 2017'
+
+        first = utils._get_boxscore(MockBoxscore, '201710310LAL')
+        second = utils._get_boxscore(MockBoxscore, '201710310BOS')
 
-        i = 0
-        for element in result:
-            i += 1
+        assert utils._get_boxscore(MockBoxscore, '201710310LAL') is first
+        del first, second
+        gc.collect()
+        assert utils._registered_boxscores(MockBoxscore, ['201710310LAL'])
+        assert not utils._registered_boxscores(MockBoxscore,
+                                               ['201710310BOS'])
 
-        assert i == 2
+    def test_missing_boxscore_is_not_shared(self):
+        class MockBoxscore:
+            def __init__(self, uri):
+                self._date = None
 
-    @patch('requests.head', side_effect=mock_pyquery)
-    def test_valid_url_returns_true(self, *args, **kwargs):
-        response = utils._url_exists('http://www.good_url.com/this/is/valid')
+        first = utils._get_boxscore(MockBoxscore, '201710310LAL')
+        second = utils._get_boxscore(MockBoxscore, '201710310LAL')
 
-        assert response
+        assert first is not second
 
-    @patch('requests.head', side_effect=mock_pyquery)
-    def test_404_url_returns_false(self, *args, **kwargs):
-        response = utils._url_exists('http://www.404.com/doesnt/exist')
+    def test_boxscore_for_game_not_yet_final_is_not_shared(self):
+        class MockBoxscore:
+            def __init__(self, uri):
+                self._date = 'October 31, 2017'
 
-        assert not response
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(datetime(2017, 10, 31, 20))
+        first = utils._get_boxscore(MockBoxscore, '201710310LAL')
+        second = utils._get_boxscore(MockBoxscore, '201710310LAL')
+
+        assert first is not second
+
+    def test_deferred_field_error_is_raised_again(self):
+        def parse(name):
+            raise ValueError('Unexpected page layout')
+
+        lazy = MockLazy(parse)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                lazy._points
+        with pytest.raises(AttributeError):
+            lazy._missing
+
+    def test_deferred_field_is_parsed_once_across_threads(self):
+        parsed = []
+
+        def parse(name):
+            parsed.append(name)
+            time.sleep(0.01)
+            setattr(lazy, name, 10)
+
+        lazy = MockLazy(parse)
+        with ThreadPoolExecutor(4) as pool:
+            values = list(pool.map(lambda _: lazy._points, range(4)))
+
+        assert values == [10, 10, 10, 10]
+        assert parsed == ['_points']
+
+    def test_completed_game_is_found_from_uri(self):
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(datetime(2018, 1, 9, 12))
+
+        assert utils._is_completed_game('201710310LAL')
+        assert utils._is_completed_game('BOS/BOS201801080')
+        assert utils._is_completed_game('2018-01-08-21-purdue')
+        assert not utils._is_completed_game('2018-01-09-georgia')
+        assert not utils._is_completed_game('201801100nwe')
+        assert not utils._is_completed_game('no-date')
+
+    def test_least_recently_used_page_is_evicted(self, tmpdir):
+        cache = utils._PageCache(str(tmpdir), 10 ** 6, 60)
+        cache.set('http://a.com', 'a' * 100, historical=True)
+        cache.set('http://b.com', 'b' * 100, historical=True)
+        body_path, _ = cache._paths('http://a.com')
+        os.utime(body_path, (0, 0))
+        cache.max_size = cache._size - 1
+
+        cache.set('http://b.com', 'b' * 100, historical=True)
+
+        assert cache.get('http://a.com') is None
+        assert cache.get('http://b.com') == 'b' * 100
+
+    def test_expired_page_is_evicted_before_recently_used(self, tmpdir):
+        cache = utils._PageCache(str(tmpdir), 10 ** 6, -1)
+        cache.set('http://a.com', 'a' * 100, historical=True)
+        cache.set('http://b.com', 'b' * 100)
+        body_path, _ = cache._paths('http://a.com')
+        os.utime(body_path, (0, 0))
+        cache.max_size = cache._size - 1
+
+        cache._evict()
+
+        assert cache.get('http://a.com') == 'a' * 100
+        assert not os.path.exists(cache._paths('http://b.com')[0])
+
+    def test_is_past_season(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+
+        assert utils._is_past_season('nba', '2017')
+        assert not utils._is_past_season('nba', '2018')
+        assert not utils._is_past_season('nba', None)
+
+    def test_discarded_page_is_removed_from_cache(self, tmpdir):
+        utils.enable_cache(str(tmpdir))
+        try:
+            utils._page_cache.set('http://a.com', 'a', historical=True)
+            utils._discard_cached_page('http://a.com')
+            result = utils._page_cache.get('http://a.com')
+        finally:
+            utils.disable_cache()
+
+        assert result is None
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_fetch_pages_downloads_every_url(self, mock_get):
+        urls = ['http://www.good_url.com/1', 'http://www.404.com/2']
+
+        pages = utils._fetch_pages(urls, concurrency=2)
+
+        assert pages['http://www.good_url.com/1'] == 'This is good'
+        assert isinstance(pages['http://www.404.com/2'], HTTPError)
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_fetch_pages_works_inside_running_event_loop(self, mock_get):
+        urls = ['http://www.good_url.com/1', 'http://www.good_url.com/2']
+
+        async def fetch():
+            return utils._fetch_pages(urls, concurrency=2)
+
+        # asyncio.run is only available from Python 3.7.
+        loop = asyncio.new_event_loop()
+        try:
+            pages = loop.run_until_complete(fetch())
+        finally:
+            loop.close()
+
+        assert pages == {url: 'This is good' for url in urls}
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_iter_pages_yields_pages_in_order(self, mock_get):
+        urls = ['http://www.good_url.com/%s' % i for i in range(5)]
+        urls.insert(2, 'http://www.404.com/2')
+
+        pages = list(utils._iter_pages(urls, concurrency=2))
+
+        assert [url for url, _ in pages] == urls
+        assert isinstance(pages[2][1], HTTPError)
+        assert all(page == 'This is good' for url, page in pages
+                   if '404' not in url)
+        assert mock_get.call_count == 6
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_preloaded_pages_are_not_downloaded(self, mock_get):
+        url = 'http://www.good_url.com/1'
+        error = HTTPError(url, 404, 'Not Found', {}, None)
+
+        with utils._preloaded_pages({url: 'preloaded'}):
+            result = utils._fetch_page(url)
+        with utils._preloaded_pages({url: error}):
+            with pytest.raises(HTTPError):
+                utils._fetch_page(url)
+
+        assert result == 'preloaded'
+        assert utils._fetch_page(url) == 'This is good'
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_default_season_page_is_only_downloaded_once(self, mock_get):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2050)
+        url = 'http://www.good_url.com/%s'
+
+        year, pages = utils._find_default_season('nba',
+                                                 lambda year: url % year)
+        with utils._preloaded_pages(pages):
+            page = utils._fetch_page(url % year)
+
+        assert year == '2050'
+        assert pages == {url % year: 'This is good'}
+        assert page == 'This is good'
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_pull_pages_reuses_default_season_page(self, mock_get):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2050)
+        url = 'http://www.good_url.com/%s'
+
+        year, pages = utils._find_default_season('nba',
+                                                 lambda year: url % year)
+        with utils._preloaded_pages(pages):
+            docs = utils._pull_pages([url % year, url % 'stats'])
+
+        assert [doc.text() for doc in docs] == ['This is good'] * 2
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_pull_pages_raises_for_missing_page(self, mock_get):
+        urls = ['http://www.good_url.com/1', 'http://www.404.com/2']
+
+        with pytest.raises(HTTPError):
+            utils._pull_pages(urls)
 
-    @patch('requests.head', side_effect=mock_pyquery)
-    def test_invalid_url_exception_returns_false(self, *args, **kwargs):
-        response = utils._url_exists('http://www.exception.com')
+        assert mock_get.call_count == 2
 
-        assert not response
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_default_season_falls_back_to_previous_year(self, mock_get):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2051)
+
+        def url_for_year(year):
+            if str(year) == '2051':
+                return 'http://www.404.com/%s' % year
+            return 'http://www.good_url.com/%s' % year
+
+        first, first_pages = utils._find_default_season('nhl', url_for_year)
+        second, second_pages = utils._find_default_season('nhl',
+                                                          url_for_year)
+
+        assert first == second == '2050'
+        assert list(first_pages) == ['http://www.good_url.com/2050']
+        assert second_pages == {}
+        assert mock_get.call_count == 2
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_default_season_is_remembered_for_each_page(self, mock_get):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2051)
+
+        def new_team_url(year):
+            if str(year) == '2051':
+                return 'http://www.good_url.com/new/%s' % year
+            return 'http://www.404.com/new/%s' % year
+
+        def old_team_url(year):
+            if str(year) == '2051':
+                return 'http://www.404.com/old/%s' % year
+            return 'http://www.good_url.com/old/%s' % year
+
+        old_team, _ = utils._find_default_season('nhl', old_team_url)
+        new_team, _ = utils._find_default_season('nhl', new_team_url)
+
+        assert old_team == '2050'
+        assert new_team == '2051'
+
+    def test_stat_index_matches_pyquery_selectors(self):
+        html = pq("""<table>
+<tbody>
+<tr><th data-stat="player">A</th><td data-stat="pts">1</td>
+<td data-stat="pts">2</td></tr>
+<tr><th data-stat="player">B</th><td data-stat="pts">3</td></tr>
+</tbody>
+<tfoot><tr><td data-stat="pts">6</td></tr></tfoot>
+</table>""")
+        rows = html('tr')
+        selectors = ['td[data-stat="pts"]',
+                     'td[data-stat="pts"]:first',
+                     'th[data-stat="player"]:first',
+                     'tfoot td[data-stat="pts"]',
+                     'td[data-stat="missing"]',
+                     'tbody tr th']
+
+        for data in [html, rows]:
+            index = utils._StatIndex(data)
+            for selector in selectors:
+                expected = [i.text() for i in data(selector).items()]
+
+                assert index.texts(selector) == expected
+
+    def test_compiled_selectors_match_pyquery(self):
+        html = pq("""<div><table id="stats">
+<tbody>
+<tr><th data-stat="player"><a href="/a.html">A</a></th>
+<td data-stat="pts">1</td><td data-stat="pts">2</td></tr>
+<tr><th data-stat="player">B</th><td data-stat="pts">3</td></tr>
+</tbody>
+<tfoot><tr><td data-stat="pts">6</td></tr></tfoot>
+</table></div>""")
+        rows = html('tr')
+        selectors = ['td[data-stat="pts"]:first',
+                     'th[data-stat="player"] a',
+                     'tfoot td[data-stat="pts"]',
+                     'table#stats tbody tr:eq(1)',
+                     'td[data-stat="missing"]',
+                     'tbody tr']
+
+        for data in [html, rows]:
+            for selector in selectors:
+                expected = [str(i) for i in data(selector).items()]
+                result = [str(i) for i in
+                          utils._select(data, selector).items()]
+
+                assert result == expected
+        assert utils._compile_selector(selectors[0]) is \
+            utils._compile_selector(selectors[0])
+
+    def test_parse_field_accepts_stat_index(self):
+        html = pq('<tr><td data-stat="pts">1</td><td data-stat="pts">2</td>'
+                  '</tr>')
+        scheme = {'points': 'td[data-stat="pts"]'}
+        index = utils._StatIndex(html)
+
+        assert utils._parse_field(scheme, index, 'points') == '1'
+        assert utils._parse_field(scheme, index, 'points', 1) == '2'
+        assert utils._parse_field(scheme, index, 'points', 2) is None
+
+    def test_field_names_include_slots_and_dict(self):
+        class Base:
+            __slots__ = ()
+
+        class Slotted(Base):
+            __slots__ = ('_name', '_points')
+
+        class Unslotted(Base):
+            def __init__(self):
+                self._name = None
+
+        assert utils._field_names(Slotted()) == ['_name', '_points']
+        assert utils._field_names(Unslotted()) == ['_name']
+
+    def test_stat_column_returns_converted_values(self):
+        column = utils._StatColumn([12, None, 7], int)
+
+        assert len(column) == 3
+        assert column[0] == 12
+        assert type(column[0]) is int
+        assert column[1] is None
+        assert column[-1] == 7
+        assert column[3] is None
+        assert column[None] is None
+
+    def test_stat_column_fills_missing_values_for_dataframe(self):
+        column = utils._StatColumn([1.5, None, 2.0], float)
+        empty = utils._StatColumn([None, None], int)
+
+        assert column.take([0, 2]).tolist() == [1.5, 2.0]
+        assert str(column.take([1, 0]).tolist()) == '[nan, 1.5]'
+        assert empty.take([0, 1]).tolist() == [None, None]
+
+    def test_record_round_trips_html_and_errors(self):
+        rows = pq('<table><tr><td data-stat="pts">1</td></tr>'
+                  '<tr><td data-stat="pts">2</td></tr></table>')('tr')
+        error = HTTPError('http://www.404.com', 404, 'Not Found', {}, None)
+
+        record = utils._load_record(utils._dump_record({'rows': rows,
+                                                        'error': error}))
+
+        assert [row.text() for row in record['rows'].items()] == ['1', '2']
+        assert record['rows']('td[data-stat="pts"]').text() == '1 2'
+        assert isinstance(record['error'], HTTPError)
+        assert record['error'].code == 404